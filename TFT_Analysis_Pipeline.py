@@ -0,0 +1,156 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+from TFT_Champion_Item_Matrix import build_champion_item_matrix
+from TFT_Champion_Registry import load_champion_registry, normalize_champion_name
+from TFT_Item_Catalog import ITEM_COMPLETED, ITEM_DEFENSIVE, build_item_catalog
+from TFT_Item_CurrentVersion import classify_items, component_items, defensive_items
+from TFT_Item_Recipes import build_item_recipe_table
+from TFT_Match_Cache import load_match_arrays
+from TFT_Match_Query import build_match_query_index
+from TFT_Match_Validation import refresh_quarantine, validate_match_arrays
+from TFT_Name_Search import build_name_index
+from TFT_Pick_Rank_Index import build_pick_rank_index
+from TFT_Pipeline import Pipeline
+from TFT_Profiling import print_report, profiler_from_argv
+from TFT_Report_Writer import ReportTable
+from TFT_Survival_Analysis import champion_item_survival
+from TFT_Trait_Engine import compute_board_traits, load_trait_table
+
+# ----------------------------------------------------------------------------------------------------
+# TFT 분석 파이프라인 (불러오기 → 아이템 분류 → 매치 파싱 → 집계 → 요약 표)
+#    - 문제 정의: 세 스크립트가 같은 단계를 복사해서 쓰고, 요약 행(방템 비율) 만드는 코드도 챔피언마다 따로 있습니다.
+#    - 해결 목표: TFT_Pipeline 위에 단계들을 한 번만 선언합니다.
+#                 · 아이템: item_raw_file → df_item(component_items, defensive_items 로 분류) → item_catalog → item_recipes (재료 벡터)
+#                 · 매치:   match_file → match_arrays(TFT_Match_Cache) → pick_rank_index / champion_item_matrix / survival_curves
+#                           / match_query_index (챔피언·아이템·별·게임 시간 질의)
+#                 · 특성:   champion_info_file → trait_table (특성 비트마스크) → board_traits (게임별 활성 시너지, match_arrays 필요)
+#                 · 검증:   match_arrays, item_catalog → match_validation (check_match_data 가 요약 출력 + 격리 파일, 모든 분석 스크립트가 부름)
+#                 · 요약:   target_champion, top_n → top_items_report (순위/아이템 이름/장착 횟수/방템 여부 표 + 방템 비율 요약, ReportTable)
+#                 defensive_items 를 바꾸면 df_item 이후만, target_champion 을 바꾸면 top_items_report 만 다시 계산됩니다.
+# ----------------------------------------------------------------------------------------------------
+
+REPORT_COLUMNS = ['순위', '아이템 이름', '장착 횟수', '방어 아이템 여부']
+SUMMARY_COLUMNS = ('구분', '비율(%)', '개수')
+
+
+def top_items_report(top_item_counts: pd.Series, item_catalog, champion_label: str) -> ReportTable:
+    """
+    아이템 ID별 장착 횟수 TOP-N (index: 아이템 ID) → 순위 표 + '[최종 통찰]' 방템/비방템 요약.
+    표의 '순위', '장착 횟수' 는 정수 그대로이고, 요약은 표에 붙이지 않고 따로 담습니다 (TFT_Report_Writer 가 꼬리 블록/시트로 씀).
+    장착 기록이 없어 표가 비면 비율 행 없이 '기록 없음' 제목만 둡니다 (0개 중 비방템 100% 같은 값을 만들지 않음).
+    """
+    item_ids = top_item_counts.index.to_numpy()
+    df_items = pd.DataFrame({
+        '순위': np.arange(1, len(top_item_counts) + 1),
+        '아이템 이름': item_catalog.names_of(item_ids),
+        '장착 횟수': top_item_counts.to_numpy(),
+        '방어 아이템 여부': np.where(item_catalog.mask(item_ids, ITEM_DEFENSIVE), '방템', '비방템'),
+    }, columns=REPORT_COLUMNS)
+
+    total = len(df_items)
+    if not total:
+        return ReportTable(name=champion_label, frame=df_items,
+                           summary_title=f"[최종 통찰] {champion_label}의 완성 아이템 장착 기록이 없습니다.")
+    defense_count = int((df_items['방어 아이템 여부'] == '방템').sum())
+    defense_ratio = defense_count / total * 100
+    return ReportTable(
+        name=champion_label, frame=df_items,
+        summary_title=f"[최종 통찰] {champion_label}가 가장 많이 장착한 상위 {total}개 아이템 중:",
+        summary_columns=SUMMARY_COLUMNS,
+        summary=[('방어 아이템', round(defense_ratio, 2), defense_count),
+                 ('비방어 아이템', round(100 - defense_ratio, 2), total - defense_count)],
+    )
+
+
+# --- 단계 함수 (입력 이름 순서대로 값을 받음) ---
+def _champion_top_items(champion_item_matrix, target_champion, top_n):
+    return champion_item_matrix.top_items(target_champion, n=top_n, required_bits=ITEM_COMPLETED)
+
+
+def _champion_report(champion_top_items, item_catalog, target_champion):
+    return top_items_report(champion_top_items, item_catalog, normalize_champion_name(target_champion))
+
+
+def _pick_rank_index(champion_registry, match_arrays):
+    names = np.asarray(match_arrays.champion_names, dtype=object)[np.asarray(match_arrays.board_champion)]
+    return build_pick_rank_index(champion_registry, names)
+
+
+def _name_index(df_item_raw, champion_info_file):
+    return build_name_index(df_item_raw, pd.read_csv(champion_info_file))
+
+
+def check_match_data(pipeline: Pipeline):
+    """
+    파이프라인의 match_validation 단계를 돌려 데이터 품질 요약(ValidationReport.to_dict())을 출력하고,
+    거부된 행이 있으면 격리 파일(<매치 CSV>.quarantine.csv)을 씁니다 (원본 / 아이템 CSV 가 바뀌었을 때만 다시 씀).
+    vi / Blitzcrank 분석과 배치 리포트가 데이터를 불러올 때마다 부릅니다.
+    Returns:
+        ValidationReport
+    """
+    report = pipeline.get('match_validation')
+    summary = report.to_dict()
+    print(f"✅ 매치 데이터 검증: {summary['rows']}행 중 거부 {summary['rejected']}행"
+          + (f" ({', '.join(f'{reason} {rows}' for reason, rows in summary['reasons'].items())})" if summary['reasons'] else ''))
+    quarantine_path = refresh_quarantine(pipeline.params['match_file'], report, [pipeline.params['item_raw_file']])
+    if quarantine_path:
+        print(f"    - 거부된 행은 '{quarantine_path}' 에 사유와 함께 있습니다. (분석에는 모든 행이 그대로 쓰임)")
+    return report
+
+
+def build_analysis_pipeline(file_path_match: str = 'TFT_Challenger_MatchData.csv',
+                            file_path_item_raw: str = 'TFT_Item_CurrentVersion.csv',
+                            file_path_champion_info: str = 'TFT_Champion_CurrentVersion.csv',
+                            target_champion: str = 'VI', top_n: int = 10, cache_dir: str = None) -> Pipeline:
+    """
+    TFT 분석 파이프라인을 만듭니다. 단계는 get() 으로 요청할 때만 계산됩니다.
+    주요 단계: df_item, item_catalog, item_recipes, match_arrays, match_validation, champion_registry, pick_rank_index,
+               champion_item_matrix, survival_curves, match_query_index, name_index, trait_table, board_traits,
+               champion_top_items, champion_report
+    """
+    pipeline = Pipeline(cache_dir=cache_dir)
+    pipeline.set_file('match_file', file_path_match)
+    pipeline.set_file('item_raw_file', file_path_item_raw)
+    pipeline.set_file('champion_info_file', file_path_champion_info)
+    pipeline.set_param('component_items', list(component_items))
+    pipeline.set_param('defensive_items', list(defensive_items))
+    pipeline.set_param('target_champion', target_champion)
+    pipeline.set_param('top_n', top_n)
+
+    pipeline.add_stage('df_item_raw', pd.read_csv, ['item_raw_file'])
+    pipeline.add_stage('df_item', classify_items, ['df_item_raw', 'component_items', 'defensive_items'], persist=True)
+    pipeline.add_stage('item_catalog', build_item_catalog, ['df_item'])
+    pipeline.add_stage('item_recipes', build_item_recipe_table, ['item_catalog'])
+    pipeline.add_stage('match_arrays', load_match_arrays, ['match_file']) # 파싱 결과는 TFT_Match_Cache 가 디스크에 캐시
+    pipeline.add_stage('match_validation', validate_match_arrays, ['match_arrays', 'item_catalog'])
+    pipeline.add_stage('champion_registry', load_champion_registry, ['champion_info_file'])
+    pipeline.add_stage('pick_rank_index', _pick_rank_index, ['champion_registry', 'match_arrays'])
+    pipeline.add_stage('champion_item_matrix', build_champion_item_matrix, ['match_arrays', 'item_catalog'], persist=True)
+    pipeline.add_stage('survival_curves', champion_item_survival, ['match_arrays', 'item_catalog'], persist=True)
+    pipeline.add_stage('match_query_index', build_match_query_index, ['match_arrays', 'item_catalog'])
+    pipeline.add_stage('name_index', _name_index, ['df_item_raw', 'champion_info_file'])
+    pipeline.add_stage('trait_table', load_trait_table, ['champion_info_file'])
+    pipeline.add_stage('board_traits', compute_board_traits, ['match_arrays', 'trait_table'])
+    pipeline.add_stage('champion_top_items', _champion_top_items, ['champion_item_matrix', 'target_champion', 'top_n'])
+    pipeline.add_stage('champion_report', _champion_report, ['champion_top_items', 'item_catalog', 'target_champion'])
+    return pipeline
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Analysis_Pipeline.py VI BLITZCRANK --profile-json profile.json --cprofile profile.pstats
+    profiler = profiler_from_argv()
+    option_values = {profiler.json_path, profiler.cprofile_path}
+    champion_names = [arg for arg in sys.argv[1:] if not arg.startswith('--') and arg not in option_values]
+
+    pipeline = build_analysis_pipeline(cache_dir='TFT_Pipeline.cache')
+    pipeline.profiler = profiler
+    check_match_data(pipeline)
+    for champion_name in champion_names or ['VI']:
+        pipeline.set_param('target_champion', champion_name)
+        report = pipeline.get('champion_report')
+        print(f"\n--- {normalize_champion_name(champion_name)} 완성 아이템 TOP {pipeline.params['top_n']} (다시 계산한 단계: {', '.join(pipeline.last_computed)}) ---")
+        print(report.to_text())
+    print_report(profiler.finish())
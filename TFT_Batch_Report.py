@@ -0,0 +1,140 @@
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from TFT_Analysis_Pipeline import build_analysis_pipeline, check_match_data, top_items_report
+from TFT_Champion_Registry import KOREAN_CHAMPION_ALIASES, normalize_champion_names
+from TFT_Item_Catalog import ITEM_COMPLETED
+from TFT_Report_Writer import write_report_csv, write_report_xlsx
+
+# ----------------------------------------------------------------------------------------------------
+# 모든 챔피언의 TOP-N 아이템 요약 CSV 를 한 번에 만들기 (배치 리포트)
+#    - 문제 정의: 'vi projcet.py', 'Blitzcrank projcet.py' 는 챔피언 하나마다 스크립트 전체를 돌려서
+#                 'vi_top10_items_with_summary.csv' 같은 파일 하나를 씁니다. 챔피언 60명이면 60번 실행입니다.
+#    - 해결 목표: 파이프라인의 champion_item_matrix (챔피언 × 아이템 장착 횟수) 하나에서 모든 챔피언의 표를 만들고,
+#                 파일 쓰기는 asyncio + 스레드 풀로 동시에 합니다. (동시에 쓰는 파일 수는 max_workers 로 제한)
+#                 CSV 쓰기는 대부분 파일 I/O 라서 스레드로 겹쳐 쓰면 전체 시간이 파일 수만큼 늘지 않습니다.
+#                 --xlsx 를 주면 모든 챔피언의 표를 시트별로 담은 통합 문서도 씁니다 (TFT_Report_Writer, write-only 모드).
+# ----------------------------------------------------------------------------------------------------
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def report_file_name(champion_key: str, top_n: int = 10) -> str:
+    """'VI' → 'vi_top10_items_with_summary.csv' (기존 스크립트가 쓰던 이름 형식)"""
+    return f"{champion_key.lower()}_top{top_n}_items_with_summary.csv"
+
+
+def champion_label(champion_key: str) -> str:
+    """요약 행에 쓸 이름: 한글 이름이 있으면 한글('BLITZCRANK' → '블리츠크랭크'), 없으면 키 그대로."""
+    for alias, key in KOREAN_CHAMPION_ALIASES.items():
+        if key == champion_key:
+            return alias
+    return champion_key
+
+
+def iter_champion_reports(champion_item_matrix, item_catalog, champion_keys, top_n: int = 10):
+    """
+    챔피언마다 top_items_report 표(ReportTable)를 하나씩 만들어 (챔피언 키, 표) 로 내보냅니다.
+    모두 같은 행렬에서 읽으므로 매치 데이터는 다시 보지 않습니다. 완성 아이템 장착 기록이 없는 챔피언은 건너뜁니다.
+    """
+    for champion_key in champion_keys:
+        top_item_counts = champion_item_matrix.top_items(champion_key, n=top_n, required_bits=ITEM_COMPLETED)
+        if not top_item_counts.empty:
+            yield champion_key, top_items_report(top_item_counts, item_catalog, champion_label(champion_key))
+
+
+def build_champion_reports(champion_item_matrix, item_catalog, champion_keys, top_n: int = 10) -> dict:
+    """챔피언 키 → 요약 ReportTable dict (iter_champion_reports 를 모음)."""
+    return dict(iter_champion_reports(champion_item_matrix, item_catalog, champion_keys, top_n))
+
+
+def write_reports_xlsx(champion_item_matrix, item_catalog, champion_keys, file_path: str, top_n: int = 10) -> str:
+    """
+    모든 챔피언의 표를 시트별로, 요약은 'Summary' 시트에 모은 xlsx 하나로 씁니다.
+    표를 제너레이터로 하나씩 만들어 바로 흘려 쓰므로 챔피언 수와 상관없이 메모리에는 표 하나만 있습니다.
+    """
+    reports = iter_champion_reports(champion_item_matrix, item_catalog, champion_keys, top_n)
+    return write_report_xlsx((report for _, report in reports), file_path)
+
+
+async def write_reports_async(reports: dict, output_dir: str = '.', top_n: int = 10,
+                              max_workers: int = DEFAULT_MAX_WORKERS) -> list:
+    """
+    요약 표(ReportTable)들을 스레드 풀에서 동시에 CSV 로 씁니다 (각 파일은 임시 파일에 쓴 뒤 교체). 세마포어로 동시에 열린 파일 수를 max_workers 로 제한합니다.
+    Returns:
+        list: 쓴 파일 경로 (reports 순서)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        async def write_one(champion_key, report):
+            async with semaphore:
+                file_path = os.path.join(output_dir, report_file_name(champion_key, top_n))
+                return await loop.run_in_executor(executor, write_report_csv, report, file_path)
+
+        return await asyncio.gather(*(write_one(key, report) for key, report in reports.items()))
+
+
+def run_batch_report(pipeline, champion_keys=None, output_dir: str = '.', max_workers: int = DEFAULT_MAX_WORKERS,
+                     xlsx_path: str = None) -> pd.DataFrame:
+    """
+    파이프라인에서 행렬을 한 번 가져와서 모든 챔피언의 요약 CSV 를 씁니다. 먼저 매치 데이터 검증 요약을 출력하고 격리 파일을 씁니다 (check_match_data).
+    Args:
+        champion_keys: 챔피언 이름들. None 이면 챔피언 정보 파일(TFT_Champion_CurrentVersion.csv)의 모든 챔피언.
+        xlsx_path (str): 주면 모든 챔피언의 표를 시트별로 담은 xlsx 도 씁니다.
+    Returns:
+        pd.DataFrame: 챔피언별 (champion, file, items, defensive_pct) 요약. CSV 에 쓴 표와 같은 값입니다
+                      (items: 표의 완성 아이템 수, defensive_pct: 요약의 방어 아이템 비율(%)). 장착 기록이 없어 건너뛴 챔피언은 file, defensive_pct 가 NaN.
+    """
+    champion_item_matrix, item_catalog = pipeline.get('champion_item_matrix', 'item_catalog')
+    check_match_data(pipeline)
+    if champion_keys is None:
+        champion_keys = pd.read_csv(pipeline.params['champion_info_file'])['name']
+    champion_keys = list(dict.fromkeys(normalize_champion_names(champion_keys)))
+    top_n = pipeline.params['top_n']
+
+    reports = build_champion_reports(champion_item_matrix, item_catalog, champion_keys, top_n)
+    file_paths = dict(zip(reports, asyncio.run(write_reports_async(reports, output_dir, top_n, max_workers))))
+    if xlsx_path:
+        write_reports_xlsx(champion_item_matrix, item_catalog, champion_keys, xlsx_path, top_n)
+    # 요약 값은 방금 쓴 표(ReportTable)에서 그대로 가져옴: 표의 행 수, 요약 꼬리 블록의 '방어 아이템' 비율(%)
+    return pd.DataFrame({
+        'champion': champion_keys,
+        'file': [file_paths.get(key, np.nan) for key in champion_keys],
+        'items': [len(reports[key].frame) if key in reports else 0 for key in champion_keys],
+        'defensive_pct': [reports[key].summary[0][1] if key in reports and reports[key].summary else np.nan for key in champion_keys],
+    })
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Batch_Report.py reports --top 10 --workers 8 --xlsx TFT_All_Champions.xlsx
+    #         python TFT_Batch_Report.py reports VI BLITZCRANK
+    args = sys.argv[1:]
+    top_n = int(args[args.index('--top') + 1]) if '--top' in args else 10
+    max_workers = int(args[args.index('--workers') + 1]) if '--workers' in args else DEFAULT_MAX_WORKERS
+    xlsx_path = args[args.index('--xlsx') + 1] if '--xlsx' in args else None
+    option_values = {args[position + 1] for position, arg in enumerate(args[:-1]) if arg in ('--top', '--workers', '--xlsx')}
+    positional = [arg for arg in args if not arg.startswith('--') and arg not in option_values]
+    output_dir = positional[0] if positional else 'TFT_Reports'
+
+    started = time.perf_counter()
+    pipeline = build_analysis_pipeline(top_n=top_n, cache_dir='TFT_Pipeline.cache')
+    df_summary = run_batch_report(pipeline, positional[1:] or None, output_dir, max_workers, xlsx_path)
+    elapsed = time.perf_counter() - started
+
+    print(df_summary.to_string(index=False))
+    written = int(df_summary['file'].notna().sum())
+    print(f"\n✅ 챔피언 {written}명의 요약 CSV 를 '{output_dir}' 에 썼습니다. ({elapsed:.2f}초, 동시 쓰기 {max_workers}개)")
+    if xlsx_path:
+        print(f"    - 모든 챔피언의 표를 시트별로 담은 '{xlsx_path}' 도 썼습니다.")
+    skipped = df_summary.loc[df_summary['file'].isna(), 'champion'].tolist()
+    if skipped:
+        print(f"    - 완성 아이템 장착 기록이 없어 건너뜀: {', '.join(skipped)}")
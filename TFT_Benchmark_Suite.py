@@ -0,0 +1,190 @@
+import json
+import os
+import subprocess
+import sys
+
+import pandas as pd
+
+from TFT_Champion_Item_Matrix import build_champion_item_matrix
+from TFT_Champion_Registry import load_champion_registry
+from TFT_Item_Catalog import ITEM_COMPLETED, load_item_catalog
+from TFT_Match_Cache import build_match_arrays
+from TFT_Profiling import Profiler, peak_rss_mb
+from TFT_Survival_Analysis import champion_item_survival
+from TFT_Synthetic_MatchData import load_synthetic_sources, write_synthetic_match_csv
+
+# ----------------------------------------------------------------------------------------------------
+# 크기별 벤치마크 (가상 매치 데이터 1만 ~ 1000만 게임)
+#    - 문제 정의: TFT_Match_Parser_Benchmark 는 메모리 안의 2만 행으로 파싱 한 단계만 잽니다.
+#                 read_csv, 필터, 아이템 집계, 병합이 행 수에 따라 어떻게 늘어나는지, 메모리가 어디서 터지는지 알 수 없습니다.
+#    - 해결 목표: 크기마다 TFT_Synthetic_MatchData 로 CSV 를 만들고(한 번 만든 파일은 재사용),
+#                 별도 프로세스에서 'vi projcet.py' 와 같은 순서의 단계를 TFT_Profiling.Profiler 로 잽니다.
+#                 · read_csv → parse(build_match_arrays) → board_frame → filter(VI 보드 + 완성 아이템)
+#                   → item_aggregation(champion_item_matrix) → merge_match(pd.merge on gameId)
+#                   → merge_champion_info(registry.stats_of) → survival
+#                 크기마다 프로세스를 새로 띄우므로 최대 RSS 는 그 크기만의 값입니다.
+#                 결과(단계별 시간, 게임/초, 최대 RSS)는 JSON 으로 저장하고, --baseline 으로 예전 결과를 주면
+#                 REGRESSION_RATIO 배 이상 느려졌거나 메모리가 늘어난 단계를 표시합니다.
+#    - 사용법: python TFT_Benchmark_Suite.py 10k 100k 1M --output bench_results.json --baseline bench_baseline.json
+# ----------------------------------------------------------------------------------------------------
+
+DEFAULT_SIZES = [10_000, 100_000]
+DATA_DIR = 'TFT_Benchmark.cache' # 생성한 가상 CSV 보관 폴더 (.gitignore 의 *.cache/)
+TARGET_CHAMPION_NAME = 'VI'
+REGRESSION_RATIO = 1.2           # 예전 결과보다 20% 이상 느리거나 무거우면 회귀로 표시
+MIN_COMPARED_SECONDS = 0.05      # 이보다 짧은 단계는 측정 잡음이 커서 비교하지 않음
+RUN_ONE_FLAG = '--run-one'
+
+
+def parse_size(text: str) -> int:
+    """'10k', '1M', '10000' → 정수 게임 수."""
+    multipliers = {'k': 1_000, 'm': 1_000_000}
+    text = text.strip().lower().replace('_', '')
+    if text and text[-1] in multipliers:
+        return int(float(text[:-1]) * multipliers[text[-1]])
+    return int(text)
+
+
+def synthetic_file_path(n_games: int, seed: int = 42, data_dir: str = DATA_DIR) -> str:
+    """크기별 가상 CSV 경로 (없으면 만듦)."""
+    file_path = os.path.join(data_dir, f'synthetic_{n_games}_seed{seed}.csv')
+    if not os.path.exists(file_path):
+        os.makedirs(data_dir, exist_ok=True)
+        champion_names, item_ids = load_synthetic_sources()
+        write_synthetic_match_csv(file_path + '.tmp', n_games, seed=seed, champion_names=champion_names, item_ids=item_ids)
+        os.replace(file_path + '.tmp', file_path)
+    return file_path
+
+
+def run_stages(file_path_match: str, target_champion: str = TARGET_CHAMPION_NAME) -> dict:
+    """
+    한 파일에 대해 분석 단계를 순서대로 실행하고 측정 결과를 반환합니다. (이 프로세스 안에서 실행)
+    Returns:
+        dict: {'games', 'file_mb', 'peak_rss_mb', 'stages': [{name, wall_seconds, cpu_seconds, rows_in, rows_out,
+               peak_rss_mb, games_per_second}, ...]}
+    """
+    item_catalog = load_item_catalog()
+    champion_registry = load_champion_registry()
+    profiler = Profiler()
+
+    with profiler.stage('read_csv') as record:
+        df_match = pd.read_csv(file_path_match)
+        record.rows_out = len(df_match)
+    with profiler.stage('parse', rows_in=len(df_match)) as record:
+        match_arrays = build_match_arrays(df_match)
+        record.rows_out = len(match_arrays.board_game)
+    with profiler.stage('board_frame', rows_in=len(match_arrays.board_game)) as record:
+        df_board = match_arrays.board_frame()
+        record.rows_out = len(df_board)
+    with profiler.stage('filter', rows_in=len(df_board)) as record:
+        champion_codes = champion_registry.encode(df_board['champion'])
+        target_mask = champion_codes == champion_registry.code_of_key[target_champion]
+        df_target = df_board[target_mask]
+        target_items = df_target['item_ids'].explode().dropna().astype(int).to_numpy()
+        completed_items = target_items[item_catalog.mask(target_items, ITEM_COMPLETED)]
+        record.rows_out = len(df_target)
+    with profiler.stage('item_aggregation', rows_in=len(match_arrays.item_ids)) as record:
+        champion_item_matrix = build_champion_item_matrix(match_arrays, item_catalog)
+        record.rows_out = len(champion_item_matrix.champion_keys)
+    with profiler.stage('merge_match', rows_in=len(df_target)) as record:
+        df_merged = pd.merge(df_target[['gameId', 'champion']], df_match[['gameId', 'ingameDuration']], on='gameId', how='left')
+        record.rows_out = len(df_merged)
+    with profiler.stage('merge_champion_info', rows_in=len(df_merged)) as record:
+        df_final = pd.concat([df_merged.reset_index(drop=True), champion_registry.stats_of(champion_codes[target_mask])], axis=1)
+        record.rows_out = len(df_final)
+    with profiler.stage('survival', rows_in=len(match_arrays.board_game)) as record:
+        survival_curves = champion_item_survival(match_arrays, item_catalog)
+        record.rows_out = len(survival_curves.groups)
+
+    report = profiler.report()
+    n_games = len(df_match)
+    for stage in report['stages']:
+        stage['games_per_second'] = n_games / stage['wall_seconds'] if stage['wall_seconds'] > 0 else None
+    return {
+        'games': n_games,
+        'file_mb': os.path.getsize(file_path_match) / (1024 * 1024),
+        'completed_items_checked': int(len(completed_items)),
+        'peak_rss_mb': peak_rss_mb(),
+        'total_wall_seconds': sum(stage['wall_seconds'] for stage in report['stages']),
+        'stages': report['stages'],
+    }
+
+
+def run_size(n_games: int, seed: int = 42) -> dict:
+    """크기 하나를 새 파이썬 프로세스에서 측정합니다 (최대 RSS 가 앞 크기의 영향을 받지 않도록)."""
+    file_path_match = synthetic_file_path(n_games, seed=seed)
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), RUN_ONE_FLAG, file_path_match],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def find_regressions(results: dict, baseline: dict, ratio: float = REGRESSION_RATIO) -> list:
+    """
+    예전 결과(baseline) 와 비교해서 느려지거나 무거워진 (크기, 단계, 지표, 예전 값, 지금 값) 목록.
+    두 결과 모두에 있는 크기/단계만 비교합니다.
+    """
+    regressions = []
+    for size, result in results['sizes'].items():
+        baseline_result = baseline.get('sizes', {}).get(size)
+        if baseline_result is None:
+            continue
+        baseline_stages = {stage['name']: stage for stage in baseline_result['stages']}
+        for stage in result['stages']:
+            baseline_stage = baseline_stages.get(stage['name'])
+            if baseline_stage is None or baseline_stage['wall_seconds'] < MIN_COMPARED_SECONDS:
+                continue
+            if stage['wall_seconds'] > baseline_stage['wall_seconds'] * ratio:
+                regressions.append((size, stage['name'], 'wall_seconds', baseline_stage['wall_seconds'], stage['wall_seconds']))
+        if result['peak_rss_mb'] and baseline_result.get('peak_rss_mb') and result['peak_rss_mb'] > baseline_result['peak_rss_mb'] * ratio:
+            regressions.append((size, '(전체)', 'peak_rss_mb', baseline_result['peak_rss_mb'], result['peak_rss_mb']))
+    return regressions
+
+
+def print_results(results: dict) -> None:
+    """크기 × 단계 표로 출력합니다."""
+    for size, result in results['sizes'].items():
+        print(f"\n--- {int(size):,}게임 ({result['file_mb']:.1f}MB, 전체 {result['total_wall_seconds']:.2f}s, 최대 RSS {result['peak_rss_mb']:.1f}MB) ---")
+        print(f"{'단계':<20} | {'wall(s)':>8} | {'게임/초':>12} | {'입력 행':>10} | {'출력 행':>10} | {'RSS(MB)':>8}")
+        for stage in result['stages']:
+            rows_in = '' if stage['rows_in'] is None else stage['rows_in']
+            rows_out = '' if stage['rows_out'] is None else stage['rows_out']
+            throughput = '' if stage['games_per_second'] is None else f"{stage['games_per_second']:,.0f}"
+            print(f"{stage['name']:<20} | {stage['wall_seconds']:>8.3f} | {throughput:>12} | {rows_in:>10} | {rows_out:>10} | {stage['peak_rss_mb']:>8.1f}")
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Benchmark_Suite.py 10k 100k 1M 10M --output bench_results.json --baseline bench_baseline.json
+    if len(sys.argv) > 2 and sys.argv[1] == RUN_ONE_FLAG: # 크기 하나를 측정하는 자식 프로세스
+        print(json.dumps(run_stages(sys.argv[2])))
+        sys.exit(0)
+
+    args = sys.argv[1:]
+    option_values = {}
+    for flag in ('--output', '--baseline', '--seed'):
+        if flag in args and args.index(flag) + 1 < len(args):
+            option_values[flag] = args[args.index(flag) + 1]
+    sizes = [parse_size(arg) for arg in args if not arg.startswith('--') and arg not in option_values.values()] or DEFAULT_SIZES
+    seed = int(option_values.get('--seed', 42))
+
+    results = {'seed': seed, 'python': sys.version.split()[0], 'pandas': pd.__version__, 'sizes': {}}
+    for n_games in sizes:
+        print(f"⏱️ {n_games:,}게임 측정 중...")
+        results['sizes'][str(n_games)] = run_size(n_games, seed=seed)
+    print_results(results)
+
+    output_path = option_values.get('--output', 'bench_results.json')
+    with open(output_path, 'w', encoding='utf-8') as output_file:
+        json.dump(results, output_file, ensure_ascii=False, indent=2)
+    print(f"\n✅ 결과 저장: '{output_path}'")
+
+    if '--baseline' in option_values:
+        with open(option_values['--baseline'], encoding='utf-8') as baseline_file:
+            regressions = find_regressions(results, json.load(baseline_file))
+        if regressions:
+            print(f"\n❌ 회귀 {len(regressions)}건 (기준: {REGRESSION_RATIO}배)")
+            for size, stage_name, metric, before, after in regressions:
+                print(f"  - {int(size):,}게임 {stage_name} {metric}: {before:.3f} → {after:.3f}")
+            sys.exit(1)
+        print("\n✅ 예전 결과 대비 회귀 없음")
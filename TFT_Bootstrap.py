@@ -0,0 +1,185 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from TFT_Champion_Registry import normalize_champion_name, normalize_champion_names
+from TFT_Item_Catalog import ITEM_COMPLETED, ItemCatalog, load_item_catalog
+from TFT_Match_Cache import MatchArrays, load_match_arrays
+from TFT_Survival_Analysis import DEFENSIVE_ITEM_BITS, board_item_counts
+
+# ----------------------------------------------------------------------------------------------------
+# 챔피언별 부트스트랩 신뢰구간 (아이템 장착률, 방템 비율, ingameDuration 중앙값)
+#    - 문제 정의: '[최종 통찰]' 방템 비율과 TOP-N 장착 횟수는 점 추정값 하나뿐이라, 표본이 적은 챔피언의 차이가
+#                 우연인지 알 수 없습니다. 재표본을 파이썬 반복문으로 만들면 1만 번 × 보드 수만큼 돌아야 합니다.
+#    - 해결 목표: 챔피언의 보드를 복원 추출한 결과를 '보드별 뽑힌 횟수' 행렬로 나타냅니다.
+#                 · 인덱스 행렬(재표본 수 × 보드 수)을 rng.integers 로 한 번에 뽑고, 행 오프셋을 더한 np.bincount 로 횟수 행렬로 바꿈
+#                 · 합계 통계는 횟수 행렬 @ 보드 특징 행렬 (완성 아이템 수, 방템 수, 아이템별 장착 여부) 행렬곱 한 번
+#                 · 중앙값은 보드를 게임 시간 순으로 미리 정렬해 두고, 횟수의 누적합에서 가운데 위치를 찾음
+#                 재표본은 BATCH_CELLS 칸 단위로 나눠 메모리를 일정하게 하고, n_workers 를 주면 프로세스 풀에 나눠 보냅니다.
+#    - 재표본 단위는 그 챔피언이 등장한 보드입니다 (보드 수는 원래 표본과 같게 고정).
+# ----------------------------------------------------------------------------------------------------
+
+DEFAULT_RESAMPLES = 10000
+DEFAULT_CONFIDENCE = 0.95
+BATCH_CELLS = 4_000_000 # 한 번에 만드는 (재표본 × 보드) 칸 수
+
+
+def champion_board_features(match_arrays: MatchArrays, item_catalog: ItemCatalog, champion_name: str) -> tuple:
+    """
+    챔피언 보드들의 특징 행렬과 게임 시간 (게임 시간 오름차순으로 정렬).
+    Returns:
+        tuple: (features (보드 수 × (2 + 완성 아이템 수) float64: 완성 아이템 수, 방템 수, 아이템별 장착 여부),
+                durations (보드 수, NaN 인 게임은 제외), item_ids (장착 여부 열의 아이템 ID))
+    """
+    champion_keys = normalize_champion_names(np.asarray(match_arrays.champion_names, dtype=object))
+    wanted_codes = np.flatnonzero(champion_keys == normalize_champion_name(champion_name))
+    board_champion = np.asarray(match_arrays.board_champion)
+    boards = np.flatnonzero(np.isin(board_champion, wanted_codes))
+
+    durations = np.asarray(match_arrays.durations)[np.asarray(match_arrays.board_game)[boards]]
+    boards, durations = boards[~np.isnan(durations)], durations[~np.isnan(durations)]
+    order = np.argsort(durations, kind='stable')
+    boards, durations = boards[order], durations[order]
+
+    completed_codes = np.flatnonzero(item_catalog.is_completed[:-1])
+    item_ids = item_catalog.ids[completed_codes]
+    column_of_code = np.full(len(item_catalog.ids) + 1, -1, dtype=np.int64)
+    column_of_code[completed_codes] = np.arange(len(completed_codes))
+
+    # 챔피언 보드의 슬롯만 골라서 (보드 위치, 아이템 열) 로 장착 여부 표시
+    item_offsets = np.asarray(match_arrays.item_offsets)
+    slot_counts = item_offsets[boards + 1] - item_offsets[boards]
+    slot_rows = np.repeat(np.arange(len(boards)), slot_counts)
+    slot_positions = np.repeat(item_offsets[boards] - np.cumsum(np.concatenate([[0], slot_counts[:-1]])), slot_counts) + np.arange(slot_counts.sum())
+    slot_columns = column_of_code[item_catalog.encode(np.asarray(match_arrays.item_ids)[slot_positions])]
+    has_item = np.zeros((len(boards), len(item_ids)), dtype=np.float64)
+    has_item[slot_rows[slot_columns >= 0], slot_columns[slot_columns >= 0]] = 1.0
+
+    completed = board_item_counts(match_arrays, item_catalog, ITEM_COMPLETED)[boards]
+    defensive = board_item_counts(match_arrays, item_catalog, DEFENSIVE_ITEM_BITS)[boards]
+    features = np.column_stack([completed, defensive, has_item]).astype(np.float64)
+    return features, durations, item_ids
+
+
+def _median_from_counts(counts: np.ndarray, sorted_durations: np.ndarray) -> np.ndarray:
+    # 정렬된 값에 대한 횟수 행렬 → 행별 중앙값 (짝수 개면 가운데 두 값의 평균, np.median 과 같음)
+    n = int(counts[0].sum())
+    cumulative = np.cumsum(counts, axis=1)
+    # 행마다 누적합이 (n+1)//2, n//2 + 1 에 처음 닿는 위치 = 가운데 값(들)의 위치 (묶음 전체를 배열 연산 한 번으로)
+    lower = (cumulative >= (n + 1) // 2).argmax(axis=1)
+    upper = (cumulative >= n // 2 + 1).argmax(axis=1)
+    return (sorted_durations[lower] + sorted_durations[upper]) / 2
+
+
+def resample_statistics(features: np.ndarray, durations: np.ndarray, n_resamples: int, seed,
+                        batch_cells: int = BATCH_CELLS) -> tuple:
+    """
+    재표본마다 특징 합계와 게임 시간 중앙값을 계산합니다.
+    Args:
+        seed: np.random.default_rng 에 넘길 값 (정수 또는 SeedSequence).
+    Returns:
+        tuple: (sums (재표본 수 × 특징 수), medians (재표본 수))
+    """
+    rng = np.random.default_rng(seed)
+    n_boards = len(durations)
+    sums = np.zeros((n_resamples, features.shape[1]), dtype=np.float64)
+    medians = np.full(n_resamples, np.nan)
+    if n_boards == 0:
+        return sums, medians
+    batch_size = max(1, batch_cells // n_boards)
+    for start in range(0, n_resamples, batch_size):
+        size = min(batch_size, n_resamples - start)
+        picks = rng.integers(0, n_boards, size=(size, n_boards))
+        picks += (np.arange(size) * n_boards)[:, None] # 행마다 다른 칸으로 보내서 bincount 한 번에 행별 횟수
+        counts = np.bincount(picks.ravel(), minlength=size * n_boards).reshape(size, n_boards)
+        sums[start:start + size] = counts.astype(np.float64) @ features # 실수 행렬곱이라야 BLAS 를 씀
+        medians[start:start + size] = _median_from_counts(counts, durations)
+    return sums, medians
+
+
+def _resample_task(args):
+    features, durations, n_resamples, seed_sequence, batch_cells = args
+    return resample_statistics(features, durations, n_resamples, seed_sequence, batch_cells)
+
+
+def bootstrap_champion(match_arrays: MatchArrays, item_catalog: ItemCatalog, champion_name: str,
+                       n_resamples: int = DEFAULT_RESAMPLES, confidence: float = DEFAULT_CONFIDENCE,
+                       top_n: int = 10, seed: int = 0, n_workers: int = None) -> pd.DataFrame:
+    """
+    챔피언 하나의 부트스트랩 백분위 신뢰구간.
+    Args:
+        top_n (int): 장착률 구간을 보고할 아이템 수 (원래 표본의 장착률 상위).
+        n_workers (int): 2 이상이면 재표본을 프로세스 풀에 나눠 계산합니다 (결과는 seed 와 n_workers 가 같으면 재현됨).
+    Returns:
+        pd.DataFrame: (champion, statistic, item_id, item_name, estimate, ci_low, ci_high, n_boards)
+                      statistic 은 'defensive_ratio', 'median_duration', 'pick_rate' (보드 중 그 아이템을 장착한 비율).
+    """
+    champion_key = normalize_champion_name(champion_name)
+    features, durations, item_ids = champion_board_features(match_arrays, item_catalog, champion_key)
+    n_boards = len(durations)
+
+    seed_sequences = np.random.SeedSequence(seed).spawn(max(1, n_workers or 1))
+    shares = np.diff(np.linspace(0, n_resamples, len(seed_sequences) + 1).astype(np.int64))
+    tasks = [(features, durations, int(share), seed_sequence, BATCH_CELLS)
+             for share, seed_sequence in zip(shares, seed_sequences) if share > 0]
+    if len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            results = list(executor.map(_resample_task, tasks))
+    else:
+        results = [_resample_task(task) for task in tasks]
+    sums = np.concatenate([result[0] for result in results]) if results else np.zeros((0, features.shape[1]))
+    medians = np.concatenate([result[1] for result in results]) if results else np.zeros(0)
+
+    totals = features.sum(axis=0)
+    tail = (1 - confidence) / 2 * 100
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratio_samples = sums[:, 1] / sums[:, 0]
+        pick_samples = sums[:, 2:] / max(n_boards, 1)
+        rows = [('defensive_ratio', np.nan, totals[1] / totals[0] if totals[0] else np.nan, ratio_samples),
+                ('median_duration', np.nan, np.median(durations) if n_boards else np.nan, medians)]
+        pick_rates = totals[2:] / max(n_boards, 1)
+    for column in np.argsort(-pick_rates, kind='stable')[:top_n]:
+        rows.append(('pick_rate', item_ids[column], pick_rates[column], pick_samples[:, column]))
+
+    records = []
+    for statistic, item_id, estimate, samples in rows:
+        samples = samples[~np.isnan(samples)]
+        low, high = np.percentile(samples, [tail, 100 - tail]) if len(samples) else (np.nan, np.nan)
+        records.append({
+            'champion': champion_key, 'statistic': statistic,
+            'item_id': item_id, 'item_name': item_catalog.names_of([item_id])[0] if statistic == 'pick_rate' else None,
+            'estimate': estimate, 'ci_low': low, 'ci_high': high, 'n_boards': n_boards,
+        })
+    return pd.DataFrame.from_records(records).astype({'item_id': 'Int64'})
+
+
+def bootstrap_champions(match_arrays: MatchArrays, item_catalog: ItemCatalog, champion_names,
+                        n_resamples: int = DEFAULT_RESAMPLES, confidence: float = DEFAULT_CONFIDENCE,
+                        top_n: int = 10, seed: int = 0, n_workers: int = None) -> pd.DataFrame:
+    """여러 챔피언의 bootstrap_champion 결과를 이어 붙입니다 (챔피언마다 seed 를 달리함)."""
+    frames = [bootstrap_champion(match_arrays, item_catalog, champion_name, n_resamples, confidence, top_n, seed + position, n_workers)
+              for position, champion_name in enumerate(champion_names)]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Bootstrap.py TFT_Challenger_MatchData.csv VI BLITZCRANK --resamples 10000 --workers 4
+    args = sys.argv[1:]
+    n_resamples = int(args[args.index('--resamples') + 1]) if '--resamples' in args else DEFAULT_RESAMPLES
+    n_workers = int(args[args.index('--workers') + 1]) if '--workers' in args else None
+    option_values = {args[position + 1] for position, arg in enumerate(args[:-1]) if arg in ('--resamples', '--workers')}
+    positional = [arg for arg in args if not arg.startswith('--') and arg not in option_values]
+    file_path_match = positional[0] if positional else 'TFT_Challenger_MatchData.csv'
+
+    match_arrays, item_catalog = load_match_arrays(file_path_match), load_item_catalog()
+    started = time.perf_counter()
+    df_intervals = bootstrap_champions(match_arrays, item_catalog, positional[1:] or ['VI'], n_resamples, n_workers=n_workers)
+    elapsed = time.perf_counter() - started
+
+    pd.set_option('display.width', 200)
+    print(df_intervals.to_string(index=False))
+    print(f"\n✅ 재표본 {n_resamples}개, {DEFAULT_CONFIDENCE:.0%} 신뢰구간 계산 완료 ({elapsed:.2f}초, 워커 {n_workers or 1}개 / CPU {os.cpu_count()}개)")
@@ -0,0 +1,209 @@
+import argparse
+import os
+import sys
+import time
+
+# ----------------------------------------------------------------------------------------------------
+# 하나의 명령줄 도구: python TFT_CLI.py <명령> [인자...]
+#    - 문제 정의: 'vi projcet.py', 'Blitzcrank projcet.py', '잡다한 실행.py', TFT_Item_CurrentVersion.py 는
+#                 import 하는 순간 pandas / numpy 를 불러오고 CSV 를 모두 다시 읽고 분석까지 돌렸습니다.
+#                 경로도 r'D:\PythonProject 1\...' 처럼 파일 안에 박혀 있어서, 아이템 이름 하나 찾는 데도 수 초가 걸렸습니다.
+#    - 해결 목표: 명령(classify-items, parse, validate, top-items, survival, search)마다 필요한 모듈을 그 명령 함수 안에서 import 합니다.
+#                 · 이 파일은 표준 라이브러리만 import 하므로, 명령을 고르는 데는 파이썬 시작 시간만 듭니다.
+#                 · search 는 pandas / numpy 없이 csv 모듈과 이름 색인(TFT_Name_Search)만 쓰므로 수십 ms 안에 답합니다.
+#                 · 무거운 분석(top-items, survival)은 TFT_Analysis_Pipeline 의 단계 캐시를 그대로 씁니다.
+#                 파일 경로는 --match / --items / --champions 옵션으로 바꿉니다 (기본값은 현재 폴더의 CSV).
+#                 인자는 명령마다 argparse 하위 파서로 해석하므로, 모르는 옵션이나 오타는 사용법과 함께 종료 코드 2 로 끝납니다.
+#    - 각 스크립트는 이제 함수만 정의하고 if __name__ == '__main__': 에서만 실행되므로, import 해서 함수로 써도 아무 일도 일어나지 않습니다.
+# ----------------------------------------------------------------------------------------------------
+
+DEFAULT_FILES = {
+    'match': 'TFT_Challenger_MatchData.csv',
+    'items': 'TFT_Item_CurrentVersion.csv',          # 원본 아이템 (id, name)
+    'categorized': 'TFT_Item_Categorized_Version.csv', # classify-items 가 쓰는 결과 파일 (분석은 원본 아이템 CSV 를 직접 분류해서 씀)
+    'champions': 'TFT_Champion_CurrentVersion.csv',
+}
+DEFAULT_CACHE_DIR = 'TFT_Pipeline.cache'
+
+
+def _positive_int(value: str) -> int:
+    """argparse type: 1 이상의 정수 (--top, --limit)."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상의 정수여야 합니다: '{value}'")
+    return number
+
+
+def _analysis_pipeline(args, top_n: int = 10):
+    from TFT_Analysis_Pipeline import build_analysis_pipeline
+
+    return build_analysis_pipeline(
+        file_path_match=args.match, file_path_item_raw=args.items,
+        file_path_champion_info=args.champions, top_n=top_n, cache_dir=args.cache_dir,
+    )
+
+
+# --- 명령 함수: 해석된 인자(argparse.Namespace) → 종료 코드 ---
+def command_search(args) -> int:
+    """아이템 / 챔피언 이름 검색 (한글·영어, 부분 문자열, 오타 허용)."""
+    from TFT_Name_Search import load_name_index
+
+    name_index = load_name_index(args.items, args.champions)
+    for query in args.queries:
+        matches = name_index.search(query, kind=args.kind, limit=args.limit, fuzzy=not args.exact)
+        found = ', '.join(f"{match.kind}:{match.name}({match.key}, {match.score:.2f})" for match in matches) or '없음'
+        print(f"'{query}' → {found}")
+    return 0
+
+
+def command_classify_items(args) -> int:
+    """원본 아이템 CSV 에 item_type / is_defensive 를 붙여 분류 CSV 로 저장합니다."""
+    import pandas as pd
+
+    from TFT_Item_CurrentVersion import classify_items
+
+    output_path = args.output or args.categorized
+    df_item = classify_items(pd.read_csv(args.items))
+    df_item.to_csv(output_path, index=False)
+    print(f"✅ 아이템 {len(df_item)}개 분류 → '{output_path}' "
+          f"(기본 아이템 {int((df_item['item_type'] == 'component').sum())}개, 방템 {int(df_item['is_defensive'].sum())}개)")
+    return 0
+
+
+def command_parse(args) -> int:
+    """매치 CSV 의 'champion' 컬럼을 파싱해서 배열 캐시(TFT_Match_Cache)를 만들거나 최신인지 확인합니다."""
+    from TFT_Match_Cache import load_match_arrays
+
+    file_path_match = args.file or args.match
+    started = time.perf_counter()
+    match_arrays = load_match_arrays(file_path_match)
+    elapsed = time.perf_counter() - started
+    print(f"✅ '{file_path_match}': 게임 {len(match_arrays.game_ids)}개, 보드(게임 × 챔피언) {len(match_arrays.board_game)}개, "
+          f"아이템 슬롯 {len(match_arrays.item_ids)}개 ({elapsed:.2f}초, 캐시가 최신이면 파싱하지 않음)")
+    return 0
+
+
+def command_validate(args) -> int:
+    """매치 데이터를 검증하고 거부된 행을 격리 파일(<원본>.quarantine.csv 또는 --output)에 씁니다."""
+    from TFT_Item_Catalog import load_item_catalog
+    from TFT_Match_Validation import validate_match_file
+
+    file_path_match = args.file or args.match
+    report = validate_match_file(file_path_match, load_item_catalog(args.items), args.output)
+    summary = report.to_dict()
+    print(f"✅ {summary['rows']}행 검증: 거부 {summary['rejected']}행")
+    for reason, rows in summary['reasons'].items():
+        print(f"    - {reason}: {rows}행")
+    return 0
+
+
+def command_top_items(args) -> int:
+    """챔피언별 완성 아이템 TOP-N 표와 방템 비율 요약."""
+    from TFT_Batch_Report import report_file_name
+    from TFT_Champion_Registry import normalize_champion_name
+    from TFT_Report_Writer import write_report_csv
+
+    pipeline = _analysis_pipeline(args, args.top)
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+    for champion_name in args.champions_to_report or ['VI']:
+        pipeline.set_param('target_champion', champion_name)
+        report = pipeline.get('champion_report')
+        print(f"\n--- {normalize_champion_name(champion_name)} 완성 아이템 TOP {args.top} ---")
+        print(report.to_text())
+        if args.output:
+            file_path = write_report_csv(report, os.path.join(args.output, report_file_name(report.name, args.top)))
+            print(f"    - '{file_path}' 에 저장했습니다.")
+    return 0
+
+
+def command_survival(args) -> int:
+    """챔피언별 방템 개수(0~3+) 그룹의 생존 시간(ingameDuration) 분위수."""
+    from TFT_Champion_Registry import normalize_champion_name
+    from TFT_Report_Writer import frame_table, write_report_xlsx
+
+    summary = _analysis_pipeline(args).get('survival_curves').summary()
+    tables = []
+    for champion_name in [normalize_champion_name(name) for name in args.champions_to_report or ['VI']]:
+        champion_summary = summary[summary['champion'] == champion_name]
+        print(f"\n--- {champion_name} 방템 개수별 생존 시간(ingameDuration) ---")
+        print(champion_summary.to_string(index=False) if len(champion_summary) else '    (데이터 없음)')
+        tables.append(frame_table(f"{champion_name}_Survival", champion_summary, f"{champion_name} 방템 개수별 생존 시간",
+                                  {'보드 수': int(champion_summary['n'].sum()), '탈락(사건) 수': int(champion_summary['n_events'].sum())}))
+    if args.xlsx:
+        print(f"\n✅ 생존 분석 표를 '{write_report_xlsx(tables, args.xlsx)}' 에 썼습니다.")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    명령마다 하위 파서(subparser)를 하나씩 둔 argparse 파서. 파일 경로 옵션(--match, --items, --categorized, --champions,
+    --cache-dir)은 모든 명령에 공통이고, 모르는 옵션이나 오타(--tpo 등)는 사용법과 함께 종료 코드 2 로 끝납니다.
+    """
+    file_options = argparse.ArgumentParser(add_help=False)
+    for name, default in DEFAULT_FILES.items():
+        file_options.add_argument(f'--{name}', default=default, metavar='파일', help=f"기본값: {default}")
+    file_options.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, metavar='폴더', help="파이프라인 단계 캐시 폴더")
+
+    parser = argparse.ArgumentParser(prog='TFT_CLI.py', description="TFT 매치 데이터 분석 명령줄 도구")
+    commands = parser.add_subparsers(dest='command', metavar='<명령>', required=True)
+
+    search = commands.add_parser('search', parents=[file_options], help=command_search.__doc__)
+    search.add_argument('queries', nargs='+', metavar='검색어')
+    search.add_argument('--kind', choices=['item', 'champion'], help="아이템 또는 챔피언만 검색")
+    search.add_argument('--limit', type=_positive_int, default=5, help="검색어마다 보여줄 결과 수 (기본 5)")
+    search.add_argument('--exact', action='store_true', help="오타 허용(fuzzy) 검색을 끔")
+    search.set_defaults(func=command_search)
+
+    classify = commands.add_parser('classify-items', parents=[file_options], help=command_classify_items.__doc__)
+    classify.add_argument('--output', help="저장 경로 (기본: --categorized 경로)")
+    classify.set_defaults(func=command_classify_items)
+
+    parse = commands.add_parser('parse', parents=[file_options], help=command_parse.__doc__)
+    parse.add_argument('file', nargs='?', help="매치 CSV (기본: --match 경로)")
+    parse.set_defaults(func=command_parse)
+
+    validate = commands.add_parser('validate', parents=[file_options], help=command_validate.__doc__)
+    validate.add_argument('file', nargs='?', help="매치 CSV (기본: --match 경로)")
+    validate.add_argument('--output', help="격리 파일 경로 (기본: <원본>.quarantine.csv)")
+    validate.set_defaults(func=command_validate)
+
+    top_items = commands.add_parser('top-items', parents=[file_options], help=command_top_items.__doc__)
+    top_items.add_argument('champions_to_report', nargs='*', metavar='챔피언', help="챔피언 이름 (기본 VI)")
+    top_items.add_argument('--top', type=_positive_int, default=10, help="챔피언마다 보여줄 아이템 수 (기본 10)")
+    top_items.add_argument('--output', metavar='폴더', help="주면 챔피언마다 CSV 저장")
+    top_items.set_defaults(func=command_top_items)
+
+    survival = commands.add_parser('survival', parents=[file_options], help=command_survival.__doc__)
+    survival.add_argument('champions_to_report', nargs='*', metavar='챔피언', help="챔피언 이름 (기본 VI)")
+    survival.add_argument('--xlsx', help="주면 챔피언마다 시트로 저장")
+    survival.set_defaults(func=command_survival)
+    return parser
+
+
+def main(argv: list = None) -> int:
+    """명령줄 인자(argv, 기본 sys.argv[1:])로 명령 하나를 실행하고 종료 코드를 돌려줍니다."""
+    argv = sys.argv[1:] if argv is None else argv
+    parser = build_parser()
+    if not argv:
+        parser.print_help()
+        return 0
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e: # 인자 오류(모르는 명령 / 옵션, 정수가 아닌 --top 등)는 사용법을 출력하고 2, --help 는 0
+        return e.code
+    try:
+        return args.func(args)
+    except FileNotFoundError as e:
+        print(f"❌ 오류: 파일 '{e.filename}'을(를) 찾을 수 없습니다. 파일 경로와 이름을 다시 확인해라!")
+        return 1
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_CLI.py search "거인의 결의" blitz
+    #         python TFT_CLI.py classify-items
+    #         python TFT_CLI.py parse TFT_Challenger_MatchData.csv
+    #         python TFT_CLI.py validate
+    #         python TFT_CLI.py top-items VI BLITZCRANK --top 10 --output TFT_Reports
+    #         python TFT_CLI.py survival VI --xlsx TFT_Vi_Survival_Analysis.xlsx
+    sys.exit(main())
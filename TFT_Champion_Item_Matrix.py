@@ -0,0 +1,150 @@
+import sys
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from TFT_Champion_Registry import normalize_champion_name, normalize_champion_names
+from TFT_Item_Catalog import ITEM_COMPLETED, ItemCatalog, load_item_catalog
+from TFT_Match_Cache import MatchArrays, load_match_arrays
+
+# ----------------------------------------------------------------------------------------------------
+# 챔피언 × 아이템 장착 횟수 행렬 (+ 챔피언별 아이템 조합 횟수)
+#    - 문제 정의: "VI 아이템 TOP 10" 은 아이템 리스트를 펼친 뒤 pd.Series(...).value_counts() 로 매번 새로 세고,
+#                 Blitzcrank 표는 원래 손으로 적은 값이었습니다. 질문(챔피언, 방템 비율, 이 아이템을 누가 쓰나)마다
+#                 pandas 파이프라인을 처음부터 다시 돌립니다.
+#    - 해결 목표: 파싱된 매치(CSR 배열)를 한 번만 훑어서 챔피언 × 아이템 코드 개수 행렬과
+#                 챔피언 × 아이템 × 아이템 조합(같은 보드에 같이 장착) 개수 배열을 bincount 로 만듭니다.
+#                 이후 TOP-N, 방템 비율, 아이템별 사용 챔피언은 행/열 슬라이스 한 번입니다.
+#    - scipy 가 설치되어 있지 않고 행렬 크기도 작아서(챔피언 ~60 × 아이템 ~60) NumPy 조밀 배열로 저장합니다.
+#      아이템 코드는 TFT_Item_Catalog 코드이며, 마지막 열은 카탈로그에 없는 아이템(코드 -1)용입니다.
+# ----------------------------------------------------------------------------------------------------
+
+
+@dataclass
+class ChampionItemMatrix:
+    """
+    챔피언 × 아이템 장착 횟수 행렬.
+    counts[c, i] = 챔피언 c 가 아이템 코드 i 를 장착한 횟수,
+    pair_counts[c, i, j] = 챔피언 c 의 한 보드에 아이템 i, j 가 같이 장착된 횟수 (i <= j 칸에만 기록).
+    """
+    item_catalog: ItemCatalog
+    champion_keys: list              # 행 번호 → 정규화된 챔피언 키
+    counts: np.ndarray               # (챔피언 수, 아이템 수 + 1) int64
+    pair_counts: np.ndarray          # (챔피언 수, 아이템 수 + 1, 아이템 수 + 1) int64
+    board_counts: np.ndarray         # 챔피언별 보드 수 (int64)
+    row_of_key: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.row_of_key:
+            self.row_of_key = {key: row for row, key in enumerate(self.champion_keys)}
+
+    def _row(self, champion_name: str):
+        return self.row_of_key.get(normalize_champion_name(champion_name))
+
+    def _item_columns(self, required_bits: int) -> np.ndarray:
+        # 카탈로그 아이템 중 required_bits 속성을 모두 가진 열 (0 이면 카탈로그 전체)
+        return np.flatnonzero((self.item_catalog.attributes[:-1] & required_bits) == required_bits)
+
+    def item_counts(self, champion_name: str, required_bits: int = 0) -> pd.Series:
+        """챔피언의 아이템 ID별 장착 횟수 (장착 횟수 내림차순, 0 제외, index 이름 'item_id')."""
+        row = self._row(champion_name)
+        columns = self._item_columns(required_bits)
+        counts = np.zeros(len(columns), dtype=np.int64) if row is None else self.counts[row, columns]
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0]
+        return pd.Series(counts[order], index=pd.Index(self.item_catalog.ids[columns[order]], name='item_id'), name='count')
+
+    def top_items(self, champion_name: str, n: int = 10, required_bits: int = ITEM_COMPLETED) -> pd.Series:
+        """챔피언이 가장 많이 장착한 아이템 TOP-N (기본: 완성 아이템만)."""
+        return self.item_counts(champion_name, required_bits).head(n)
+
+    def defensive_ratio(self, champion_name: str, required_bits: int = ITEM_COMPLETED) -> float:
+        """required_bits 아이템(기본: 완성 아이템) 장착 중 방어 아이템이 차지하는 비율. 장착 기록이 없으면 NaN."""
+        row = self._row(champion_name)
+        columns = self._item_columns(required_bits)
+        if row is None:
+            return float('nan')
+        total = self.counts[row, columns].sum()
+        defensive = self.counts[row, columns[self.item_catalog.is_defensive[columns]]].sum()
+        return float(defensive / total) if total else float('nan')
+
+    def builders(self, item_id: int, n: int = None) -> pd.Series:
+        """아이템을 장착한 챔피언별 횟수 (내림차순, 0 제외, index 이름 'champion')."""
+        code = int(self.item_catalog.encode([item_id])[0])
+        column = self.counts[:, code] if code >= 0 else np.zeros(len(self.champion_keys), dtype=np.int64)
+        order = np.argsort(-column, kind='stable')
+        order = order[column[order] > 0][:n]
+        return pd.Series(column[order], index=pd.Index(np.asarray(self.champion_keys, dtype=object)[order], name='champion'), name='count')
+
+    def top_pairs(self, champion_name: str, n: int = 10, required_bits: int = ITEM_COMPLETED) -> pd.DataFrame:
+        """챔피언의 한 보드에 같이 장착된 아이템 조합 TOP-N (item_a, item_b, count)."""
+        row = self._row(champion_name)
+        columns = self._item_columns(required_bits)
+        if row is None:
+            pair_counts = np.zeros((len(columns), len(columns)), dtype=np.int64)
+        else:
+            pair_counts = np.triu(self.pair_counts[row][np.ix_(columns, columns)])
+        first, second = np.nonzero(pair_counts)
+        counts = pair_counts[first, second]
+        order = np.argsort(-counts, kind='stable')[:n]
+        return pd.DataFrame({
+            'item_a': self.item_catalog.ids[columns[first[order]]],
+            'item_b': self.item_catalog.ids[columns[second[order]]],
+            'count': counts[order],
+        })
+
+
+def build_champion_item_matrix(match_arrays: MatchArrays, item_catalog: ItemCatalog) -> ChampionItemMatrix:
+    """
+    매치 배열(TFT_Match_Cache.MatchArrays 또는 같은 필드를 가진 객체)을 한 번 훑어서 행렬을 만듭니다.
+    같은 이름으로 정규화되는 챔피언(예: 'Vi', 'VI')은 한 행으로 합칩니다.
+    """
+    champion_keys = normalize_champion_names(np.asarray(match_arrays.champion_names, dtype=object))
+    key_codes, key_uniques = pd.factorize(pd.Series(champion_keys, dtype=object))
+    board_rows = key_codes[np.asarray(match_arrays.board_champion)].astype(np.int64)
+    n_champions = len(key_uniques)
+    n_columns = len(item_catalog.ids) + 1 # 마지막 열 = 카탈로그에 없는 아이템
+
+    item_offsets = np.asarray(match_arrays.item_offsets)
+    items_per_board = np.diff(item_offsets)
+    slot_rows = np.repeat(board_rows, items_per_board)
+    slot_columns = item_catalog.encode(np.asarray(match_arrays.item_ids)).astype(np.int64) % n_columns # -1 → 마지막 열
+    counts = np.bincount(slot_rows * n_columns + slot_columns, minlength=n_champions * n_columns)
+    counts = counts.reshape(n_champions, n_columns)
+
+    # 같은 보드 안의 (앞 슬롯, 뒤 슬롯) 조합: 보드당 아이템 수가 작으므로(보통 3개 이하) 슬롯 간격별로 한 번씩만 반복
+    pair_counts = np.zeros(n_champions * n_columns * n_columns, dtype=np.int64)
+    slot_board = np.repeat(np.arange(len(board_rows)), items_per_board)
+    for gap in range(1, int(items_per_board.max()) if len(items_per_board) else 0):
+        same_board = slot_board[gap:] == slot_board[:-gap]
+        first, second = slot_columns[:-gap][same_board], slot_columns[gap:][same_board]
+        low, high = np.minimum(first, second), np.maximum(first, second)
+        pair_counts += np.bincount((slot_rows[:-gap][same_board] * n_columns + low) * n_columns + high, minlength=len(pair_counts))
+
+    return ChampionItemMatrix(
+        item_catalog=item_catalog,
+        champion_keys=list(key_uniques),
+        counts=counts,
+        pair_counts=pair_counts.reshape(n_champions, n_columns, n_columns),
+        board_counts=np.bincount(board_rows, minlength=n_champions),
+    )
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Champion_Item_Matrix.py TFT_Challenger_MatchData.csv VI
+    file_path_match = sys.argv[1] if len(sys.argv) > 1 else 'TFT_Challenger_MatchData.csv'
+    target_champion_name = normalize_champion_name(sys.argv[2] if len(sys.argv) > 2 else 'VI')
+    item_catalog = load_item_catalog()
+    matrix = build_champion_item_matrix(load_match_arrays(file_path_match), item_catalog)
+
+    top_items = matrix.top_items(target_champion_name)
+    print(f"--- {target_champion_name} 완성 아이템 TOP {len(top_items)} (방템 비율 {matrix.defensive_ratio(target_champion_name):.2%}) ---")
+    for rank, (item_id, count) in enumerate(top_items.items(), start=1):
+        print(f"{rank:<4} | {item_catalog.names_of([item_id])[0]!s:<25} | {count}")
+    print(f"\n--- {target_champion_name} 아이템 조합 TOP 5 ---")
+    for _, pair in matrix.top_pairs(target_champion_name, n=5).iterrows():
+        print(f"{item_catalog.names_of([pair['item_a']])[0]!s:<25} + {item_catalog.names_of([pair['item_b']])[0]!s:<25} | {pair['count']}")
+    if not top_items.empty:
+        print(f"\n--- '{item_catalog.names_of([top_items.index[0]])[0]}' 를 가장 많이 쓰는 챔피언 TOP 5 ---")
+        print(matrix.builders(top_items.index[0], n=5).to_string())
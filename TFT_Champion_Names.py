@@ -0,0 +1,39 @@
+import re
+
+# ----------------------------------------------------------------------------------------------------
+# 챔피언 이름 → 정규화된 키 (numpy / pandas 없이 쓰는 부분)
+#    - 문제 정의: 이름 정규화 규칙과 한글 별칭표가 TFT_Champion_Registry 에 있어서, 이름 검색(TFT_CLI search)처럼
+#                 문자열만 다루는 명령도 pandas / numpy 를 불러오느라 시작에만 수백 ms 가 걸렸습니다.
+#    - 해결 목표: 표준 라이브러리만 쓰는 규칙과 별칭표를 이 모듈로 옮기고, TFT_Champion_Registry 는 이것을 가져다 씁니다.
+#                 (KOREAN_CHAMPION_ALIASES 는 TFT_Champion_Registry 에서도 그대로 import 할 수 있습니다.)
+# ----------------------------------------------------------------------------------------------------
+
+# 한글 챔피언 이름 → 정규화된 영문 키 (공백은 정규화 과정에서 제거되므로 붙여서 적음)
+KOREAN_CHAMPION_ALIASES = {
+    '갱플랭크': 'GANGPLANK', '그레이브즈': 'GRAVES', '니코': 'NEEKO', '다리우스': 'DARIUS',
+    '라칸': 'RAKAN', '럭스': 'LUX', '럼블': 'RUMBLE', '레오나': 'LEONA',
+    '루시안': 'LUCIAN', '룰루': 'LULU', '마스터이': 'MASTERYI', '말파이트': 'MALPHITE',
+    '모데카이저': 'MORDEKAISER', '미스포츈': 'MISSFORTUNE', '바이': 'VI', '벨코즈': 'VELKOZ',
+    '블리츠크랭크': 'BLITZCRANK', '뽀삐': 'POPPY', '샤코': 'SHACO', '소나': 'SONA',
+    '소라카': 'SORAKA', '쉔': 'SHEN', '신짜오': 'XINZHAO', '신드라': 'SYNDRA',
+    '쓰레쉬': 'THRESH', '아리': 'AHRI', '아우렐리온솔': 'AURELIONSOL', '애니': 'ANNIE',
+    '애쉬': 'ASHE', '야스오': 'YASUO', '에코': 'EKKO', '오공': 'WUKONG',
+    '이렐리아': 'IRELIA', '이즈리얼': 'EZREAL', '자르반4세': 'JARVANIV', '자야': 'XAYAH',
+    '제라스': 'XERATH', '제이스': 'JAYCE', '조이': 'ZOE', '직스': 'ZIGGS',
+    '진': 'JHIN', '징크스': 'JINX', '초가스': 'CHOGATH', '카르마': 'KARMA',
+    '카사딘': 'KASSADIN', '카이사': 'KAISA', '카직스': 'KHAZIX', '케이틀린': 'CAITLYN',
+    '케일': 'KAYLE', '트위스티드페이트': 'TWISTEDFATE', '피오라': 'FIORA', '피즈': 'FIZZ',
+    # 챔피언 CSV 에는 없지만 Blitzcrank 예시 데이터에 나왔던 챔피언
+    '자크': 'ZAC', '케인': 'KAYN', '신지드': 'SINGED',
+}
+
+_NON_NAME_CHARACTERS = re.compile(r'[^0-9A-Z가-힣]')
+
+
+def champion_key(name: str) -> str:
+    """
+    문자열 이름 하나를 정규화된 키로 바꿉니다 (대문자, 공백/특수문자 제거, 한글 이름 → 영문 키).
+    NaN 처리까지 하는 TFT_Champion_Registry.normalize_champion_name 이 이 함수를 씁니다.
+    """
+    key = _NON_NAME_CHARACTERS.sub('', name.upper())
+    return KOREAN_CHAMPION_ALIASES.get(key, key)
@@ -0,0 +1,112 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from TFT_Champion_Names import KOREAN_CHAMPION_ALIASES, champion_key
+
+# ----------------------------------------------------------------------------------------------------
+# 챔피언 이름 정규화 + 정수 코드 레지스트리
+#    - 문제 정의: 'vi projcet.py' 는 df_champions_exploded['champion'] 에 .str.upper() 를 여러 번 돌리고,
+#                 df_champion_info['name'] 도 따로 대문자로 바꾼 뒤, 문자열 그대로 pd.merge 합니다.
+#                 Blitzcrank 데이터처럼 한글 이름('블리츠크랭크')이 섞이면 같은 챔피언이 다른 값이 됩니다.
+#    - 해결 목표: 이름을 한 번만 정규화(대문자, 공백/특수문자 제거, 한글 이름 → 영문 키)하고 작은 정수 코드를 붙입니다.
+#                 펼쳐진 테이블은 categorical(int16 코드)로 저장하고,
+#                 TFT_Champion_CurrentVersion.csv 의 스탯은 코드 순서로 정렬해 두어 병합 대신 정수 인덱스로 가져옵니다.
+# ----------------------------------------------------------------------------------------------------
+
+def normalize_champion_name(name) -> str:
+    """
+    챔피언 이름 하나를 정규화된 키로 바꿉니다.
+    대문자 변환 후 공백/특수문자를 지우고('Master Yi' → 'MASTERYI', "Cho'Gath" → 'CHOGATH'),
+    한글 이름은 영문 키로 바꿉니다('블리츠크랭크' → 'BLITZCRANK'). NaN 은 빈 문자열입니다.
+    """
+    if not isinstance(name, str):
+        if pd.isna(name):
+            return ''
+        name = str(name)
+    return champion_key(name)
+
+
+def normalize_champion_names(names) -> np.ndarray:
+    """
+    이름 배열 전체를 정규화합니다. 서로 다른 철자마다 한 번씩만 정규화하고 결과를 다시 펼칩니다.
+    Returns:
+        np.ndarray: 정규화된 키 배열 (object).
+    """
+    codes, uniques = pd.factorize(pd.Series(names, dtype=object))
+    # 마지막 칸은 NaN(코드 -1)용 빈 문자열
+    normalized_uniques = np.array([normalize_champion_name(name) for name in uniques] + [''], dtype=object)
+    return normalized_uniques[codes]
+
+
+@dataclass
+class ChampionRegistry:
+    """
+    정규화된 챔피언 키 ↔ 정수 코드 변환표와 코드 순서로 정렬된 챔피언 스탯 테이블.
+    챔피언 CSV 에 없는 이름은 encode 할 때 새 코드가 뒤에 추가되고, 스탯은 NaN 입니다.
+    """
+    keys: list                                     # 코드 → 정규화된 키
+    info: pd.DataFrame                             # 코드 → 챔피언 스탯 (행 번호 = 코드, 'name' 은 정규화된 키)
+    code_of_key: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.code_of_key:
+            self.code_of_key = {key: code for code, key in enumerate(self.keys)}
+
+    def _code_for(self, key: str) -> int:
+        code = self.code_of_key.get(key)
+        if code is None:
+            code = len(self.keys)
+            self.keys.append(key)
+            self.code_of_key[key] = code
+        return code
+
+    def encode(self, names) -> np.ndarray:
+        """
+        이름 배열 → 챔피언 코드 배열 (int16). 서로 다른 철자마다 한 번만 정규화합니다.
+        Categorical 이 들어오면 카테고리만 정규화해서 기존 코드를 다시 매핑합니다.
+        """
+        if isinstance(names, pd.Series) and isinstance(names.dtype, pd.CategoricalDtype):
+            names = names.array
+        if isinstance(names, pd.Categorical):
+            raw_codes, uniques = names.codes, names.categories
+        else:
+            raw_codes, uniques = pd.factorize(pd.Series(names, dtype=object))
+        # 마지막 칸은 NaN(코드 -1)용
+        unique_codes = np.array([self._code_for(normalize_champion_name(name)) for name in uniques] + [-1], dtype=np.int16)
+        return unique_codes[raw_codes]
+
+    def to_categorical(self, names) -> pd.Categorical:
+        """이름 배열 → 정규화된 키를 카테고리로 가진 Categorical (모든 등록 챔피언이 카테고리에 포함)."""
+        codes = self.encode(names)
+        return pd.Categorical.from_codes(codes, categories=pd.Index(self.keys, dtype=object))
+
+    def stats_of(self, codes) -> pd.DataFrame:
+        """
+        챔피언 코드 배열 → 같은 길이의 챔피언 스탯 DataFrame (pd.merge 대신 정수 위치 조회).
+        코드 -1 이나 CSV 에 없는 챔피언은 스탯이 NaN 입니다.
+        """
+        codes = np.asarray(codes)
+        if len(codes) == 0 or (codes.min() >= 0 and codes.max() < len(self.info)):
+            return self.info.iloc[codes].reset_index(drop=True) # 모두 CSV 에 있는 챔피언이면 dtype 그대로
+        # 뒤에 추가된 챔피언과 코드 -1 을 위한 빈 행을 붙인 뒤 위치로 바로 가져옴
+        info = self.info.reindex(range(len(self.keys) + 1))
+        info['name'] = self.keys + [np.nan]
+        return info.iloc[codes].reset_index(drop=True)
+
+
+def build_champion_registry(df_champion_info: pd.DataFrame) -> ChampionRegistry:
+    """
+    TFT_Champion_CurrentVersion.csv DataFrame 으로 레지스트리를 만듭니다.
+    스탯 테이블의 'name' 컬럼은 정규화된 키(대문자)로 바뀝니다.
+    """
+    info = df_champion_info.copy()
+    info['name'] = normalize_champion_names(info['name'])
+    info = info.drop_duplicates('name').reset_index(drop=True)
+    return ChampionRegistry(keys=info['name'].tolist(), info=info)
+
+
+def load_champion_registry(file_path_champion_info: str = 'TFT_Champion_CurrentVersion.csv') -> ChampionRegistry:
+    """TFT_Champion_CurrentVersion.csv 를 읽어서 레지스트리를 만듭니다."""
+    return build_champion_registry(pd.read_csv(file_path_champion_info))
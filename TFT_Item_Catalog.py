@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from TFT_Item_CurrentVersion import load_classified_items
+
+# ----------------------------------------------------------------------------------------------------
+# 정수 코드 기반 아이템 카탈로그
+#    - 문제 정의: 'vi projcet.py' 는 모든 매치의 모든 아이템마다 `item in completed_items_list` 처럼
+#                 파이썬 리스트를 처음부터 훑고, 방템 여부도 다른 리스트를 또 훑어서 확인합니다.
+#    - 해결 목표: 분류된 아이템(TFT_Item_CurrentVersion.classify_items)으로 한 번만 카탈로그를 만들고,
+#                 아이템 ID → 조밀한 정수 코드(0..N-1) 변환표와 코드별 속성 배열(is_component, is_completed, is_defensive)을
+#                 NumPy 배열로 들고 있습니다. 수백만 개 아이템 슬롯의 필터/분류가 배열 인덱싱 한 번으로 끝납니다.
+#    - 카탈로그에 없는 아이템 ID 는 코드 -1 이 되고, 모든 속성 배열의 마지막 칸(-1 인덱스)은
+#      '알 수 없는 아이템' 용으로 비워둬서 별도 처리 없이 False / None 이 나옵니다.
+# ----------------------------------------------------------------------------------------------------
+
+# 속성 비트 (attributes 배열은 아래 비트의 OR 값을 uint8 로 가짐)
+ITEM_COMPONENT = 1
+ITEM_COMPLETED = 2
+ITEM_DEFENSIVE = 4
+
+ITEM_TYPE_BITS = {'component': ITEM_COMPONENT, 'completed': ITEM_COMPLETED}
+
+
+@dataclass
+class ItemCatalog:
+    """
+    아이템 ID ↔ 정수 코드 변환표와 코드별 속성 배열.
+    코드별 배열(names, attributes, is_*)은 길이가 아이템 수 + 1 이고, 마지막 칸은 알 수 없는 아이템(코드 -1)용입니다.
+    """
+    ids: np.ndarray          # 코드 → 아이템 ID (int16)
+    names: np.ndarray        # 코드 → 아이템 이름 (object, 마지막 칸 None)
+    attributes: np.ndarray   # 코드 → 속성 비트 (uint8, 마지막 칸 0)
+    code_of_id: np.ndarray   # 아이템 ID → 코드 (int16, 없는 ID 는 -1)
+
+    @property
+    def is_component(self) -> np.ndarray:
+        return (self.attributes & ITEM_COMPONENT) != 0
+
+    @property
+    def is_completed(self) -> np.ndarray:
+        return (self.attributes & ITEM_COMPLETED) != 0
+
+    @property
+    def is_defensive(self) -> np.ndarray:
+        return (self.attributes & ITEM_DEFENSIVE) != 0
+
+    def encode(self, item_ids) -> np.ndarray:
+        """아이템 ID 배열 → 코드 배열 (카탈로그에 없거나 범위 밖 ID 는 -1)."""
+        item_ids = np.asarray(item_ids)
+        if item_ids.dtype.kind not in 'iu':
+            item_ids = pd.to_numeric(pd.Series(item_ids.ravel()), errors='coerce').fillna(-1).to_numpy(dtype=np.int64).reshape(item_ids.shape)
+        if len(self.code_of_id) == 0:
+            return np.full(item_ids.shape, -1, dtype=np.int16)
+        in_range = (item_ids >= 0) & (item_ids < len(self.code_of_id))
+        return np.where(in_range, self.code_of_id[np.where(in_range, item_ids, 0)], -1).astype(np.int16)
+
+    def attributes_of(self, item_ids) -> np.ndarray:
+        """아이템 ID 배열 → 속성 비트 배열 (uint8)."""
+        return self.attributes[self.encode(item_ids)]
+
+    def names_of(self, item_ids) -> np.ndarray:
+        """아이템 ID 배열 → 이름 배열 (없는 ID 는 None)."""
+        return self.names[self.encode(item_ids)]
+
+    def mask(self, item_ids, required_bits: int) -> np.ndarray:
+        """아이템 ID 배열 중 required_bits 속성을 모두 가진 위치만 True (예: ITEM_COMPLETED | ITEM_DEFENSIVE)."""
+        return (self.attributes_of(item_ids) & required_bits) == required_bits
+
+
+def build_item_catalog(df_item: pd.DataFrame) -> ItemCatalog:
+    """
+    분류된 아이템 DataFrame (id, name, item_type, is_defensive) 으로 카탈로그를 만듭니다.
+    item_type / is_defensive 컬럼이 없으면 해당 속성은 모두 False 입니다.
+    """
+    df_item = df_item.drop_duplicates('id').sort_values('id')
+    ids = df_item['id'].to_numpy(dtype=np.int16)
+    attributes = np.zeros(len(ids) + 1, dtype=np.uint8)
+    if 'item_type' in df_item.columns:
+        for item_type, bit in ITEM_TYPE_BITS.items():
+            attributes[:-1] |= np.where(df_item['item_type'].to_numpy() == item_type, bit, 0).astype(np.uint8)
+    if 'is_defensive' in df_item.columns:
+        is_defensive = df_item['is_defensive'].astype(str).str.lower().eq('true').to_numpy()
+        attributes[:-1] |= np.where(is_defensive, ITEM_DEFENSIVE, 0).astype(np.uint8)
+
+    names = np.empty(len(ids) + 1, dtype=object)
+    names[:-1] = df_item['name'].to_numpy(dtype=object) if 'name' in df_item.columns else None
+
+    code_of_id = np.full(int(ids.max()) + 1 if len(ids) else 0, -1, dtype=np.int16)
+    code_of_id[ids] = np.arange(len(ids), dtype=np.int16)
+    return ItemCatalog(ids=ids, names=names, attributes=attributes, code_of_id=code_of_id)
+
+
+def load_item_catalog(file_path_item_raw: str = 'TFT_Item_CurrentVersion.csv') -> ItemCatalog:
+    """
+    원본 아이템 CSV 를 classify_items 로 분류해서 카탈로그를 만듭니다 (분석 파이프라인의 item_catalog 단계와 같은 결과).
+    미리 저장된 분류 CSV(TFT_Item_Categorized_Version.csv)는 읽지 않으므로, 어느 진입점에서든 방템 분류가 같습니다.
+    """
+    return build_item_catalog(load_classified_items(file_path_item_raw))
@@ -1,38 +1,27 @@
 import pandas as pd
 
-# --------------------------------------------------------------------------
-# --- '초 필사적인 0단계: TFT_Item_CurrentVersion.csv' 파일 로드 ---
-# 'id', 'name' 컬럼을 포함하는 원본 아이템 데이터 파일!
-df_item = pd.read_csv('TFT_Item_CurrentVersion.csv')
+from TFT_Name_Search import build_name_index
 
-# --- [디버그] 이 파일에 'id'와 'name' 컬럼이 정확히 존재하는지 확인!
-# print(df_item.head())
-# print("-" * 50)
+# 'id', 'name' 컬럼을 포함하는 원본 아이템 데이터 파일과 분류 결과 파일
+file_path_item_raw = 'TFT_Item_CurrentVersion.csv'
+output_categorized_filename = 'TFT_Item_Categorized_Version.csv'
 
 
 # --------------------------------------------------------------------------
 # --- '초 필사적인 1단계: 아이템 타입 ('item_type') 분류를 위한 기본 아이템 리스트 정의 ---
 # '초 강력하게 "기본 아이템(Component Items)"' 이름들을 여기에 '초 깔끔하게 빠짐없이' 입력해야 해!
-# TFT 공식 영어 아이템명과 대소문자, 띄어쓰기까지 정확히 일치해야 한다!
+# TFT 공식 영어 아이템명 또는 한글 이름 (classify_items 가 TFT_Name_Search 로 찾으므로 대소문자, 띄어쓰기는 달라도 된다. 오타는 안 됨!)
 component_items = [
     "B.F. Sword", "Recurve Bow", "Needlessly Large Rod", "Tear of the Goddess",
     "Chain Vest", "Negatron Cloak", "Giant's Belt", "Spatula", "Sparring Gloves" # Sparring Gloves도 component로!
     # ... '초 필사적인 네가 아는 모든 기본 아이템' 이름들을 여기에 정확히 추가!
 ]
 
-# '초 필사적인 classify_item 함수'를 사용해서 'item_type' 컬럼 생성
-def classify_item(item_name_str):
-    if item_name_str in component_items:
-        return 'component'
-    return 'completed' # 기본 아이템이 아니면 'completed'로 간주!
-
-df_item['item_type'] = df_item['name'].apply(classify_item)
-
 
 # --------------------------------------------------------------------------
 # --- '초 필사적인 2단계: 방어 아이템 ('is_defensive') 분류를 위한 방템 리스트 정의 ---
 # '초 강력한 네 기준에 따른 방템 (TFT 공식 영어 이름)' 리스트!
-# 이 부분도 '수동 정의'가 필요하며, 'TFT 공식 명칭'과 '초 필사적인 대소문자, 띄어쓰기'가 정확히 일치해야 해!
+# 이 부분도 '수동 정의'가 필요하며, 이름은 TFT_Name_Search 색인으로 아이템 ID 를 찾는다!
 defensive_items = [
     "Guardian Angel",          # 수호천사
     "Titan's Resolve",         # 거인의 결의
@@ -48,13 +37,37 @@ defensive_items = [
     # ... '초 필사적인 네가 정의하는 모든 방어 아이템' 이름들을 여기에 정확히 추가!
 ]
 
-df_item['is_defensive'] = df_item['name'].isin(defensive_items)
 
 
-# --------------------------------------------------------------------------
-# --- '초 필사적인 3단계: 통합 분류 완료된 df_item을 새로운 CSV 파일로 저장 ---
-output_categorized_filename = 'TFT_Item_Categorized_Version.csv'
-df_item.to_csv(output_categorized_filename, index=False)
+def classify_items(df_item: pd.DataFrame, component_items=component_items, defensive_items=defensive_items) -> pd.DataFrame:
+    """
+    원본 아이템 DataFrame (id, name) 에 'item_type', 'is_defensive' 컬럼을 붙인 새 DataFrame 을 반환합니다.
+    목록을 인자로 받으므로 파이프라인(TFT_Analysis_Pipeline)에서 방템 목록만 바꿔서 다시 분류할 수 있습니다.
+    목록의 이름은 TFT_Name_Search 색인(resolve)으로 아이템 ID 를 찾으므로 대소문자, 띄어쓰기, 따옴표가 달라도 되고 한글 이름도 됩니다
+    (예: "titans resolve", '거인의 결의'). 오타는 허용하지 않으며, 찾지 못한 이름이 있으면 ValueError.
+    """
+    name_index = build_name_index(df_item)
+    component_ids = list(name_index.resolve_item_ids(component_items).values())
+    defensive_ids = list(name_index.resolve_item_ids(defensive_items).values())
+    df_item = df_item.copy()
+    df_item['item_type'] = df_item['id'].isin(component_ids).map({True: 'component', False: 'completed'})
+    df_item['is_defensive'] = df_item['id'].isin(defensive_ids)
+    return df_item
+
+
+def load_classified_items(file_path_item_raw: str = file_path_item_raw) -> pd.DataFrame:
+    """
+    원본 아이템 CSV 를 읽어서 classify_items 로 분류합니다. 분석 파이프라인의 df_item 단계와 같은 규칙이므로,
+    파이프라인을 쓰지 않는 진입점(스트리밍 / 병렬 / 증분 집계, 각 모듈의 실행 예)도 이 함수로 아이템 분류를 가져옵니다.
+    """
+    return classify_items(pd.read_csv(file_path_item_raw))
+
+
+if __name__ == '__main__':
+    # --------------------------------------------------------------------------
+    # --- '초 필사적인 3단계: 통합 분류 완료된 df_item을 새로운 CSV 파일로 저장 ---
+    df_item = load_classified_items()
+    df_item.to_csv(output_categorized_filename, index=False)
 
 # --- [정보] 파일 저장 확인 (실행 시 원하는 경우 주석 해제)
 # print(f"\n--- [정보] 통합 분류 완료된 '{output_categorized_filename}' 파일 저장 완료! ---")
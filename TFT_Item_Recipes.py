@@ -0,0 +1,162 @@
+import sys
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from TFT_Champion_Registry import normalize_champion_name, normalize_champion_names
+from TFT_Item_Catalog import ItemCatalog, load_item_catalog
+from TFT_Match_Cache import MatchArrays, load_match_arrays
+
+# ----------------------------------------------------------------------------------------------------
+# 아이템 조합법(레시피) 표: 완성 아이템 → 재료(기본 아이템) 개수 벡터 / 비트셋
+#    - 문제 정의: TFT_Item_CurrentVersion.py 는 손으로 적은 component_items 목록으로 기본/완성만 나눌 뿐,
+#                 완성 아이템이 어떤 재료로 만들어졌는지는 어디에도 없습니다.
+#    - 해결 목표: 아이템 CSV 의 ID 규칙(기본 아이템 1~9, 완성 아이템 = 10 × a + b, a <= b)으로
+#                 카탈로그 코드마다 재료 개수 벡터(recipe_counts, 코드 × 기본 아이템)와 재료 비트셋(component_bits)을 미리 만듭니다.
+#                 보드의 아이템 슬롯 전체를 recipe_counts[코드] 로 한 번에 펼치고, 누적합 차이로 보드별 재료 수요를 구하므로
+#                 "Vi 빌드에 쇠사슬 조끼가 몇 개 들어갔나" 같은 질문이 데이터 전체에 대해 배열 연산 한 번입니다.
+#    - 기본 아이템 자체는 자기 자신 1개로 셉니다 (include_components=False 로 끄면 완성 아이템의 재료만 셈).
+#      규칙으로 분해할 수 없는 ID(카탈로그에 없는 재료, 카탈로그 밖 아이템)는 0 벡터입니다.
+# ----------------------------------------------------------------------------------------------------
+
+
+def recipe_of(item_id: int) -> tuple:
+    """
+    아이템 ID → 재료 ID 튜플. 기본 아이템(1~9)은 (자기 자신,), 완성 아이템 ab (1 <= a <= b <= 9)는 (a, b),
+    규칙에 맞지 않으면 빈 튜플.
+    """
+    item_id = int(item_id)
+    if 1 <= item_id <= 9:
+        return (item_id,)
+    first, second = divmod(item_id, 10)
+    if 1 <= first <= second <= 9:
+        return (first, second)
+    return ()
+
+
+@dataclass
+class ItemRecipeTable:
+    """
+    카탈로그 코드별 재료 개수 벡터와 재료 비트셋.
+    recipe_counts / component_bits 의 마지막 칸은 알 수 없는 아이템(코드 -1)용 0 입니다 (ItemCatalog 와 같은 규칙).
+    """
+    item_catalog: ItemCatalog
+    component_ids: np.ndarray     # 열 번호 → 기본 아이템 ID
+    component_names: list         # 열 번호 → 기본 아이템 이름
+    recipe_counts: np.ndarray     # (카탈로그 아이템 수 + 1, 기본 아이템 수) uint8
+    component_bits: np.ndarray    # 코드 → 재료 비트셋 (uint16, 비트 번호 = 열 번호)
+    column_of_id: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.column_of_id:
+            self.column_of_id = {int(item_id): column for column, item_id in enumerate(self.component_ids)}
+
+    def column_of(self, component) -> int:
+        """기본 아이템 ID 또는 이름 → 열 번호 (없으면 KeyError)."""
+        if isinstance(component, str):
+            return self.component_names.index(component)
+        return self.column_of_id[int(component)]
+
+    def counts_of(self, item_ids) -> np.ndarray:
+        """아이템 ID 배열 → 재료 개수 벡터 배열 (길이 × 기본 아이템 수)."""
+        return self.recipe_counts[self.item_catalog.encode(item_ids)]
+
+    def recipe_frame(self) -> pd.DataFrame:
+        """코드별 (id, name, 재료 개수 열들) 표. 분해되지 않는 아이템은 모든 열이 0 입니다."""
+        df_recipe = pd.DataFrame(self.recipe_counts[:-1], columns=self.component_names)
+        df_recipe.insert(0, 'name', self.item_catalog.names[:-1])
+        df_recipe.insert(0, 'id', self.item_catalog.ids)
+        return df_recipe
+
+    def items_containing(self, component) -> np.ndarray:
+        """재료로 component 를 쓰는 카탈로그 아이템 ID 배열 (비트셋 AND 한 번)."""
+        bit = np.uint16(1 << self.column_of(component))
+        return self.item_catalog.ids[(self.component_bits[:-1] & bit) != 0]
+
+
+def build_item_recipe_table(item_catalog: ItemCatalog, include_components: bool = True) -> ItemRecipeTable:
+    """
+    카탈로그의 아이템 ID 규칙으로 재료 표를 만듭니다. 재료 열은 카탈로그의 기본 아이템(ITEM_COMPONENT)을 ID 순서로 씁니다.
+    Args:
+        include_components (bool): True 면 기본 아이템 슬롯도 자기 자신 1개로 셉니다.
+    """
+    is_component = item_catalog.is_component[:-1]
+    component_ids = item_catalog.ids[is_component]
+    column_of_id = {int(item_id): column for column, item_id in enumerate(component_ids)}
+    if len(component_ids) > 16:
+        raise ValueError(f"기본 아이템이 {len(component_ids)}개라 16비트 재료 비트셋에 담을 수 없습니다.")
+
+    n_codes = len(item_catalog.ids)
+    recipe_counts = np.zeros((n_codes + 1, len(component_ids)), dtype=np.uint8)
+    for code, item_id in enumerate(item_catalog.ids.tolist()):
+        if is_component[code] and not include_components:
+            continue
+        recipe = recipe_of(item_id)
+        if is_component[code] or len(recipe) == 2:
+            if all(component_id in column_of_id for component_id in recipe):
+                for component_id in recipe:
+                    recipe_counts[code, column_of_id[component_id]] += 1
+
+    powers = (1 << np.arange(len(component_ids))).astype(np.uint16)
+    component_bits = ((recipe_counts > 0).astype(np.uint16) * powers).sum(axis=1).astype(np.uint16)
+    return ItemRecipeTable(
+        item_catalog=item_catalog, component_ids=component_ids,
+        component_names=list(item_catalog.names[:-1][is_component]),
+        recipe_counts=recipe_counts, component_bits=component_bits, column_of_id=column_of_id,
+    )
+
+
+def board_component_demand(match_arrays: MatchArrays, recipe_table: ItemRecipeTable) -> np.ndarray:
+    """
+    보드마다 장착 아이템을 재료로 분해한 개수 (보드 수 × 기본 아이템 수, int32).
+    모든 슬롯의 재료 벡터를 한 번에 만들고, item_offsets 의 누적합 차이로 보드별 합계를 구합니다.
+    """
+    slot_counts = recipe_table.counts_of(np.asarray(match_arrays.item_ids))
+    cumulative = np.zeros((len(slot_counts) + 1, slot_counts.shape[1]), dtype=np.int64)
+    np.cumsum(slot_counts, axis=0, out=cumulative[1:])
+    item_offsets = np.asarray(match_arrays.item_offsets)
+    return (cumulative[item_offsets[1:]] - cumulative[item_offsets[:-1]]).astype(np.int32)
+
+
+def champion_component_demand(match_arrays: MatchArrays, recipe_table: ItemRecipeTable, champions=None,
+                              board_demand: np.ndarray = None) -> pd.DataFrame:
+    """
+    챔피언별 재료 수요 합계 (index: 정규화된 챔피언 키, 열: 기본 아이템 이름).
+    Args:
+        champions: 남길 챔피언 목록. None 이면 모든 챔피언.
+        board_demand (np.ndarray): board_component_demand 결과를 이미 갖고 있으면 넘겨서 재사용.
+    """
+    if board_demand is None:
+        board_demand = board_component_demand(match_arrays, recipe_table)
+    champion_keys = normalize_champion_names(np.asarray(match_arrays.champion_names, dtype=object))
+    key_codes, key_uniques = pd.factorize(pd.Series(champion_keys, dtype=object))
+    board_key = key_codes[np.asarray(match_arrays.board_champion)] if len(key_codes) else np.zeros(0, dtype=np.int64)
+
+    n_keys = len(key_uniques)
+    totals = np.column_stack([
+        np.bincount(board_key, weights=board_demand[:, column], minlength=n_keys) for column in range(board_demand.shape[1])
+    ]).astype(np.int64) if n_keys else np.zeros((0, board_demand.shape[1]), dtype=np.int64)
+    df_demand = pd.DataFrame(totals, index=pd.Index(np.asarray(key_uniques, dtype=object), name='champion'),
+                             columns=recipe_table.component_names)
+    if champions is not None:
+        df_demand = df_demand.reindex([normalize_champion_name(name) for name in champions], fill_value=0)
+    return df_demand
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Item_Recipes.py TFT_Challenger_MatchData.csv VI "Chain Vest"
+    file_path_match = sys.argv[1] if len(sys.argv) > 1 else 'TFT_Challenger_MatchData.csv'
+    target_champion_name = normalize_champion_name(sys.argv[2] if len(sys.argv) > 2 else 'VI')
+    target_component = sys.argv[3] if len(sys.argv) > 3 else 'Chain Vest'
+
+    recipe_table = build_item_recipe_table(load_item_catalog())
+    df_demand = champion_component_demand(load_match_arrays(file_path_match), recipe_table)
+    print(f"✅ 재료 표: 아이템 {len(recipe_table.item_catalog.ids)}개 × 기본 아이템 {len(recipe_table.component_ids)}개")
+    print(f"    - '{target_component}' 가 들어가는 아이템: {', '.join(recipe_table.item_catalog.names_of(recipe_table.items_containing(target_component)))}")
+
+    if target_champion_name in df_demand.index:
+        print(f"\n--- {target_champion_name} 빌드의 재료 수요 (기본 아이템 개수) ---")
+        print(df_demand.loc[target_champion_name].sort_values(ascending=False).to_string())
+    print(f"\n--- '{target_component}' 를 가장 많이 쓴 챔피언 TOP 10 ---")
+    print(df_demand[target_component].sort_values(ascending=False).head(10).to_string())
@@ -0,0 +1,225 @@
+import gc
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from TFT_Match_Canonical import read_match_file
+from TFT_Match_Parser import ROW_MISSING, parse_champion_arrays
+from TFT_Match_Store import open_array_store, write_array_store
+
+# ----------------------------------------------------------------------------------------------------
+# 파싱된 매치 데이터의 컬럼형 디스크 캐시 (TFT_Match_Store 파일 하나)
+#    - 문제 정의: 'vi projcet.py' 를 실행할 때마다 TFT_Challenger_MatchData.csv 를 pd.read_csv 로 다시 읽고
+#                 중첩된 'champion' 문자열을 전부 다시 파싱해야 분석을 시작할 수 있습니다.
+#    - 해결 목표: 펼쳐진 (게임, 챔피언, 별, 아이템) 테이블과 gameId / ingameDuration 컬럼을 저장소 파일 하나(.tftstore)로 저장하고,
+#                 다음 실행부터는 np.memmap 으로 파싱 없이 바로 불러옵니다. (여러 프로세스가 열어도 페이지 캐시의 한 벌을 함께 씀)
+#                 원본 CSV 의 크기/수정 시각이 바뀌면 해시를 비교해서, 내용이 달라졌을 때만 다시 만듭니다.
+# ----------------------------------------------------------------------------------------------------
+
+CACHE_FORMAT_VERSION = 4
+MANIFEST_FILE_NAME = 'manifest.json'
+STORE_FILE_NAME = 'match_arrays.tftstore'
+ARRAY_NAMES = [
+    'game_ids', 'durations', 'placements',
+    'board_game', 'board_champion', 'board_star', 'item_offsets', 'item_ids',
+    'champion_names', 'row_status',
+]
+
+
+@dataclass
+class MatchArrays:
+    """
+    캐시에서 불러온 (또는 새로 파싱한) 매치 데이터 배열 묶음.
+    게임 단위 배열은 길이가 게임 수, board_* 배열은 길이가 (게임, 챔피언) 수입니다.
+    아이템은 CSR 형태: i번째 보드의 아이템은 item_ids[item_offsets[i]:item_offsets[i + 1]].
+    """
+    game_ids: np.ndarray        # 게임 ID (정수 또는 고정 길이 문자열)
+    durations: np.ndarray       # ingameDuration (float64, 없으면 NaN)
+    placements: np.ndarray      # 최종 순위 Ranked (int8, 1 = 1등, 없으면 -1)
+    board_game: np.ndarray      # 보드가 속한 게임의 위치 (int32)
+    board_champion: np.ndarray  # champion_names 에 대한 챔피언 코드 (int16)
+    board_star: np.ndarray      # 별 개수 (int8, 없으면 -1)
+    item_offsets: np.ndarray    # 보드별 아이템 시작 위치 (int32, 슬롯이 2^31 개 이상이면 int64, 길이 보드 수 + 1)
+    item_ids: np.ndarray        # 아이템 ID (int16, 정수가 아니면 -1)
+    champion_names: np.ndarray  # 챔피언 코드 → 원본 챔피언 이름
+    row_status: np.ndarray      # 게임(행)별 'champion' 디코딩 결과 (int8, TFT_Match_Parser.ROW_*)
+
+    def games_frame(self) -> pd.DataFrame:
+        """게임 단위 (gameId, ingameDuration) DataFrame."""
+        return pd.DataFrame({'gameId': self.game_ids, 'ingameDuration': self.durations})
+
+    def board_frame(self) -> pd.DataFrame:
+        """
+        `parse_champion_column` 과 같은 (gameId, champion, star, item_ids) DataFrame을 만듭니다.
+        champion 컬럼은 캐시의 챔피언 코드를 그대로 쓰는 categorical 입니다.
+        """
+        flat_items = self.item_ids.tolist()
+        offsets = self.item_offsets.tolist()
+        # 작은 리스트를 수백만 개 만들 때 GC 가 반복해서 도는 것을 막기 위해 잠시 끔
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            item_lists = [flat_items[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        star = pd.array(self.board_star, dtype='Int8')
+        star[self.board_star < 0] = pd.NA
+        return pd.DataFrame({
+            'gameId': np.asarray(self.game_ids)[self.board_game],
+            'champion': pd.Categorical.from_codes(self.board_champion, categories=pd.Index(self.champion_names, dtype=object)),
+            'star': star,
+            'item_ids': item_lists,
+        })
+
+
+def build_match_arrays(df_match: pd.DataFrame) -> MatchArrays:
+    """
+    매치 DataFrame (gameId, ingameDuration, Ranked, champion) 을 파싱해서 MatchArrays 로 변환합니다.
+    """
+    parsed = parse_champion_arrays(df_match['champion'].tolist() if 'champion' in df_match.columns else [])
+    champion_codes, champion_names = pd.factorize(parsed['champion'])
+
+    game_ids = df_match['gameId'] if 'gameId' in df_match.columns else pd.Series(np.arange(len(df_match)))
+    if pd.api.types.is_integer_dtype(game_ids.dtype):
+        game_ids = game_ids.to_numpy(dtype=np.int64)
+    else:
+        game_ids = game_ids.astype(str).to_numpy(dtype=str)
+    if 'ingameDuration' in df_match.columns:
+        durations = pd.to_numeric(df_match['ingameDuration'], errors='coerce').to_numpy(dtype=np.float64)
+    else:
+        durations = np.full(len(df_match), np.nan)
+    if 'Ranked' in df_match.columns:
+        placements = pd.to_numeric(df_match['Ranked'], errors='coerce').fillna(-1).to_numpy(dtype=np.int8)
+    else:
+        placements = np.full(len(df_match), -1, dtype=np.int8)
+
+    item_offsets = parsed['item_offsets']
+    if item_offsets[-1] <= np.iinfo(np.int32).max: # 슬롯 수가 int32 범위면 오프셋도 int32 로 (보드당 4바이트 절약)
+        item_offsets = item_offsets.astype(np.int32)
+    item_ids = parsed['item_ids']
+    item_ids = np.where((item_ids >= np.iinfo(np.int16).min) & (item_ids <= np.iinfo(np.int16).max), item_ids, -1)
+    return MatchArrays(
+        game_ids=game_ids,
+        durations=durations,
+        placements=placements,
+        board_game=parsed['match_row'].astype(np.int32),
+        board_champion=champion_codes.astype(np.int16),
+        board_star=parsed['star'],
+        item_offsets=item_offsets,
+        item_ids=item_ids.astype(np.int16),
+        champion_names=np.asarray(champion_names, dtype=str),
+        row_status=parsed['row_status'] if 'champion' in df_match.columns else np.full(len(df_match), ROW_MISSING, dtype=np.int8),
+    )
+
+
+def file_sha256(file_path: str, block_size: int = 1 << 20) -> str:
+    """파일 내용의 sha256 (캐시 무효화 판단용)."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as source:
+        for block in iter(lambda: source.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def default_cache_dir(file_path_match: str) -> str:
+    # 'TFT_Challenger_MatchData.csv' → 'TFT_Challenger_MatchData.cache'
+    return os.path.splitext(file_path_match)[0] + '.cache'
+
+
+def _source_stamp(file_path_match: str) -> dict:
+    stat = os.stat(file_path_match)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _read_manifest(cache_dir: str):
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_FILE_NAME), encoding='utf-8') as manifest_file:
+            return json.load(manifest_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _write_manifest(cache_dir: str, manifest: dict) -> None:
+    with open(os.path.join(cache_dir, MANIFEST_FILE_NAME), 'w', encoding='utf-8') as manifest_file:
+        json.dump(manifest, manifest_file, ensure_ascii=False, indent=2)
+
+
+def is_cache_fresh(file_path_match: str, cache_dir: str = None, verify_hash: bool = False) -> bool:
+    """
+    캐시가 원본 CSV 와 같은 내용으로 만들어졌는지 확인합니다.
+    크기와 수정 시각이 같으면 그대로 유효(verify_hash=True 면 해시까지 비교)하고,
+    다르면 해시를 비교해서 내용이 같을 때는 manifest 의 크기/수정 시각만 갱신합니다.
+    """
+    cache_dir = cache_dir or default_cache_dir(file_path_match)
+    manifest = _read_manifest(cache_dir)
+    if not manifest or manifest.get('format_version') != CACHE_FORMAT_VERSION:
+        return False
+    if not os.path.exists(os.path.join(cache_dir, STORE_FILE_NAME)):
+        return False
+
+    stamp = _source_stamp(file_path_match)
+    same_stamp = stamp['size'] == manifest.get('size') and stamp['mtime_ns'] == manifest.get('mtime_ns')
+    if same_stamp and not verify_hash:
+        return True
+    if stamp['size'] != manifest.get('size'):
+        return False
+    if file_sha256(file_path_match) != manifest.get('sha256'):
+        return False
+
+    # 내용은 같고 수정 시각만 바뀐 경우 (복사, touch 등) → 다음 확인이 빠르도록 기록만 갱신
+    if not same_stamp:
+        manifest.update(stamp)
+        _write_manifest(cache_dir, manifest)
+    return True
+
+
+def save_match_arrays(match_arrays: MatchArrays, cache_dir: str, manifest: dict) -> None:
+    """MatchArrays 를 저장소 파일 하나와 manifest.json 으로 저장합니다. (임시 폴더에 쓴 뒤 교체)"""
+    temp_dir = cache_dir + '.tmp'
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    os.makedirs(temp_dir)
+    write_array_store(os.path.join(temp_dir, STORE_FILE_NAME), {name: getattr(match_arrays, name) for name in ARRAY_NAMES},
+                      metadata={'source': manifest.get('source'), 'sha256': manifest.get('sha256')})
+    _write_manifest(temp_dir, manifest)
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.replace(temp_dir, cache_dir)
+
+
+def open_match_arrays(cache_dir: str) -> MatchArrays:
+    """캐시 폴더의 저장소 파일을 np.memmap(읽기 전용)으로 엽니다. 파싱/복사 없이 바로 반환됩니다."""
+    arrays, _ = open_array_store(os.path.join(cache_dir, STORE_FILE_NAME))
+    return MatchArrays(**{name: arrays[name] for name in ARRAY_NAMES})
+
+
+def load_match_arrays(file_path_match: str, cache_dir: str = None, verify_hash: bool = False, rebuild: bool = False) -> MatchArrays:
+    """
+    매치 CSV 의 파싱 결과를 캐시에서 불러옵니다. 캐시가 없거나 원본이 바뀌었으면 다시 파싱해서 저장합니다.
+    Args:
+        file_path_match (str): TFT_Challenger_MatchData.csv 경로 (TFT_Match_Canonical 로 만든 .jsonl 도 가능).
+        cache_dir (str): 캐시 폴더. 기본값은 CSV 옆의 '<파일이름>.cache'.
+        verify_hash (bool): True 면 크기/수정 시각이 같아도 원본 해시까지 비교합니다.
+        rebuild (bool): True 면 캐시 상태와 상관없이 다시 만듭니다.
+    Returns:
+        MatchArrays: 메모리 매핑된 배열 묶음.
+    """
+    cache_dir = cache_dir or default_cache_dir(file_path_match)
+    if rebuild or not is_cache_fresh(file_path_match, cache_dir, verify_hash=verify_hash):
+        stamp = _source_stamp(file_path_match)
+        df_match = read_match_file(file_path_match, columns=('gameId', 'ingameDuration', 'Ranked', 'champion'))
+        manifest = {
+            'format_version': CACHE_FORMAT_VERSION,
+            'source': os.path.abspath(file_path_match),
+            'sha256': file_sha256(file_path_match),
+            'n_games': len(df_match),
+            **stamp,
+        }
+        match_arrays = build_match_arrays(df_match)
+        manifest['n_boards'] = len(match_arrays.board_game)
+        save_match_arrays(match_arrays, cache_dir, manifest)
+    return open_match_arrays(cache_dir)
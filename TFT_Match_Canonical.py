@@ -0,0 +1,105 @@
+import itertools
+import os
+import sys
+
+import pandas as pd
+
+from TFT_Match_Parser import DECODE_COUNTERS, decode_champion_strings, get_json_backend
+
+# ----------------------------------------------------------------------------------------------------
+# 매치 데이터를 엄격한 JSON Lines 로 한 번만 바꿔 두기 (canonicalize)
+#    - 문제 정의: 원본 CSV 의 'champion' 문자열은 JSON 과 파이썬 리터럴이 섞여 있어서, 읽을 때마다 형식을 판별하고
+#                 리터럴 행을 JSON 으로 바꾸고, 그래도 안 되는 행은 ast.literal_eval 로 처리해야 합니다.
+#    - 해결 목표: 원본을 한 번 읽어서 한 줄에 매치 하나인 JSON Lines(.jsonl) 파일로 다시 씁니다.
+#                 'champion' 은 문자열이 아니라 중첩 객체로 들어가므로 이후에는 문자열 디코딩이 필요 없습니다.
+#                 (NaN 은 null, 어떤 방법으로도 읽을 수 없던 'champion' 도 null 로 쓰고 개수를 알려줌)
+#                 read_match_file 은 확장자(.csv / .jsonl)를 보고 알맞게 읽으므로, 캐시/스트리밍 경로에 .jsonl 을 그대로 줄 수 있습니다.
+#    - 바이트 범위로 나눠 읽는 TFT_Match_Parallel / TFT_Match_Incremental 은 CSV 만 지원합니다.
+# ----------------------------------------------------------------------------------------------------
+
+JSON_LINES_SUFFIXES = ('.jsonl', '.ndjson')
+CANONICAL_CHUNK_SIZE = 50000
+
+
+def is_json_lines(file_path: str) -> bool:
+    """확장자가 .jsonl / .ndjson 이면 True."""
+    return file_path.lower().endswith(JSON_LINES_SUFFIXES)
+
+
+def read_match_file(file_path_match: str, columns=None, chunksize: int = None):
+    """
+    매치 파일을 읽습니다. CSV 는 pd.read_csv, JSON Lines 는 줄을 묶어서 JSON 백엔드로 읽습니다.
+    Args:
+        columns: 남길 컬럼 이름들 (없는 컬럼은 무시). None 이면 모든 컬럼.
+        chunksize (int): 주면 DataFrame 청크를 내보내는 이터레이터를 반환합니다.
+    Returns:
+        pd.DataFrame 또는 청크 이터레이터.
+    """
+    if not is_json_lines(file_path_match):
+        usecols = None if columns is None else (lambda column: column in columns)
+        return pd.read_csv(file_path_match, usecols=usecols, chunksize=chunksize)
+    chunks = _iter_json_lines_chunks(file_path_match, columns, chunksize or CANONICAL_CHUNK_SIZE)
+    if chunksize is not None:
+        return chunks
+    df_chunks = list(chunks)
+    if not df_chunks:
+        return pd.DataFrame(columns=list(columns or []))
+    return pd.concat(df_chunks, ignore_index=True) if len(df_chunks) > 1 else df_chunks[0]
+
+
+def _iter_json_lines_chunks(file_path_match: str, columns, chunksize: int):
+    # 줄 chunksize 개를 '[줄,줄,...]' 로 이어 붙여서 JSON 백엔드로 한 번에 디코딩합니다.
+    # (pd.read_json 보다 빠르고, 실수 값도 원본 CSV 를 읽은 것과 똑같이 되살림)
+    loads = get_json_backend().loads
+    with open(file_path_match, encoding='utf-8') as in_file:
+        while True:
+            lines = [line for line in itertools.islice(in_file, chunksize) if line.strip()]
+            if not lines:
+                return
+            df_chunk = pd.DataFrame.from_records(loads('[' + ','.join(lines) + ']'))
+            if columns is not None:
+                df_chunk = df_chunk[[column for column in df_chunk.columns if column in columns]]
+            yield df_chunk
+
+
+def canonical_file_path(file_path_match: str) -> str:
+    """'TFT_Challenger_MatchData.csv' → 'TFT_Challenger_MatchData.jsonl'"""
+    return os.path.splitext(file_path_match)[0] + JSON_LINES_SUFFIXES[0]
+
+
+def canonicalize_match_file(file_path_match: str, output_path: str = None, chunksize: int = CANONICAL_CHUNK_SIZE) -> dict:
+    """
+    매치 CSV 를 엄격한 JSON Lines 로 다시 씁니다. 청크 단위로 읽고 쓰므로 메모리 사용량이 일정합니다.
+    Args:
+        file_path_match (str): 원본 매치 CSV.
+        output_path (str): 출력 경로. 기본값은 같은 이름의 .jsonl.
+    Returns:
+        dict: {'output_path', 'rows', 'champion_missing' (NaN/빈 값), 'champion_failed' (읽을 수 없어 null 로 쓴 행)}
+    """
+    output_path = output_path or canonical_file_path(file_path_match)
+    dumps = get_json_backend().dumps
+    summary = {'output_path': output_path, 'rows': 0, 'champion_missing': 0, 'champion_failed': 0}
+    failed_before = DECODE_COUNTERS['failed']
+
+    with open(output_path + '.tmp', 'w', encoding='utf-8', newline='\n') as out_file:
+        for df_chunk in pd.read_csv(file_path_match, chunksize=chunksize):
+            if 'champion' in df_chunk.columns:
+                summary['champion_missing'] += int(df_chunk['champion'].isna().sum())
+                df_chunk['champion'] = decode_champion_strings(df_chunk['champion'].tolist())
+            # NaN → null (to_dict 는 숫자 컬럼의 값을 파이썬 기본 타입으로 돌려줌)
+            records = df_chunk.astype(object).where(df_chunk.notna(), None).to_dict('records')
+            out_file.write('\n'.join(dumps(record) for record in records))
+            if records:
+                out_file.write('\n')
+            summary['rows'] += len(records)
+    os.replace(output_path + '.tmp', output_path)
+    summary['champion_failed'] = DECODE_COUNTERS['failed'] - failed_before
+    return summary
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Match_Canonical.py TFT_Challenger_MatchData.csv TFT_Challenger_MatchData.jsonl
+    file_path_match = sys.argv[1] if len(sys.argv) > 1 else 'TFT_Challenger_MatchData.csv'
+    summary = canonicalize_match_file(file_path_match, sys.argv[2] if len(sys.argv) > 2 else None)
+    print(f"✅ {summary['rows']}행 → '{summary['output_path']}' (JSON 백엔드: {get_json_backend().name})")
+    print(f"    - 'champion' 없음: {summary['champion_missing']}행, 읽을 수 없어 null 로 쓴 행: {summary['champion_failed']}행")
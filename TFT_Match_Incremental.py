@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import sys
+
+import pandas as pd
+
+from TFT_Item_CurrentVersion import load_classified_items
+from TFT_Match_Parallel import parallel_match_stats
+from TFT_Match_Stream import DEFAULT_CHUNK_SIZE, MatchStreamStats
+
+# ----------------------------------------------------------------------------------------------------
+# 새로 추가된 매치만 처리하는 증분(append) 집계
+#    - 문제 정의: 챌린저 덤프가 커질 때마다 TFT_Challenger_MatchData.csv 전체를 다시 읽고 다시 파싱합니다.
+#                 하루치 갱신이 전체 기록 크기에 비례하는 시간이 걸립니다.
+#    - 해결 목표: 집계 결과(MatchStreamStats: 픽 수, 아이템 수, ingameDuration 합계/개수)와 함께
+#                 '어디까지 처리했는지'(파일 바이트 위치 = high-water mark)를 상태 파일(JSON)에 저장합니다.
+#                 다음 실행에서는 그 위치부터 파일 끝까지(새로 붙은 행)만 파싱해서 기존 카운터에 더합니다.
+#    - 안전장치: 헤더가 바뀌었거나, 파일이 처리 위치보다 짧아졌거나, 처리 위치 바로 앞 바이트가 달라졌으면
+#                (파일이 덧붙이기가 아니라 새로 쓰인 경우) 처음부터 다시 집계합니다.
+#                마지막 줄이 아직 줄바꿈으로 끝나지 않았으면(쓰는 중) 그 줄은 다음 실행으로 미룹니다.
+# ----------------------------------------------------------------------------------------------------
+
+STATE_FORMAT_VERSION = 1
+TAIL_CHECK_BYTES = 4096 # 처리 위치 바로 앞에서 비교하는 바이트 수 (파일 전체 해시 대신)
+
+
+def default_state_path(file_path_match: str) -> str:
+    # 'TFT_Challenger_MatchData.csv' → 'TFT_Challenger_MatchData.stats.json'
+    return os.path.splitext(file_path_match)[0] + '.stats.json'
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _read_header_and_tail(file_path_match: str, offset: int) -> tuple:
+    # (헤더 줄, 헤더 끝 위치, offset 바로 앞 TAIL_CHECK_BYTES 바이트)
+    with open(file_path_match, 'rb') as source:
+        header = source.readline()
+        body_start = source.tell()
+        tail_start = max(body_start, offset - TAIL_CHECK_BYTES)
+        source.seek(tail_start)
+        tail = source.read(max(offset - tail_start, 0))
+    return header, body_start, tail
+
+
+def _complete_lines_end(file_path_match: str, start: int) -> int:
+    # start 이후 마지막 줄바꿈 바로 다음 위치 (줄바꿈으로 끝나지 않은 마지막 줄은 제외)
+    file_size = os.path.getsize(file_path_match)
+    with open(file_path_match, 'rb') as source:
+        position = file_size
+        while position > start:
+            block_start = max(start, position - 65536)
+            source.seek(block_start)
+            block = source.read(position - block_start)
+            newline = block.rfind(b'\n')
+            if newline >= 0:
+                return block_start + newline + 1
+            position = block_start
+    return start
+
+
+def _read_state(state_path: str):
+    try:
+        with open(state_path, encoding='utf-8') as state_file:
+            return json.load(state_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _write_state(state_path: str, state: dict) -> None:
+    # 임시 파일에 쓴 뒤 교체 (도중에 중단되어도 이전 상태가 남음)
+    temp_path = state_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as state_file:
+        json.dump(state, state_file, ensure_ascii=False)
+    os.replace(temp_path, state_path)
+
+
+def update_match_stats(file_path_match: str, state_path: str = None, df_item: pd.DataFrame = None, champions=None,
+                       item_types=None, workers: int = 1, chunksize: int = DEFAULT_CHUNK_SIZE, rebuild: bool = False) -> tuple:
+    """
+    저장된 집계 결과에 지난 실행 이후 CSV 에 덧붙은 행만 더해서 갱신합니다.
+    Args:
+        file_path_match (str): 매치 CSV 경로.
+        state_path (str): 상태 파일 경로. 기본값은 CSV 옆의 '<파일이름>.stats.json'.
+        df_item, champions, item_types: `stream_match_stats` 와 같은 집계 옵션. 상태 파일과 옵션이 다르면 처음부터 다시 집계합니다.
+        workers (int): 새 구간을 나눠서 처리할 워커 프로세스 수 (기본 1 = 현재 프로세스).
+        chunksize (int): 한 번에 읽을 행 수.
+        rebuild (bool): True 면 상태 파일을 무시하고 처음부터 다시 집계합니다.
+    Returns:
+        tuple: (MatchStreamStats 전체 누적 결과, 이번에 새로 처리한 매치 행 수)
+    """
+    state_path = state_path or default_state_path(file_path_match)
+    options = {
+        'champions': None if champions is None else sorted(champions),
+        'item_types': None if item_types is None else sorted(item_types),
+        'items': None if df_item is None else _digest(df_item.to_csv(index=False).encode('utf-8')),
+    }
+    state = None if rebuild else _read_state(state_path)
+
+    header, body_start, _ = _read_header_and_tail(file_path_match, 0)
+    offset = body_start
+    stats = MatchStreamStats()
+    if state and state.get('format_version') == STATE_FORMAT_VERSION and state.get('options') == options:
+        saved_offset = state['offset']
+        if saved_offset <= os.path.getsize(file_path_match):
+            saved_header, _, tail = _read_header_and_tail(file_path_match, saved_offset)
+            if _digest(saved_header) == state['header_sha256'] and _digest(tail) == state['tail_sha256']:
+                offset = saved_offset
+                stats = MatchStreamStats.from_dict(state['stats'])
+
+    end = _complete_lines_end(file_path_match, offset)
+    new_stats = MatchStreamStats()
+    if end > offset:
+        new_stats = parallel_match_stats(file_path_match, df_item=df_item, champions=champions, item_types=item_types,
+                                         workers=workers, chunksize=chunksize, start=offset, end=end)
+        stats.merge(new_stats)
+
+    _, _, tail = _read_header_and_tail(file_path_match, end)
+    _write_state(state_path, {
+        'format_version': STATE_FORMAT_VERSION,
+        'source': os.path.abspath(file_path_match),
+        'options': options,
+        'offset': end,
+        'header_sha256': _digest(header),
+        'tail_sha256': _digest(tail),
+        'stats': stats.to_dict(),
+    })
+    return stats, new_stats.games
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Match_Incremental.py TFT_Challenger_MatchData.csv
+    file_path_match = sys.argv[1] if len(sys.argv) > 1 else 'TFT_Challenger_MatchData.csv'
+    df_item = load_classified_items() # 분석 파이프라인과 같은 아이템 분류
+
+    stats, new_games = update_match_stats(file_path_match, df_item=df_item, item_types=['completed'])
+    print(f"✅ 증분 집계 완료: 새 매치 {new_games}행 추가, 누적 매치 {stats.games}행, (게임, 챔피언) {stats.boards}개")
+    print("\n--- 챔피언 등장 빈도 TOP 10 ---")
+    for rank, (champion_name, count) in enumerate(stats.champion_picks.most_common(10), start=1):
+        print(f"{rank:<4} | {champion_name:<15} | {count}")
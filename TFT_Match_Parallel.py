@@ -0,0 +1,117 @@
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from TFT_Item_CurrentVersion import load_classified_items
+from TFT_Match_Stream import (
+    DEFAULT_CHUNK_SIZE, STREAM_COLUMNS, MatchStreamStats,
+    aggregate_chunks, filter_chunks, map_item_ids, parse_chunks, stream_match_stats,
+)
+
+# ----------------------------------------------------------------------------------------------------
+# 여러 CPU 코어를 쓰는 프로세스 병렬 파싱/집계
+#    - 문제 정의: 'champion' 문자열 파싱(json / ast)은 순수 파이썬 CPU 작업이라 코어 하나에서만 돌아갑니다.
+#    - 해결 목표: 매치 CSV 를 줄 경계에 맞춘 바이트 구간(shard)으로 나누고, 각 구간을 워커 프로세스가
+#                 TFT_Match_Stream 과 같은 파이프라인(파싱 → 매핑 → 필터 → 집계)으로 처리한 뒤,
+#                 부분 결과(MatchStreamStats)를 합칩니다. 카운터는 순서와 상관없이 더해지므로 직렬 실행과 결과가 같습니다.
+#                 (ingameDuration 합계만 더하는 순서에 따라 부동소수점 끝자리가 다를 수 있습니다.)
+#    - 전제: CSV 한 행은 한 줄입니다. (따옴표 안에 줄바꿈이 있는 행은 지원하지 않습니다.)
+# ----------------------------------------------------------------------------------------------------
+
+# 워커 하나당 나눌 구간 수 (구간마다 처리 시간이 달라도 코어가 놀지 않도록 워커 수보다 잘게 나눔)
+SHARDS_PER_WORKER = 4
+
+
+def split_byte_ranges(file_path_match: str, n_shards: int, start: int = None, end: int = None) -> list:
+    """
+    헤더를 제외한 CSV 본문(또는 줄의 시작인 start 부터 end 까지)을 n_shards 개의 [start, end) 바이트 구간으로 나눕니다.
+    모든 구간은 줄의 시작에서 시작해서 다음 구간의 시작(또는 end)에서 끝납니다.
+    """
+    file_size = os.path.getsize(file_path_match) if end is None else end
+    with open(file_path_match, 'rb') as source:
+        source.readline() # 헤더
+        body_start = source.tell() if start is None else max(start, source.tell())
+        boundaries = [body_start]
+        for shard_number in range(1, n_shards):
+            target = body_start + (file_size - body_start) * shard_number // n_shards
+            if target <= boundaries[-1]:
+                continue
+            source.seek(target - 1)
+            source.readline() # target 이 줄 중간이면 그 줄 끝까지 건너뜀
+            position = source.tell()
+            if boundaries[-1] < position < file_size:
+                boundaries.append(position)
+        boundaries.append(file_size)
+    return [(start, end) for start, end in zip(boundaries[:-1], boundaries[1:]) if end > start]
+
+
+def aggregate_byte_range(file_path_match: str, start: int, end: int, df_item: pd.DataFrame = None, champions=None,
+                         item_types=None, chunksize: int = DEFAULT_CHUNK_SIZE) -> MatchStreamStats:
+    """
+    CSV 헤더 + [start, end) 바이트 구간만 읽어서 스트리밍 파이프라인으로 집계합니다.
+    start 는 줄의 시작이어야 합니다 (`split_byte_ranges` 결과, 이전 실행의 처리 위치 등).
+    """
+    with open(file_path_match, 'rb') as source:
+        header = source.readline()
+        source.seek(start)
+        body = source.read(end - start)
+    if not body.strip():
+        return MatchStreamStats()
+    chunks = pd.read_csv(io.BytesIO(header + body), usecols=lambda column: column in STREAM_COLUMNS, chunksize=chunksize)
+    mapped_chunks = map_item_ids(parse_chunks(chunks), df_item)
+    return aggregate_chunks(filter_chunks(mapped_chunks, champions=champions, item_types=item_types))
+
+
+def _aggregate_byte_range(task: tuple) -> MatchStreamStats:
+    # 워커 프로세스: 헤더 + 자기 구간만 읽어서 스트리밍 파이프라인으로 집계
+    return aggregate_byte_range(*task)
+
+
+def parallel_match_stats(file_path_match: str, df_item: pd.DataFrame = None, champions=None, item_types=None,
+                         workers: int = None, chunksize: int = DEFAULT_CHUNK_SIZE, start: int = None, end: int = None) -> MatchStreamStats:
+    """
+    `stream_match_stats` 와 같은 집계를 워커 프로세스 여러 개로 나눠서 실행합니다.
+    Args:
+        file_path_match (str): 매치 CSV 경로.
+        df_item (pd.DataFrame): id, item_type 컬럼을 가진 아이템 분류 데이터 (item_types 필터에 필요).
+        champions: 집계할 챔피언 목록. None 이면 전체.
+        item_types: 셀 아이템 분류 목록 (예: ['completed']). None 이면 전체 아이템.
+        workers (int): 워커 프로세스 수. None 이면 CPU 코어 수, 1 이면 현재 프로세스에서 직렬 실행.
+        chunksize (int): 워커 안에서 한 번에 읽을 행 수.
+        start, end (int): 주면 파일의 [start, end) 바이트 구간만 집계합니다 (start 는 줄의 시작).
+    Returns:
+        MatchStreamStats: 모든 구간의 부분 결과를 합친 카운터.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 and start is None and end is None:
+        return stream_match_stats(file_path_match, df_item=df_item, champions=champions, item_types=item_types, chunksize=chunksize)
+
+    tasks = [
+        (file_path_match, shard_start, shard_end, df_item, champions, item_types, chunksize)
+        for shard_start, shard_end in split_byte_ranges(file_path_match, workers * SHARDS_PER_WORKER, start=start, end=end)
+    ]
+    stats = MatchStreamStats()
+    if workers <= 1: # 구간만 지정한 직렬 실행
+        for task in tasks:
+            stats.merge(_aggregate_byte_range(task))
+        return stats
+    with ProcessPoolExecutor(max_workers=min(workers, max(len(tasks), 1))) as executor:
+        for partial_stats in executor.map(_aggregate_byte_range, tasks):
+            stats.merge(partial_stats)
+    return stats
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Match_Parallel.py TFT_Challenger_MatchData.csv 8
+    file_path_match = sys.argv[1] if len(sys.argv) > 1 else 'TFT_Challenger_MatchData.csv'
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    df_item = load_classified_items() # 분석 파이프라인과 같은 아이템 분류
+
+    stats = parallel_match_stats(file_path_match, df_item=df_item, item_types=['completed'], workers=workers)
+    print(f"✅ 병렬 집계 완료 (워커 {workers or os.cpu_count()}개): 매치 {stats.games}행, (게임, 챔피언) {stats.boards}개")
+    print("\n--- 챔피언 등장 빈도 TOP 10 ---")
+    for rank, (champion_name, count) in enumerate(stats.champion_picks.most_common(10), start=1):
+        print(f"{rank:<4} | {champion_name:<15} | {count}")
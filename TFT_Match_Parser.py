@@ -0,0 +1,399 @@
+import json
+import ast # json.loads 실패 시 문자열 딕셔너리를 파싱하기 위함
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson # 선택 설치: 있으면 JSON 디코딩을 orjson 으로 처리
+except ImportError:
+    orjson = None
+
+# ----------------------------------------------------------------------------------------------------
+# TFT_Challenger_MatchData.csv 의 'champion' 컬럼 공용 파싱 엔진
+#    - 문제 정의: 'vi projcet.py' 와 'Blitzcrank projcet.py' 가 각각 `df.apply(..., axis=1)` 로
+#                 행마다 json.loads → ast.literal_eval 을 호출해서 전체 실행 시간의 대부분을 차지합니다.
+#    - 해결 목표: 'champion' 컬럼 전체를 한 번에 받아서, JSON 으로 읽을 수 있는 행을 모아 json.loads 한 번으로 디코딩하고
+#                 (gameId, champion, star, item_ids) 형태의 평평한 테이블을 한 번의 패스로 만들어 줍니다.
+#    - 디코더 계층: JSON 디코딩은 교체 가능한 백엔드(orjson 이 설치되어 있으면 orjson, 아니면 표준 json)로 합니다.
+#                 파이썬 리터럴 행("{'Vi': ..., True, None}")은 json.loads 실패 → ast.literal_eval 로 두 번 파싱하지 않고,
+#                 정규식 한 번으로 JSON 문자열로 바꾼 뒤(python_literal_to_json) JSON 백엔드로 디코딩합니다.
+#                 묶음(청크)마다 형식(json / python / mixed)을 한 번만 판별해서 행마다 형식을 따지는 일을 줄입니다.
+#                 ast.literal_eval 은 이렇게 바꿀 수 없는 행(\x 이스케이프 등)에만 씁니다.
+# ----------------------------------------------------------------------------------------------------
+
+BOARD_COLUMNS = ['gameId', 'champion', 'star', 'item_ids']
+
+# 한 번에 이어 붙여서 디코딩할 행 수 (잘못된 행이 섞여 있으면 이 묶음만 행 단위로 다시 파싱합니다)
+BULK_DECODE_BATCH_SIZE = 5000
+# 묶음의 형식을 판별할 때 살펴보는 앞쪽 행 수
+FORMAT_SAMPLE_ROWS = 200
+
+# 디코딩 경로별 누적 행 수 (TFT_Profiling 이 단계 전후 차이로 'ast 로 넘어간 행 수' 등을 보고함)
+#   bulk_rows: 이어 붙여서 json.loads 한 번으로 처리한 행, batch_fallbacks: 깨진 행 때문에 행 단위로 다시 처리한 묶음 수,
+#   bulk_fallback_rows: 묶음 디코딩은 됐지만 원소가 dict 가 아니어서 행 단위로 다시 처리한 행,
+#   row_json: 행 단위 json.loads 성공, normalized: 정규식 변환 후 JSON 으로 디코딩한 파이썬 리터럴 행,
+#   ast_fallback: ast.literal_eval 로 넘어간 행, failed: 모두 실패한 행
+DECODE_COUNTERS = Counter()
+
+# parse_champion_arrays 가 행마다 남기는 'champion' 디코딩 결과 (row_status, int8)
+ROW_OK = 0            # 챔피언 dict 로 읽음
+ROW_MISSING = 1       # NaN / 빈 문자열
+ROW_EMPTY = 2         # '{}' (챔피언 없음)
+ROW_UNPARSEABLE = 3   # JSON / 파이썬 리터럴 / ast 모두 실패
+ROW_NOT_DICT = 4      # 읽었지만 dict 가 아님 (리스트, 숫자 등)
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    """JSON 디코딩/인코딩 백엔드. loads 는 실패하면 json.JSONDecodeError(또는 하위 클래스)를 냅니다."""
+    name: str
+    loads: object
+    dumps: object # 객체 → 한 줄짜리 JSON 문자열 (한글 그대로)
+
+
+JSON_BACKENDS = {
+    'json': JsonBackend('json', json.loads, lambda value: json.dumps(value, ensure_ascii=False, separators=(',', ':'))),
+}
+if orjson is not None: # orjson.JSONDecodeError 는 json.JSONDecodeError 의 하위 클래스
+    JSON_BACKENDS['orjson'] = JsonBackend('orjson', orjson.loads, lambda value: orjson.dumps(value).decode('utf-8'))
+_json_backend = JSON_BACKENDS['orjson' if orjson is not None else 'json']
+
+
+def get_json_backend() -> JsonBackend:
+    """지금 쓰고 있는 JSON 백엔드."""
+    return _json_backend
+
+
+def set_json_backend(name: str) -> JsonBackend:
+    """
+    JSON 백엔드를 바꿉니다 ('json' 또는 설치되어 있으면 'orjson'). 벤치마크나 결과 비교용입니다.
+    Returns:
+        JsonBackend: 바뀐 백엔드.
+    """
+    global _json_backend
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"사용할 수 없는 JSON 백엔드: '{name}' (가능: {', '.join(JSON_BACKENDS)})")
+    _json_backend = JSON_BACKENDS[name]
+    return _json_backend
+
+
+def parse_champions_from_match_data(row: pd.Series) -> list:
+    """
+    DataFrame의 단일 행에서 챔피언 이름과 gameId 쌍을 추출합니다. (기존 행 단위 파싱 함수)
+    대량 처리는 `parse_champion_column` 을 사용하고, 이 함수는 호환성과 벤치마크 기준용으로 남겨둡니다.
+    Args:
+        row (pd.Series): 'champion' 컬럼(과 선택적으로 'gameId')을 가진 단일 행.
+    Returns:
+        list: [{'champion': '챔피언이름', 'gameId': ...}, ...] 형태의 리스트.
+              파싱 실패, NaN, 빈 값, dict가 아닌 결과는 빈 리스트를 반환합니다.
+    """
+    if 'champion' not in row:
+        return []
+
+    processed_champion_str = _to_champion_string(row['champion'])
+    if not processed_champion_str:
+        return []
+
+    parsed_champion_data = decode_champion_string(processed_champion_str)
+    if not isinstance(parsed_champion_data, dict):
+        return []
+
+    current_game_id = row.get('gameId', 'UNKNOWN_GAMEID')
+    return [{'champion': champion_name, 'gameId': current_game_id} for champion_name in parsed_champion_data.keys()]
+
+
+def _to_champion_string(raw_champion_data) -> str:
+    # NaN / 리스트 / Series 로 들어오는 값을 단일 문자열로 안전하게 변환 (Blitzcrank 버전과 동일한 규칙)
+    if isinstance(raw_champion_data, str):
+        return raw_champion_data.strip()
+    if isinstance(raw_champion_data, (pd.Series, list)):
+        if len(raw_champion_data) == 0:
+            return ''
+        first_element = raw_champion_data.iloc[0] if isinstance(raw_champion_data, pd.Series) else raw_champion_data[0]
+        return str(first_element).strip()
+    if pd.isna(raw_champion_data):
+        return ''
+    return str(raw_champion_data).strip()
+
+
+# 작은따옴표 문자열 | 큰따옴표 문자열 | True/False/None 을 왼쪽부터 차례로 찾음 (문자열 안의 True 등은 문자열째로 먼저 잡힘)
+_LITERAL_TOKEN = re.compile(r"'((?:[^'\\]|\\.)*)'|\"(?:[^\"\\]|\\.)*\"|\b(True|False|None)\b")
+_LITERAL_WORDS = {'True': 'true', 'False': 'false', 'None': 'null'}
+
+
+def _looks_like_literal(text: str) -> bool:
+    # "{'Vi': ..." 처럼 여는 괄호 다음 글자가 작은따옴표면 파이썬 리터럴로 판단
+    return text[1:3].lstrip()[:1] == "'"
+
+
+def python_literal_to_json(text: str):
+    """
+    파이썬 리터럴 문자열(repr)을 JSON 문자열로 바꿉니다. ast 없이 정규식 한 번으로 처리합니다.
+    작은따옴표 문자열 → 큰따옴표 문자열, True/False/None → true/false/null.
+    Returns:
+        str: JSON 문자열. 안전하게 바꿀 수 없으면(작은따옴표 문자열 안의 \\" 등) None.
+    """
+    # 가장 흔한 경우: 따옴표/역슬래시/True 등이 없으면 작은따옴표만 바꾸면 됨
+    if '"' not in text and '\\' not in text and 'True' not in text and 'False' not in text and 'None' not in text:
+        return text.replace("'", '"')
+
+    convertible = [True]
+
+    def convert(match):
+        if match.group(1) is not None: # 작은따옴표 문자열
+            inner = match.group(1)
+            if '\\"' in inner:
+                convertible[0] = False
+                return match.group(0)
+            return '"' + inner.replace("\\'", "'").replace('"', '\\"') + '"'
+        if match.group(2) is not None:
+            return _LITERAL_WORDS[match.group(2)]
+        return match.group(0) # 큰따옴표 문자열은 그대로
+
+    converted = _LITERAL_TOKEN.sub(convert, text)
+    return converted if convertible[0] else None
+
+
+def detect_champion_format(texts, sample_rows: int = FORMAT_SAMPLE_ROWS) -> str:
+    """
+    'champion' 문자열 묶음의 형식을 앞쪽 sample_rows 개의 값 있는 행으로 한 번만 판별합니다.
+    Returns:
+        str: 'json' (모두 JSON), 'python' (모두 파이썬 리터럴), 'mixed', 'empty' (값 있는 행 없음).
+    """
+    kinds = set()
+    checked = 0
+    for text in texts:
+        if not text or text[0] != '{' or text[-1] != '}' or text[1:3].lstrip()[:1] not in ('"', "'"):
+            continue # '{}' 처럼 키가 없는 행으로는 형식을 알 수 없음
+        kinds.add('python' if _looks_like_literal(text) else 'json')
+        checked += 1
+        if checked >= sample_rows or len(kinds) > 1:
+            break
+    if not kinds:
+        return 'empty'
+    return kinds.pop() if len(kinds) == 1 else 'mixed'
+
+
+def decode_champion_string(text: str):
+    """
+    'champion' 문자열 하나를 디코딩합니다.
+    JSON 은 JSON 백엔드로, 파이썬 리터럴은 JSON 으로 바꿔서 JSON 백엔드로 읽고, 그래도 안 되면 ast.literal_eval 을 씁니다.
+    Returns:
+        디코딩된 객체. 모두 실패하면 None.
+    """
+    if not _looks_like_literal(text):
+        try:
+            value = _json_backend.loads(text)
+            DECODE_COUNTERS['row_json'] += 1
+            return value
+        except (json.JSONDecodeError, TypeError, RecursionError):
+            pass
+    # 파이썬 리터럴이거나, 큰따옴표 키로 시작하지만 True/None 등이 섞인 repr (예: {"O'Neil": None})
+    normalized = python_literal_to_json(text)
+    if normalized is not None:
+        try:
+            value = _json_backend.loads(normalized)
+            DECODE_COUNTERS['normalized'] += 1
+            return value
+        except (json.JSONDecodeError, TypeError, RecursionError):
+            pass
+    DECODE_COUNTERS['ast_fallback'] += 1
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        DECODE_COUNTERS['failed'] += 1
+        return None
+
+
+def _decode_batch(texts: list, originals: list) -> list:
+    # 문자열들을 '[a,b,c]' 로 이어 붙여서 JSON 백엔드로 한 번에 디코딩합니다.
+    # 하나라도 깨진 행이 있거나 결과 개수가 맞지 않으면 그 묶음만 원본 문자열로 행 단위 재처리합니다.
+    # 개수가 맞아도 dict 가 아닌 원소(숫자, 리스트 등)는 행 경계가 어긋났을 수 있으므로 그 행만 원본 문자열로 다시 디코딩합니다.
+    decoded = []
+    for start in range(0, len(texts), BULK_DECODE_BATCH_SIZE):
+        batch = texts[start:start + BULK_DECODE_BATCH_SIZE]
+        try:
+            values = _json_backend.loads('[' + ','.join(batch) + ']')
+        except (json.JSONDecodeError, RecursionError):
+            values = None
+        if values is None or len(values) != len(batch):
+            DECODE_COUNTERS['batch_fallbacks'] += 1
+            values = [decode_champion_string(text) for text in originals[start:start + BULK_DECODE_BATCH_SIZE]]
+        else:
+            not_dict = [offset for offset, value in enumerate(values) if not isinstance(value, dict)]
+            for offset in not_dict:
+                values[offset] = decode_champion_string(originals[start + offset])
+                DECODE_COUNTERS['bulk_fallback_rows'] += 1
+            DECODE_COUNTERS['bulk_rows'] += len(batch) - len(not_dict)
+        decoded.extend(values)
+    return decoded
+
+
+def decode_champion_strings(values) -> list:
+    """
+    'champion' 컬럼 값 전체를 파이썬 객체 리스트로 디코딩합니다.
+    묶음의 형식을 한 번 판별한 뒤, JSON 문자열과 JSON 으로 바꾼 파이썬 리터럴 문자열을 모아서
+    JSON 백엔드로 한 번에 디코딩하고, 나머지 행만 행 단위(decode_champion_string)로 처리합니다.
+    이미 디코딩된 dict/list 값(JSON Lines 로 읽은 경우)은 그대로 씁니다.
+    Args:
+        values: 'champion' 컬럼 (Series, 리스트 등 순회 가능한 값).
+    Returns:
+        list: 행마다 디코딩된 객체 (입력 순서 유지). NaN/빈 문자열/파싱 실패는 None.
+    """
+    values = list(values)
+    decoded = [value if isinstance(value, dict) else None for value in values]
+    texts = ['' if isinstance(value, dict) else _to_champion_string(value) for value in values]
+    chunk_format = detect_champion_format(texts)
+    DECODE_COUNTERS[f'format_{chunk_format}'] += 1
+
+    bulk_positions, bulk_texts, single_positions = [], [], []
+    for position, text in enumerate(texts):
+        if not text:
+            continue
+        # 한 행이 정확히 하나의 '{...}' 값일 때만 이어 붙이기 대상 (그 외 형태는 행 단위로 처리)
+        if text[0] != '{' or text[-1] != '}':
+            single_positions.append(position)
+            continue
+        # 형식이 'json' 인 묶음은 행마다 따옴표를 살펴보지 않음 (틀린 행이 있으면 그 묶음만 행 단위로 다시 처리됨)
+        if chunk_format == 'python' or (chunk_format == 'mixed' and _looks_like_literal(text)):
+            text = python_literal_to_json(text)
+            if text is None:
+                single_positions.append(position)
+                continue
+        bulk_positions.append(position)
+        bulk_texts.append(text)
+
+    bulk_values = _decode_batch(bulk_texts, [texts[p] for p in bulk_positions])
+    for position, value in zip(bulk_positions, bulk_values):
+        decoded[position] = value
+    for position in single_positions:
+        decoded[position] = decode_champion_string(texts[position])
+
+    return decoded
+
+
+def parse_champion_column(df_match: pd.DataFrame, champion_col: str = 'champion', game_id_col: str = 'gameId') -> pd.DataFrame:
+    """
+    매치 DataFrame의 'champion' 컬럼 전체를 한 번의 패스로 (gameId, champion, star, item_ids) 테이블로 펼칩니다.
+    `df_match.apply(parse_champions_from_match_data, axis=1)` + 평탄화 과정을 대체합니다.
+    Args:
+        df_match (pd.DataFrame): 'champion' 컬럼({'챔피언이름': {'items': [...], 'star': ...}} 형태의 문자열)을 가진 매치 데이터.
+        champion_col (str): 챔피언 문자열 컬럼 이름.
+        game_id_col (str): 게임 ID 컬럼 이름. 없으면 'UNKNOWN_GAMEID' 로 채웁니다.
+    Returns:
+        pd.DataFrame: 한 행이 (게임, 챔피언) 하나인 테이블.
+              - gameId: 원본 gameId
+              - champion: 원본 챔피언 이름 (대소문자 변환 없음)
+              - star: 별 개수 (nullable 정수, 정보가 없으면 <NA>)
+              - item_ids: 장착 아이템 ID 리스트 (없으면 빈 리스트)
+    """
+    if champion_col not in df_match.columns:
+        return pd.DataFrame(columns=BOARD_COLUMNS)
+
+    boards = decode_champion_strings(df_match[champion_col].tolist())
+    if game_id_col in df_match.columns:
+        game_ids = df_match[game_id_col].tolist()
+    else:
+        game_ids = ['UNKNOWN_GAMEID'] * len(boards)
+
+    out_game_ids, out_champions, out_stars, out_items = [], [], [], []
+    for game_id, board in zip(game_ids, boards):
+        if not isinstance(board, dict):
+            continue
+        for champion_name, detail in board.items():
+            star, item_ids = None, []
+            if isinstance(detail, dict):
+                star = detail.get('star')
+                if isinstance(detail.get('items'), list):
+                    item_ids = detail['items']
+            out_game_ids.append(game_id)
+            out_champions.append(champion_name)
+            out_stars.append(star)
+            out_items.append(item_ids)
+
+    return pd.DataFrame({
+        'gameId': out_game_ids,
+        'champion': out_champions,
+        'star': pd.array(pd.to_numeric(pd.Series(out_stars, dtype=object), errors='coerce'), dtype='Int8'),
+        'item_ids': out_items,
+    }, columns=BOARD_COLUMNS)
+
+
+def parse_champion_arrays(champion_values) -> dict:
+    """
+    'champion' 컬럼을 리스트 컬럼 없이 NumPy 배열만으로 펼칩니다. (캐시/대용량 처리용)
+    아이템은 CSR 형태로 저장합니다: i번째 (게임, 챔피언)의 아이템은 item_ids[item_offsets[i]:item_offsets[i + 1]].
+    Args:
+        champion_values: 'champion' 컬럼 값 (Series, 리스트 등).
+    Returns:
+        dict: 길이가 (게임, 챔피언) 수인 배열과 CSR 아이템 배열.
+              - match_row (int64): 원본 매치 데이터의 행 위치
+              - champion (object): 원본 챔피언 이름
+              - star (int8): 별 개수, 정보가 없으면 -1
+              - item_offsets (int64): 길이 N + 1 의 아이템 시작 위치
+              - item_ids (int64): 모든 아이템 ID를 이어 붙인 배열, 정수가 아닌 값은 -1
+              - row_status (int8): 입력 행마다 디코딩 결과 (ROW_OK / ROW_MISSING / ROW_EMPTY / ROW_UNPARSEABLE / ROW_NOT_DICT)
+    """
+    champion_values = list(champion_values)
+    boards = decode_champion_strings(champion_values)
+    row_status = np.zeros(len(boards), dtype=np.int8)
+
+    match_rows, champions, stars, item_counts, flat_items = [], [], [], [], []
+    for match_row, board in enumerate(boards):
+        if not isinstance(board, dict):
+            if board is not None:
+                row_status[match_row] = ROW_NOT_DICT
+            elif _to_champion_string(champion_values[match_row]):
+                row_status[match_row] = ROW_UNPARSEABLE
+            else:
+                row_status[match_row] = ROW_MISSING
+            continue
+        if not board:
+            row_status[match_row] = ROW_EMPTY
+            continue
+        for champion_name, detail in board.items():
+            star, item_ids = None, ()
+            if isinstance(detail, dict):
+                star = detail.get('star')
+                if isinstance(detail.get('items'), list):
+                    item_ids = detail['items']
+            match_rows.append(match_row)
+            champions.append(champion_name)
+            stars.append(star)
+            item_counts.append(len(item_ids))
+            flat_items.extend(item_ids)
+
+    item_offsets = np.zeros(len(item_counts) + 1, dtype=np.int64)
+    np.cumsum(item_counts, out=item_offsets[1:])
+    return {
+        'match_row': np.asarray(match_rows, dtype=np.int64),
+        'champion': np.asarray(champions, dtype=object),
+        'star': pd.to_numeric(pd.Series(stars, dtype=object), errors='coerce').fillna(-1).to_numpy(dtype=np.int8),
+        'item_offsets': item_offsets,
+        'item_ids': pd.to_numeric(pd.Series(flat_items, dtype=object), errors='coerce').fillna(-1).to_numpy(dtype=np.int64),
+        'row_status': row_status,
+    }
+
+
+def explode_board_items(df_board: pd.DataFrame) -> pd.DataFrame:
+    """
+    `parse_champion_column` 결과의 item_ids 리스트를 아이템 슬롯 하나당 한 행으로 펼칩니다.
+    `DataFrame.explode` 와 달리 빈 리스트 행을 NaN 으로 남기지 않고 바로 제외합니다.
+    Returns:
+        pd.DataFrame: board_row(df_board의 행 위치), gameId, champion, item_id 컬럼.
+    """
+    item_lists = df_board['item_ids'].tolist()
+    lengths = np.fromiter((len(items) for items in item_lists), dtype=np.int64, count=len(item_lists))
+    board_row = np.repeat(np.arange(len(item_lists)), lengths)
+    flat_items = [item_id for items in item_lists for item_id in items]
+
+    return pd.DataFrame({
+        'board_row': board_row,
+        'gameId': df_board['gameId'].to_numpy()[board_row],
+        'champion': df_board['champion'].to_numpy()[board_row],
+        'item_id': pd.to_numeric(pd.Series(flat_items, dtype=object), errors='coerce').to_numpy(),
+    })
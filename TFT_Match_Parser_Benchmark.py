@@ -0,0 +1,57 @@
+import json
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from TFT_Match_Parser import parse_champions_from_match_data, parse_champion_column
+
+# ----------------------------------------------------------------------------------------------------
+# 'champion' 컬럼 파싱 벤치마크: 기존 `df.apply(parse_champions_from_match_data, axis=1)` vs `parse_champion_column`
+#    - 실행: python TFT_Match_Parser_Benchmark.py [행 수]
+#    - 챔피언/아이템 CSV에서 실제 이름과 ID를 가져와 JSON / 파이썬 리터럴 문자열, NaN, '{}' 가 섞인
+#      가상의 매치 데이터를 만들고, 두 방식의 결과가 같은지 확인한 뒤 걸린 시간을 비교합니다.
+# ----------------------------------------------------------------------------------------------------
+N_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+champion_names = pd.read_csv('TFT_Champion_CurrentVersion.csv')['name'].tolist()
+item_ids = pd.read_csv('TFT_Item_CurrentVersion.csv')['id'].tolist()
+
+rng = random.Random(42)
+champion_strings = []
+for row_number in range(N_ROWS):
+    if row_number % 97 == 0:
+        champion_strings.append(np.nan)
+        continue
+    if row_number % 89 == 0:
+        champion_strings.append('{}')
+        continue
+    board = {
+        name.capitalize(): {'items': rng.sample(item_ids, rng.randint(0, 3)), 'star': rng.randint(1, 3)}
+        for name in rng.sample(champion_names, rng.randint(6, 9))
+    }
+    # 실제 덤프처럼 JSON 과 파이썬 repr 문자열을 섞어서 넣습니다.
+    champion_strings.append(repr(board) if row_number % 2 else json.dumps(board))
+
+df_match = pd.DataFrame({'gameId': [f'KR_{4000000000 + n}' for n in range(N_ROWS)], 'champion': champion_strings})
+print(f"--- 가상 매치 데이터 {N_ROWS}행 생성 완료 ---")
+
+# --- 기존 방식: 행 단위 apply + 평탄화 ---
+start = time.perf_counter()
+all_parsed_champions = df_match.apply(parse_champions_from_match_data, axis=1)
+df_apply = pd.DataFrame([item for sublist in all_parsed_champions for item in sublist])
+apply_seconds = time.perf_counter() - start
+
+# --- 새 방식: 컬럼 전체를 한 번에 파싱 ---
+start = time.perf_counter()
+df_board = parse_champion_column(df_match)
+bulk_seconds = time.perf_counter() - start
+
+# 두 방식의 (champion, gameId) 결과가 완전히 같은지 확인
+same_result = df_apply[['champion', 'gameId']].equals(df_board[['champion', 'gameId']])
+print(f"결과 일치 여부: {'✅ 일치' if same_result else '❌ 불일치'} ({len(df_board)}개 (게임, 챔피언) 행)")
+print(f"기존 apply 방식     : {apply_seconds:8.3f}초 ({N_ROWS / apply_seconds:,.0f} 행/초)")
+print(f"parse_champion_column: {bulk_seconds:8.3f}초 ({N_ROWS / bulk_seconds:,.0f} 행/초)")
+print(f"속도 향상: {apply_seconds / bulk_seconds:.1f}배")
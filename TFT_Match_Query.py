@@ -0,0 +1,208 @@
+import sys
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from TFT_Champion_Registry import normalize_champion_name, normalize_champion_names
+from TFT_Item_Catalog import ItemCatalog, load_item_catalog
+from TFT_Match_Cache import MatchArrays, load_match_arrays
+from TFT_Survival_Analysis import DEFENSIVE_ITEM_BITS, board_item_counts
+
+# ----------------------------------------------------------------------------------------------------
+# 매치 질의 엔진 (챔피언 / 아이템 / 별 / 게임 시간 조건을 다시 훑지 않고 교집합으로 답함)
+#    - 문제 정의: 'VI 가 나온 게임', '블리츠크랭크 게임', '거인의 결의' 같은 질문마다 스크립트가 전체 테이블에
+#                 불리언 마스크나 str.contains 를 새로 돌립니다.
+#    - 해결 목표: 파싱된 배열(TFT_Match_Cache)로 역색인을 한 번만 만들어 둡니다.
+#                 · 챔피언 → 보드 위치, 아이템 → 보드 위치, 별 → 보드 위치 (CSR, 오름차순)
+#                 · ingameDuration 정렬 색인 (구간 질의는 searchsorted 두 번)
+#                 "VI 가 방템을 2개 이상 들고 게임 시간이 1800초 이상" 같은 복합 질의는
+#                 보드 단위 조건(같은 챔피언 보드에 대한 조건)끼리 먼저 교집합을 구하고, 게임 위치로 바꾼 뒤
+#                 게임 단위 조건(시간 구간)과 교집합을 구합니다. 후보가 가장 적은 목록부터 교집합을 구합니다.
+#    - 결과는 매치 행(게임) 위치의 오름차순 배열이고, frame() 으로 gameId / ingameDuration / Ranked 표를 만듭니다.
+# ----------------------------------------------------------------------------------------------------
+
+
+def _csr_postings(keys: np.ndarray, n_keys: int) -> tuple:
+    # 키 배열(위치마다 키 코드, -1 은 제외) → (offsets, positions): 키 k 의 위치들은 positions[offsets[k]:offsets[k + 1]]
+    valid = np.flatnonzero(keys >= 0)
+    sort_keys = keys[valid].astype(np.int16) if n_keys <= np.iinfo(np.int16).max else keys[valid]
+    order = valid[np.argsort(sort_keys, kind='stable')] # 같은 키 안에서는 위치 오름차순 유지 (int16 은 기수 정렬)
+    counts = np.bincount(keys[valid], minlength=n_keys)
+    offsets = np.zeros(n_keys + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets, order.astype(np.int64)
+
+
+def intersect_sorted(*position_arrays) -> np.ndarray:
+    """오름차순 고유 위치 배열들의 교집합. 가장 짧은 배열부터 교집합을 구합니다."""
+    position_arrays = sorted(position_arrays, key=len)
+    result = position_arrays[0]
+    for positions in position_arrays[1:]:
+        if len(result) == 0:
+            break
+        result = np.intersect1d(result, positions, assume_unique=True)
+    return result
+
+
+@dataclass
+class MatchQueryIndex:
+    """
+    매치 배열 위의 역색인 묶음. 모든 질의 결과는 위치 배열(오름차순, 중복 없음)입니다.
+    보드 = (게임, 챔피언) 한 칸, 게임 = 매치 데이터의 한 행.
+    """
+    match_arrays: MatchArrays
+    item_catalog: ItemCatalog
+    champion_keys: np.ndarray          # 키 코드 → 정규화된 챔피언 키
+    row_of_key: dict                   # 정규화된 키 → 키 코드
+    board_key: np.ndarray              # 보드 → 키 코드
+    champion_offsets: np.ndarray       # 챔피언 → 보드 (CSR)
+    champion_boards: np.ndarray
+    item_offsets: np.ndarray           # 아이템 코드 → 보드 (CSR, 같은 보드에 같은 아이템이 둘이어도 한 번)
+    item_boards: np.ndarray
+    star_offsets: np.ndarray           # 별 개수 → 보드 (CSR, 별 정보가 없는 보드는 제외)
+    star_boards: np.ndarray
+    duration_order: np.ndarray         # ingameDuration 오름차순 게임 위치 (NaN 제외)
+    sorted_durations: np.ndarray
+    _item_count_cache: dict = field(default_factory=dict, repr=False)
+
+    # --- 보드 단위 조건 ---
+    def champion_boards_of(self, champion_name: str) -> np.ndarray:
+        """챔피언이 등장한 보드 위치 (이름은 정규화해서 찾음)."""
+        row = self.row_of_key.get(normalize_champion_name(champion_name))
+        if row is None:
+            return np.zeros(0, dtype=np.int64)
+        return self.champion_boards[self.champion_offsets[row]:self.champion_offsets[row + 1]]
+
+    def item_boards_of(self, item_id: int) -> np.ndarray:
+        """아이템을 장착한 보드 위치 (카탈로그에 없는 아이템은 빈 배열)."""
+        code = int(self.item_catalog.encode([item_id])[0])
+        if code < 0:
+            return np.zeros(0, dtype=np.int64)
+        return self.item_boards[self.item_offsets[code]:self.item_offsets[code + 1]]
+
+    def star_boards_of(self, star: int) -> np.ndarray:
+        """별 개수가 star 인 보드 위치."""
+        if not 0 <= star < len(self.star_offsets) - 1:
+            return np.zeros(0, dtype=np.int64)
+        return self.star_boards[self.star_offsets[star]:self.star_offsets[star + 1]]
+
+    def board_item_counts(self, required_bits: int = DEFENSIVE_ITEM_BITS) -> np.ndarray:
+        """보드별 required_bits 아이템 개수 (속성 조합마다 한 번만 계산)."""
+        if required_bits not in self._item_count_cache:
+            self._item_count_cache[required_bits] = board_item_counts(self.match_arrays, self.item_catalog, required_bits)
+        return self._item_count_cache[required_bits]
+
+    # --- 게임 단위 조건 ---
+    def games_of_boards(self, boards: np.ndarray) -> np.ndarray:
+        """보드 위치(오름차순) → 게임 위치 (오름차순, 중복 없음)."""
+        # 보드는 게임 순서로 저장되어 있으므로 오름차순 보드의 게임도 오름차순 → 이웃끼리만 비교해서 중복 제거
+        games = np.asarray(self.match_arrays.board_game)[boards].astype(np.int64)
+        return games[np.concatenate([[True], games[1:] != games[:-1]])] if len(games) else games
+
+    def games_in_duration(self, min_duration: float = None, max_duration: float = None) -> np.ndarray:
+        """min_duration <= ingameDuration <= max_duration 인 게임 위치 (둘 다 생략 가능)."""
+        start = 0 if min_duration is None else np.searchsorted(self.sorted_durations, min_duration, side='left')
+        end = len(self.sorted_durations) if max_duration is None else np.searchsorted(self.sorted_durations, max_duration, side='right')
+        return np.sort(self.duration_order[start:end])
+
+    def query(self, champion: str = None, item: int = None, star: int = None, min_items: int = 0,
+              required_bits: int = DEFENSIVE_ITEM_BITS, min_duration: float = None, max_duration: float = None) -> np.ndarray:
+        """
+        조건을 모두 만족하는 게임 위치. champion 을 주면 item / star / min_items 는 그 챔피언의 보드에 대한 조건이고,
+        champion 이 없으면 게임 안의 어느 보드든 조건을 만족하면 됩니다.
+        예: query(champion='VI', min_items=2, min_duration=1800) → VI 가 방템 2개 이상, 게임 시간 1800초 이상.
+        Args:
+            min_items (int): 보드가 required_bits 속성 아이템을 이 개수 이상 장착.
+        Returns:
+            np.ndarray: 매치 행 위치 (int64, 오름차순).
+        """
+        board_sets = []
+        if champion is not None:
+            board_sets.append(self.champion_boards_of(champion))
+        if item is not None:
+            board_sets.append(self.item_boards_of(item))
+        if star is not None:
+            board_sets.append(self.star_boards_of(star))
+        boards = intersect_sorted(*board_sets) if board_sets else None
+        if min_items > 0:
+            item_counts = self.board_item_counts(required_bits)
+            boards = np.flatnonzero(item_counts >= min_items) if boards is None else boards[item_counts[boards] >= min_items]
+
+        game_sets = []
+        if boards is not None:
+            game_sets.append(self.games_of_boards(boards))
+        if min_duration is not None or max_duration is not None:
+            game_sets.append(self.games_in_duration(min_duration, max_duration))
+        if not game_sets:
+            return np.arange(len(self.match_arrays.game_ids), dtype=np.int64)
+        return intersect_sorted(*game_sets)
+
+    def frame(self, games: np.ndarray) -> pd.DataFrame:
+        """게임 위치 → (gameId, ingameDuration, Ranked) DataFrame."""
+        return pd.DataFrame({
+            'gameId': np.asarray(self.match_arrays.game_ids)[games],
+            'ingameDuration': np.asarray(self.match_arrays.durations)[games],
+            'Ranked': np.asarray(self.match_arrays.placements)[games],
+        })
+
+
+def build_match_query_index(match_arrays: MatchArrays, item_catalog: ItemCatalog) -> MatchQueryIndex:
+    """
+    매치 배열로 챔피언 / 아이템 / 별 역색인과 게임 시간 정렬 색인을 만듭니다. (전체를 한 번만 훑음)
+    """
+    champion_keys = normalize_champion_names(np.asarray(match_arrays.champion_names, dtype=object))
+    key_codes, key_uniques = pd.factorize(pd.Series(champion_keys, dtype=object))
+    key_uniques = np.asarray(key_uniques, dtype=object)
+    board_key = key_codes[np.asarray(match_arrays.board_champion)].astype(np.int64)
+    champion_offsets, champion_boards = _csr_postings(board_key, len(key_uniques))
+
+    # 아이템 슬롯 → (보드, 아이템 코드) 쌍을 중복 없이 모아서 아이템별 보드 목록으로
+    item_offsets_csr = np.asarray(match_arrays.item_offsets)
+    slot_board = np.repeat(np.arange(len(item_offsets_csr) - 1, dtype=np.int64), np.diff(item_offsets_csr))
+    slot_code = item_catalog.encode(np.asarray(match_arrays.item_ids)).astype(np.int64)
+    n_codes = len(item_catalog.ids)
+    # 슬롯은 이미 보드 순서이므로 거의 정렬된 배열 → 안정 정렬 후 이웃끼리 비교해서 중복 제거 (np.unique 보다 빠름)
+    pairs = np.sort(slot_board[slot_code >= 0] * max(n_codes, 1) + slot_code[slot_code >= 0], kind='stable')
+    pairs = pairs[np.concatenate([[True], pairs[1:] != pairs[:-1]])] if len(pairs) else pairs
+    pair_board, pair_code = pairs // max(n_codes, 1), pairs % max(n_codes, 1)
+    code_offsets, pair_positions = _csr_postings(pair_code, n_codes)
+
+    board_star = np.asarray(match_arrays.board_star).astype(np.int64)
+    star_offsets, star_boards = _csr_postings(board_star, int(board_star.max()) + 1 if len(board_star) else 0)
+
+    durations = np.asarray(match_arrays.durations)
+    valid_games = np.flatnonzero(~np.isnan(durations))
+    duration_order = valid_games[np.argsort(durations[valid_games], kind='stable')].astype(np.int64)
+
+    return MatchQueryIndex(
+        match_arrays=match_arrays,
+        item_catalog=item_catalog,
+        champion_keys=key_uniques,
+        row_of_key={key: row for row, key in enumerate(key_uniques)},
+        board_key=board_key,
+        champion_offsets=champion_offsets,
+        champion_boards=champion_boards,
+        item_offsets=code_offsets,
+        item_boards=pair_board[pair_positions],
+        star_offsets=star_offsets,
+        star_boards=star_boards,
+        duration_order=duration_order,
+        sorted_durations=durations[duration_order],
+    )
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Match_Query.py TFT_Challenger_MatchData.csv VI 2 1800
+    file_path_match = sys.argv[1] if len(sys.argv) > 1 else 'TFT_Challenger_MatchData.csv'
+    target_champion_name = normalize_champion_name(sys.argv[2] if len(sys.argv) > 2 else 'VI')
+    min_items = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    min_duration = float(sys.argv[4]) if len(sys.argv) > 4 else 1800.0
+
+    match_query_index = build_match_query_index(load_match_arrays(file_path_match), load_item_catalog())
+    started = time.perf_counter()
+    games = match_query_index.query(champion=target_champion_name, min_items=min_items, min_duration=min_duration)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"--- {target_champion_name} 방템 {min_items}개 이상 & 게임 시간 {min_duration:.0f}초 이상: {len(games)}게임 ({elapsed_ms:.2f}ms) ---")
+    print(match_query_index.frame(games).head(10).to_string(index=False))
@@ -0,0 +1,126 @@
+import json
+import os
+import struct
+import sys
+
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------
+# 파싱된 매치 배열을 파일 하나에 담는 메모리 매핑 바이너리 저장소 (.tftstore)
+#    - 문제 정의: 파싱한 보드를 dict / list 로 들고 있으면 아이템 슬롯 하나에 수백 바이트가 들고,
+#                 분석 프로세스마다 CSV 를 다시 파싱하거나 pickle 을 풀어서 같은 데이터를 각자 메모리에 올립니다.
+#                 컬럼별 .npy 캐시도 파일이 10개라 다른 곳으로 옮기거나 공유하기가 번거롭습니다.
+#    - 해결 목표: 평평한 정수 배열(게임 위치 int32, 챔피언 코드 int16, 별 int8, 아이템 ID int16, CSR 오프셋)을
+#                 파일 하나에 이어서 쓰고, np.memmap 한 번으로 열어서 각 배열을 복사 없는 뷰로 돌려줍니다.
+#                 역직렬화 단계가 없으므로 여러 프로세스가 같은 파일을 열면 OS 페이지 캐시의 한 벌을 함께 씁니다.
+#    - 파일 구조: MAGIC(8바이트) | 헤더 길이(uint64, little endian) | 헤더 JSON | 배열들 (각 배열은 ALIGNMENT 바이트 경계에서 시작)
+#                 헤더 JSON = {'version', 'metadata', 'arrays': {이름: {'dtype', 'shape', 'offset'}}}
+# ----------------------------------------------------------------------------------------------------
+
+MAGIC = b'TFTSTOR1'
+STORE_VERSION = 1
+ALIGNMENT = 64
+_PREFIX = struct.Struct('<8sQ') # MAGIC, 헤더 길이
+
+
+def _aligned(position: int) -> int:
+    return (position + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_array_store(file_path: str, arrays: dict, metadata: dict = None) -> str:
+    """
+    배열 dict 를 저장소 파일 하나로 씁니다 (임시 파일에 쓴 뒤 교체).
+    Args:
+        arrays (dict): 이름 → 숫자 / 고정 길이 문자열 배열 (object dtype 은 저장할 수 없음).
+        metadata (dict): 헤더에 같이 넣을 JSON 값 (원본 파일 정보 등).
+    Returns:
+        str: 쓴 파일 경로.
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    for name, array in arrays.items():
+        if array.dtype.hasobject:
+            raise ValueError(f"'{name}' 배열은 object dtype 이라 저장소에 쓸 수 없습니다.")
+
+    # 헤더 길이가 배열 시작 위치에 영향을 주므로, 헤더 뒤 시작 위치를 0 기준 상대값으로 적고 나중에 더함
+    layout, position = {}, 0
+    for name, array in arrays.items():
+        position = _aligned(position)
+        layout[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': position}
+        position += array.nbytes
+    header = {'version': STORE_VERSION, 'metadata': metadata or {}, 'arrays': layout}
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    data_start = _aligned(_PREFIX.size + len(header_bytes))
+
+    with open(file_path + '.tmp', 'wb') as store_file:
+        store_file.write(_PREFIX.pack(MAGIC, len(header_bytes)))
+        store_file.write(header_bytes)
+        for name, array in arrays.items():
+            store_file.write(b'\0' * (data_start + layout[name]['offset'] - store_file.tell()))
+            array.tofile(store_file)
+    os.replace(file_path + '.tmp', file_path)
+    return file_path
+
+
+def read_store_header(file_path: str) -> dict:
+    """저장소 헤더(version, metadata, arrays 배치)만 읽습니다. 형식이 다르면 ValueError."""
+    with open(file_path, 'rb') as store_file:
+        prefix = store_file.read(_PREFIX.size)
+        if len(prefix) != _PREFIX.size:
+            raise ValueError(f"'{file_path}' 는 매치 저장소 파일이 아닙니다.")
+        magic, header_length = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f"'{file_path}' 는 매치 저장소 파일이 아닙니다.")
+        header = json.loads(store_file.read(header_length).decode('utf-8'))
+    if header.get('version') != STORE_VERSION:
+        raise ValueError(f"지원하지 않는 저장소 버전: {header.get('version')}")
+    header['data_start'] = _aligned(_PREFIX.size + header_length)
+    return header
+
+
+def open_array_store(file_path: str) -> tuple:
+    """
+    저장소 파일을 np.memmap(읽기 전용)으로 열고 배열별 뷰를 만듭니다. 데이터는 읽지 않고 페이지 단위로 필요할 때 올라옵니다.
+    Returns:
+        tuple: (이름 → 배열 뷰 dict, metadata dict)
+    """
+    header = read_store_header(file_path)
+    data_start = header['data_start']
+    file_size = os.path.getsize(file_path)
+    buffer = np.memmap(file_path, dtype=np.uint8, mode='r') if file_size > data_start else np.zeros(0, dtype=np.uint8)
+
+    arrays = {}
+    for name, spec in header['arrays'].items():
+        dtype = np.dtype(spec['dtype'])
+        shape = tuple(spec['shape'])
+        start = data_start + spec['offset']
+        n_bytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        if n_bytes == 0:
+            arrays[name] = np.zeros(shape, dtype=dtype)
+            continue
+        if start + n_bytes > file_size:
+            raise ValueError(f"저장소 파일이 잘렸습니다: '{name}' 배열이 파일 끝을 넘습니다.")
+        arrays[name] = buffer[start:start + n_bytes].view(dtype).reshape(shape)
+    return arrays, header['metadata']
+
+
+def describe_store(file_path: str) -> list:
+    """배열별 (이름, dtype, 길이, 바이트 수) 목록."""
+    header = read_store_header(file_path)
+    rows = []
+    for name, spec in header['arrays'].items():
+        dtype = np.dtype(spec['dtype'])
+        n_values = int(np.prod(spec['shape'], dtype=np.int64))
+        rows.append((name, dtype.str, n_values, n_values * dtype.itemsize))
+    return rows
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Match_Store.py TFT_Challenger_MatchData.cache/match_arrays.tftstore
+    file_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join('TFT_Challenger_MatchData.cache', 'match_arrays.tftstore')
+    rows = describe_store(file_path)
+    print(f"--- '{file_path}' ({os.path.getsize(file_path) / (1024 * 1024):.1f}MB) ---")
+    for name, dtype, n_values, n_bytes in rows:
+        print(f"{name:<16} | {dtype:>6} | {n_values:>12,} | {n_bytes / (1024 * 1024):>9.2f}MB")
+    item_slots = next((n_values for name, _, n_values, _ in rows if name == 'item_ids'), 0)
+    if item_slots:
+        print(f"아이템 슬롯당 {os.path.getsize(file_path) / item_slots:.1f}바이트 (보드/게임 배열 포함)")
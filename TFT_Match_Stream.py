@@ -0,0 +1,225 @@
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from TFT_Champion_Registry import normalize_champion_name, normalize_champion_names
+from TFT_Item_Catalog import ITEM_TYPE_BITS, build_item_catalog
+from TFT_Item_CurrentVersion import load_classified_items
+from TFT_Match_Canonical import read_match_file
+from TFT_Match_Parser import parse_champion_arrays
+
+# ----------------------------------------------------------------------------------------------------
+# 메모리 사용량이 일정한 청크 단위 스트리밍 집계
+#    - 문제 정의: 'vi projcet.py' 는 매치 CSV 전체를 하나의 DataFrame으로 올리고, 거기에 리스트 컬럼을 계속 추가해서
+#                 메모리 사용량이 몇 배로 늘어납니다. 여러 패치를 합친 큰 덤프는 분석 서버 메모리에 들어가지 않습니다.
+#    - 해결 목표: pd.read_csv(chunksize=...) 로 조금씩 읽고, 파싱 → 아이템 ID 매핑 → 필터 → 집계를
+#                 제너레이터 단계로 이어서 처리합니다. 챔피언 픽 수, 아이템 빈도 같은 카운터는 청크마다 누적되므로
+#                 입력 크기와 상관없이 최대 메모리 사용량은 청크 하나 분량으로 유지됩니다.
+# ----------------------------------------------------------------------------------------------------
+
+DEFAULT_CHUNK_SIZE = 50000
+STREAM_COLUMNS = ('gameId', 'ingameDuration', 'champion')
+
+
+@dataclass
+class MatchStreamStats:
+    """
+    스트리밍 집계 결과. 모든 값은 청크마다 더해지는 카운터이므로 다른 결과와 합칠(merge) 수 있습니다.
+    챔피언 이름은 TFT_Champion_Registry 규칙으로 정규화합니다 (예: 'Vi' → 'VI').
+    """
+    games: int = 0                                         # 읽은 매치 행 수
+    boards: int = 0                                        # (게임, 챔피언) 수
+    champion_picks: Counter = field(default_factory=Counter)   # 챔피언 → 등장 횟수
+    champion_items: dict = field(default_factory=dict)         # 챔피언 → Counter(아이템 ID → 장착 횟수)
+    item_counts: Counter = field(default_factory=Counter)      # 아이템 ID → 전체 장착 횟수
+    duration_sum: Counter = field(default_factory=Counter)     # 챔피언 → ingameDuration 합계
+    duration_count: Counter = field(default_factory=Counter)   # 챔피언 → ingameDuration 이 있는 등장 횟수
+
+    def merge(self, other: 'MatchStreamStats') -> 'MatchStreamStats':
+        """다른 집계 결과를 이 객체에 더하고 자신을 반환합니다."""
+        self.games += other.games
+        self.boards += other.boards
+        self.champion_picks.update(other.champion_picks)
+        for champion_name, item_counter in other.champion_items.items():
+            self.champion_items.setdefault(champion_name, Counter()).update(item_counter)
+        self.item_counts.update(other.item_counts)
+        self.duration_sum.update(other.duration_sum)
+        self.duration_count.update(other.duration_count)
+        return self
+
+    def mean_duration(self, champion_name: str) -> float:
+        """챔피언이 등장한 게임의 평균 ingameDuration (등장 기록이 없으면 NaN)."""
+        champion_key = normalize_champion_name(champion_name)
+        count = self.duration_count.get(champion_key, 0)
+        return self.duration_sum[champion_key] / count if count else float('nan')
+
+    def to_dict(self) -> dict:
+        """JSON 으로 저장할 수 있는 dict (아이템 ID 키는 문자열이 됨)."""
+        return {
+            'games': self.games,
+            'boards': self.boards,
+            'champion_picks': dict(self.champion_picks),
+            'champion_items': {champion_name: {str(item_id): count for item_id, count in item_counter.items()}
+                               for champion_name, item_counter in self.champion_items.items()},
+            'item_counts': {str(item_id): count for item_id, count in self.item_counts.items()},
+            'duration_sum': dict(self.duration_sum),
+            'duration_count': dict(self.duration_count),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> 'MatchStreamStats':
+        """`to_dict` 결과로 다시 만듭니다 (아이템 ID 키는 정수로 되돌림)."""
+        return cls(
+            games=payload.get('games', 0),
+            boards=payload.get('boards', 0),
+            champion_picks=Counter(payload.get('champion_picks', {})),
+            champion_items={champion_name: Counter({int(item_id): count for item_id, count in item_counter.items()})
+                            for champion_name, item_counter in payload.get('champion_items', {}).items()},
+            item_counts=Counter({int(item_id): count for item_id, count in payload.get('item_counts', {}).items()}),
+            duration_sum=Counter(payload.get('duration_sum', {})),
+            duration_count=Counter(payload.get('duration_count', {})),
+        )
+
+
+# --------------------------------------------------------------------------
+# --- 1단계: 청크 읽기 ---
+def iter_match_chunks(file_path_match: str, chunksize: int = DEFAULT_CHUNK_SIZE):
+    """매치 CSV (또는 .jsonl) 를 필요한 컬럼(gameId, ingameDuration, champion)만 chunksize 행씩 읽어서 내보냅니다."""
+    yield from read_match_file(file_path_match, columns=STREAM_COLUMNS, chunksize=chunksize)
+
+
+# --------------------------------------------------------------------------
+# --- 2단계: 파싱 ---
+def parse_chunks(chunks):
+    """
+    청크마다 'champion' 컬럼을 파싱해서 보드 단위 배열로 바꿉니다. 리스트 컬럼은 만들지 않습니다.
+    내보내는 dict: champion(정규화된 키), duration(보드별 ingameDuration), item_board(아이템 슬롯별 보드 위치),
+                   item_ids, games(청크의 매치 행 수)
+    """
+    for df_chunk in chunks:
+        parsed = parse_champion_arrays(df_chunk['champion'].tolist() if 'champion' in df_chunk.columns else [])
+        if 'ingameDuration' in df_chunk.columns:
+            durations = pd.to_numeric(df_chunk['ingameDuration'], errors='coerce').to_numpy(dtype=np.float64)
+        else:
+            durations = np.full(len(df_chunk), np.nan)
+        item_offsets = parsed['item_offsets']
+        yield {
+            'games': len(df_chunk),
+            'champion': normalize_champion_names(parsed['champion']),
+            'duration': durations[parsed['match_row']],
+            'item_board': np.repeat(np.arange(len(item_offsets) - 1), np.diff(item_offsets)),
+            'item_ids': parsed['item_ids'],
+        }
+
+
+# --------------------------------------------------------------------------
+# --- 3단계: 아이템 ID 매핑 ---
+def map_item_ids(parsed_chunks, df_item: pd.DataFrame = None):
+    """
+    아이템 슬롯마다 아이템 카탈로그(TFT_Item_Catalog)의 속성 비트(item_attr, uint8)를 붙입니다.
+    df_item 이 없으면 속성 없이 그대로 내보냅니다. 카탈로그에 없는 아이템 ID 는 속성이 0 입니다.
+    """
+    item_catalog = None if df_item is None else build_item_catalog(df_item)
+    for chunk in parsed_chunks:
+        if item_catalog is not None:
+            chunk['item_attr'] = item_catalog.attributes_of(chunk['item_ids'])
+        yield chunk
+
+
+# --------------------------------------------------------------------------
+# --- 4단계: 필터 ---
+def filter_chunks(mapped_chunks, champions=None, item_types=None):
+    """
+    특정 챔피언 / 아이템 분류만 남깁니다. (예: champions=['VI'], item_types=['completed'])
+    champions 필터는 픽 수와 아이템 모두에, item_types 필터는 아이템 슬롯에만 적용됩니다.
+    """
+    champion_keys = None if champions is None else np.array([normalize_champion_name(name) for name in champions], dtype=object)
+    item_type_bits = 0 if item_types is None else np.uint8(sum(ITEM_TYPE_BITS[item_type] for item_type in set(item_types)))
+    for chunk in mapped_chunks:
+        if champion_keys is not None:
+            board_mask = np.isin(chunk['champion'], champion_keys)
+            new_board_position = np.cumsum(board_mask) - 1
+            item_mask = board_mask[chunk['item_board']]
+            chunk['champion'] = chunk['champion'][board_mask]
+            chunk['duration'] = chunk['duration'][board_mask]
+            chunk['item_board'] = new_board_position[chunk['item_board'][item_mask]]
+            chunk['item_ids'] = chunk['item_ids'][item_mask]
+            if 'item_attr' in chunk:
+                chunk['item_attr'] = chunk['item_attr'][item_mask]
+        if item_types is not None and 'item_attr' in chunk:
+            item_mask = (chunk['item_attr'] & item_type_bits) != 0
+            chunk['item_board'] = chunk['item_board'][item_mask]
+            chunk['item_ids'] = chunk['item_ids'][item_mask]
+            chunk['item_attr'] = chunk['item_attr'][item_mask]
+        yield chunk
+
+
+# --------------------------------------------------------------------------
+# --- 5단계: 집계 ---
+def aggregate_chunks(filtered_chunks, stats: MatchStreamStats = None) -> MatchStreamStats:
+    """청크마다 카운터를 누적합니다. 청크 데이터는 집계 후 바로 버려집니다."""
+    stats = stats or MatchStreamStats()
+    for chunk in filtered_chunks:
+        stats.merge(aggregate_chunk(chunk))
+    return stats
+
+
+def aggregate_chunk(chunk: dict) -> MatchStreamStats:
+    """청크 하나의 카운터 (프로세스 병렬 처리 등에서 부분 결과로 사용)."""
+    stats = MatchStreamStats(games=chunk['games'], boards=len(chunk['champion']))
+    champions = pd.Series(chunk['champion'], dtype=object)
+    stats.champion_picks.update(champions.value_counts().to_dict())
+
+    durations = pd.Series(chunk['duration'])
+    has_duration = durations.notna().to_numpy()
+    stats.duration_sum.update(durations[has_duration].groupby(champions[has_duration].to_numpy()).sum().to_dict())
+    stats.duration_count.update(champions[has_duration].value_counts().to_dict())
+
+    if len(chunk['item_ids']):
+        df_slots = pd.DataFrame({'champion': chunk['champion'][chunk['item_board']], 'item_id': chunk['item_ids']})
+        for (champion_name, item_id), count in df_slots.groupby(['champion', 'item_id']).size().items():
+            stats.champion_items.setdefault(champion_name, Counter())[int(item_id)] += int(count)
+        stats.item_counts.update({int(item_id): int(count) for item_id, count in df_slots['item_id'].value_counts().items()})
+    return stats
+
+
+def stream_match_stats(file_path_match: str, df_item: pd.DataFrame = None, champions=None, item_types=None,
+                       chunksize: int = DEFAULT_CHUNK_SIZE) -> MatchStreamStats:
+    """
+    읽기 → 파싱 → 아이템 ID 매핑 → 필터 → 집계 파이프라인을 한 번에 실행합니다.
+    Args:
+        file_path_match (str): 매치 CSV 경로.
+        df_item (pd.DataFrame): id, item_type 컬럼을 가진 아이템 분류 데이터 (item_types 필터에 필요).
+        champions: 집계할 챔피언 목록. None 이면 전체.
+        item_types: 셀 아이템 분류 목록 ('component' / 'completed'). None 이면 전체 아이템.
+        chunksize (int): 한 번에 읽을 행 수. 최대 메모리 사용량을 결정합니다.
+    Returns:
+        MatchStreamStats: 누적된 카운터.
+    """
+    chunks = iter_match_chunks(file_path_match, chunksize=chunksize)
+    parsed_chunks = parse_chunks(chunks)
+    mapped_chunks = map_item_ids(parsed_chunks, df_item)
+    filtered_chunks = filter_chunks(mapped_chunks, champions=champions, item_types=item_types)
+    return aggregate_chunks(filtered_chunks)
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Match_Stream.py TFT_Challenger_MatchData.csv VI
+    file_path_match = sys.argv[1] if len(sys.argv) > 1 else 'TFT_Challenger_MatchData.csv'
+    target_champion_name = normalize_champion_name(sys.argv[2] if len(sys.argv) > 2 else 'VI')
+    df_item = load_classified_items() # 분석 파이프라인과 같은 아이템 분류
+    item_id_to_name_map = df_item.set_index('id')['name'].to_dict()
+
+    stats = stream_match_stats(file_path_match, df_item=df_item, item_types=['completed'])
+    print(f"✅ 스트리밍 집계 완료: 매치 {stats.games}행, (게임, 챔피언) {stats.boards}개")
+
+    print("\n--- 챔피언 등장 빈도 TOP 10 ---")
+    for rank, (champion_name, count) in enumerate(stats.champion_picks.most_common(10), start=1):
+        print(f"{rank:<4} | {champion_name:<15} | {count}")
+
+    print(f"\n--- {target_champion_name} 완성 아이템 TOP 10 (평균 ingameDuration: {stats.mean_duration(target_champion_name):.1f}) ---")
+    for rank, (item_id, count) in enumerate(stats.champion_items.get(target_champion_name, Counter()).most_common(10), start=1):
+        print(f"{rank:<4} | {item_id_to_name_map.get(item_id, item_id)!s:<25} | {count}")
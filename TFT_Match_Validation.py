@@ -0,0 +1,211 @@
+import os
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from TFT_Item_Catalog import ItemCatalog, load_item_catalog
+from TFT_Match_Cache import MatchArrays, load_match_arrays
+from TFT_Match_Canonical import read_match_file
+from TFT_Match_Parser import ROW_EMPTY, ROW_MISSING, ROW_NOT_DICT, ROW_UNPARSEABLE
+
+# ----------------------------------------------------------------------------------------------------
+# 매치 데이터 검증 + 격리(quarantine)
+#    - 문제 정의: 파싱 함수는 NaN, '{}', dict 가 아닌 값, json/ast 실패를 모두 조용히 [] 로 돌려주고,
+#                 'vi projcet.py' 는 단계 결과가 비면 exit() 합니다. 잘못된 행은 파싱 비용만 들이고 흔적 없이 사라집니다.
+#    - 해결 목표: 캐시된 컬럼형 배열(TFT_Match_Cache)을 컬럼 단위로 검사해서 행마다 사유 비트(REASON_CODES)를 OR 로 모읍니다.
+#                 · gameId: 비어 있음 / 중복 (두 번째 등장부터)
+#                 · ingameDuration: 없음 / DURATION_RANGE 밖,  Ranked: 1~8 이 아님
+#                 · champion: 파서가 남긴 row_status (없음, '{}', 읽기 실패, dict 아님)
+#                 · 아이템: 아이템 카탈로그에 없는 ID 가 하나라도 있는 보드의 게임 (슬롯 → 보드 → 게임 누적합/bincount)
+#                 모두 배열 연산이라 파싱을 다시 하지 않고, 캐시가 최신이면 검증은 수 ms 입니다.
+#                 거부된 행은 원본 그대로 격리 파일(<원본>.quarantine.csv)에 사유 코드와 함께 씁니다.
+#    - 분석용 배열(MatchArrays)에서 행을 지우지는 않습니다. ValidationReport.accepted 로 게임을 걸러서 쓸 수 있습니다.
+# ----------------------------------------------------------------------------------------------------
+
+REASON_CODES = {
+    'MISSING_GAME_ID': 1,
+    'DUPLICATE_GAME_ID': 2,
+    'DURATION_MISSING': 4,
+    'DURATION_OUT_OF_RANGE': 8,
+    'PLACEMENT_INVALID': 16,
+    'CHAMPION_MISSING': 32,
+    'CHAMPION_EMPTY': 64,
+    'CHAMPION_UNPARSEABLE': 128,
+    'CHAMPION_NOT_DICT': 256,
+    'UNKNOWN_ITEM': 512,
+}
+ROW_STATUS_REASONS = {
+    ROW_MISSING: 'CHAMPION_MISSING', ROW_EMPTY: 'CHAMPION_EMPTY',
+    ROW_UNPARSEABLE: 'CHAMPION_UNPARSEABLE', ROW_NOT_DICT: 'CHAMPION_NOT_DICT',
+}
+DURATION_RANGE = (60.0, 3600.0) # ingameDuration 허용 범위 (초, 양 끝 포함)
+PLACEMENT_RANGE = (1, 8)
+QUARANTINE_CHUNK_SIZE = 50000
+
+
+@dataclass
+class ValidationReport:
+    """행별 거부 사유 비트와 집계."""
+    reasons: np.ndarray          # 행별 사유 비트 OR (uint16, 0 = 통과)
+    unknown_item_slots: int      # 카탈로그에 없는 아이템 슬롯 수 (카탈로그 없이 검증했으면 0)
+
+    @property
+    def accepted(self) -> np.ndarray:
+        """통과한 게임 (bool, 게임 수)."""
+        return self.reasons == 0
+
+    @property
+    def n_rejected(self) -> int:
+        return int((self.reasons != 0).sum())
+
+    def counts(self) -> pd.DataFrame:
+        """사유별 (reason, code, rows) 표. 한 행이 여러 사유에 걸리면 각 사유에 한 번씩 셉니다."""
+        return pd.DataFrame({
+            'reason': list(REASON_CODES),
+            'code': list(REASON_CODES.values()),
+            'rows': [int(((self.reasons & code) != 0).sum()) for code in REASON_CODES.values()],
+        })
+
+    def to_dict(self) -> dict:
+        """JSON 으로 쓸 수 있는 요약 (행 수, 거부 행 수, 사유별 행 수)."""
+        counts = self.counts()
+        return {
+            'rows': len(self.reasons), 'rejected': self.n_rejected, 'unknown_item_slots': self.unknown_item_slots,
+            'reasons': {reason: rows for reason, rows in zip(counts['reason'], counts['rows']) if rows},
+        }
+
+
+def reason_names(code: int) -> str:
+    """사유 비트 → 'DURATION_MISSING|UNKNOWN_ITEM' 같은 이름 문자열."""
+    return '|'.join(name for name, bit in REASON_CODES.items() if int(code) & bit)
+
+
+def validate_match_arrays(match_arrays: MatchArrays, item_catalog: ItemCatalog = None,
+                          duration_range: tuple = DURATION_RANGE) -> ValidationReport:
+    """
+    MatchArrays 를 컬럼 단위로 검사합니다. item_catalog 를 주면 카탈로그에 없는 아이템 ID 도 검사합니다.
+    Returns:
+        ValidationReport: 행별 사유 비트와 집계.
+    """
+    game_ids = np.asarray(match_arrays.game_ids)
+    n_games = len(game_ids)
+    reasons = np.zeros(n_games, dtype=np.uint16)
+
+    if game_ids.dtype.kind in 'US':
+        missing_id = np.isin(np.char.strip(game_ids.astype(str)), ['', 'nan', 'None'])
+        reasons[missing_id] |= REASON_CODES['MISSING_GAME_ID']
+    else:
+        missing_id = np.zeros(n_games, dtype=bool)
+    # 중복: 안정 정렬 후 이웃 비교 → 같은 ID 의 두 번째 등장부터 표시 (첫 행은 통과)
+    order = np.argsort(game_ids, kind='stable')
+    repeated = np.zeros(n_games, dtype=bool)
+    repeated[order[1:]] = game_ids[order[1:]] == game_ids[order[:-1]]
+    reasons[repeated & ~missing_id] |= REASON_CODES['DUPLICATE_GAME_ID']
+
+    durations = np.asarray(match_arrays.durations)
+    reasons[np.isnan(durations)] |= REASON_CODES['DURATION_MISSING']
+    with np.errstate(invalid='ignore'):
+        out_of_range = (durations < duration_range[0]) | (durations > duration_range[1])
+    reasons[out_of_range] |= REASON_CODES['DURATION_OUT_OF_RANGE']
+
+    placements = np.asarray(match_arrays.placements)
+    reasons[(placements < PLACEMENT_RANGE[0]) | (placements > PLACEMENT_RANGE[1])] |= REASON_CODES['PLACEMENT_INVALID']
+
+    row_status = np.asarray(match_arrays.row_status)
+    for status, reason in ROW_STATUS_REASONS.items():
+        reasons[row_status == status] |= REASON_CODES[reason]
+
+    unknown_item_slots = 0
+    if item_catalog is not None:
+        unknown = item_catalog.encode(np.asarray(match_arrays.item_ids)) < 0
+        unknown_item_slots = int(unknown.sum())
+        if unknown_item_slots:
+            cumulative = np.concatenate([[0], np.cumsum(unknown, dtype=np.int64)])
+            item_offsets = np.asarray(match_arrays.item_offsets)
+            board_unknown = cumulative[item_offsets[1:]] - cumulative[item_offsets[:-1]]
+            game_unknown = np.bincount(np.asarray(match_arrays.board_game), weights=board_unknown, minlength=n_games)
+            reasons[game_unknown > 0] |= REASON_CODES['UNKNOWN_ITEM']
+    return ValidationReport(reasons=reasons, unknown_item_slots=unknown_item_slots)
+
+
+def quarantine_file_path(file_path_match: str) -> str:
+    """'TFT_Challenger_MatchData.csv' → 'TFT_Challenger_MatchData.quarantine.csv'"""
+    return os.path.splitext(file_path_match)[0] + '.quarantine.csv'
+
+
+def write_quarantine(file_path_match: str, report: ValidationReport, output_path: str = None,
+                     chunksize: int = QUARANTINE_CHUNK_SIZE) -> str:
+    """
+    거부된 행을 원본 그대로(모든 컬럼) 격리 CSV 에 씁니다. 앞에 source_row(원본 행 위치), reject_code, reject_reasons 컬럼이 붙습니다.
+    원본은 청크 단위로 읽으므로 메모리 사용량이 일정합니다. 거부 행이 없으면 머리글만 있는 파일을 씁니다.
+    """
+    output_path = output_path or quarantine_file_path(file_path_match)
+    rejected = np.flatnonzero(report.reasons)
+    start, wrote_header = 0, False
+    with open(output_path + '.tmp', 'w', encoding='utf-8-sig', newline='') as out_file:
+        for df_chunk in read_match_file(file_path_match, chunksize=chunksize):
+            end = start + len(df_chunk)
+            positions = rejected[(rejected >= start) & (rejected < end)]
+            df_rejected = df_chunk.iloc[positions - start]
+            df_rejected.insert(0, 'reject_reasons', [reason_names(code) for code in report.reasons[positions]])
+            df_rejected.insert(0, 'reject_code', report.reasons[positions])
+            df_rejected.insert(0, 'source_row', positions)
+            if len(df_rejected) or not wrote_header:
+                df_rejected.to_csv(out_file, index=False, header=not wrote_header)
+                wrote_header = True
+            start = end
+    os.replace(output_path + '.tmp', output_path)
+    return output_path
+
+
+def refresh_quarantine(file_path_match: str, report: ValidationReport, dependencies=(), output_path: str = None) -> str:
+    """
+    격리 파일을 필요할 때만 다시 씁니다. 격리 파일이 원본(file_path_match)과 dependencies(예: 아이템 CSV)보다
+    새것이면 그대로 두고(원본 CSV 를 다시 읽지 않음), 거부 행이 없으면 예전 격리 파일을 지웁니다.
+    Returns:
+        str: 격리 파일 경로 (거부 행이 없으면 None)
+    """
+    output_path = output_path or quarantine_file_path(file_path_match)
+    if not report.n_rejected:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        return None
+    source_mtime = max(os.path.getmtime(path) for path in (file_path_match, *dependencies) if os.path.exists(path))
+    if os.path.exists(output_path) and os.path.getmtime(output_path) >= source_mtime:
+        return output_path
+    return write_quarantine(file_path_match, report, output_path)
+
+
+def validate_match_file(file_path_match: str, item_catalog: ItemCatalog = None, quarantine_path: str = None,
+                        duration_range: tuple = DURATION_RANGE) -> ValidationReport:
+    """
+    캐시된 배열(없으면 파싱해서 캐시)로 검증하고, 거부 행이 있으면 격리 파일을 씁니다.
+    거부 행이 없으면 예전 실행이 남긴 격리 파일을 지웁니다 (refresh_quarantine 과 같은 결과 파일).
+    """
+    report = validate_match_arrays(load_match_arrays(file_path_match), item_catalog, duration_range)
+    quarantine_path = quarantine_path or quarantine_file_path(file_path_match)
+    if report.n_rejected:
+        write_quarantine(file_path_match, report, quarantine_path)
+    elif os.path.exists(quarantine_path):
+        os.remove(quarantine_path)
+    return report
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Match_Validation.py TFT_Challenger_MatchData.csv TFT_Item_CurrentVersion.csv
+    file_path_match = sys.argv[1] if len(sys.argv) > 1 else 'TFT_Challenger_MatchData.csv'
+    item_catalog = load_item_catalog(sys.argv[2]) if len(sys.argv) > 2 else load_item_catalog()
+
+    match_arrays = load_match_arrays(file_path_match)
+    started = time.perf_counter()
+    report = validate_match_arrays(match_arrays, item_catalog)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"✅ {len(report.reasons)}행 검증 ({elapsed_ms:.1f}ms): 통과 {int(report.accepted.sum())}행, 거부 {report.n_rejected}행"
+          f" (카탈로그에 없는 아이템 슬롯 {report.unknown_item_slots}개)")
+    counts = report.counts()
+    print(counts[counts['rows'] > 0].to_string(index=False))
+    if report.n_rejected:
+        print(f"    - 거부된 행은 '{write_quarantine(file_path_match, report)}' 에 사유와 함께 저장했습니다.")
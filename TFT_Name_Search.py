@@ -0,0 +1,271 @@
+import csv
+import difflib
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field
+
+from TFT_Champion_Names import KOREAN_CHAMPION_ALIASES, champion_key
+
+# ----------------------------------------------------------------------------------------------------
+# 아이템 / 챔피언 이름 검색 (한글·영어 별칭, 부분 문자열, 대소문자 무시, 오타 허용)
+#    - 문제 정의: '잡다한 실행.py' 는 df_item['name'] 에 str.contains 를 두 번('거인의 결의', "Titan's Resolve") 돌리고,
+#                 TFT_Item_CurrentVersion.py 의 component_items / defensive_items 는 영어 공식 이름과
+#                 대소문자, 띄어쓰기, 따옴표까지 정확히 같아야 분류됩니다.
+#    - 해결 목표: TFT_Item_CurrentVersion.csv, TFT_Champion_CurrentVersion.csv 와 한글 별칭표로 이름 색인을 한 번 만듭니다.
+#                 · 별칭은 접어서(fold) 저장: 소문자, 공백/특수문자 제거, 한글은 자모로 분해 ('거인의 결의' → 'ㄱㅓㅇㅣㄴㅇㅢㄱㅕㄹㅇㅢ')
+#                 · 접은 별칭의 2-gram → 별칭 번호 역색인
+#                 질의도 같은 방식으로 접은 뒤, 2-gram 교집합으로 부분 문자열 후보를, 2-gram 을 많이 공유하는 별칭으로 오타 후보를 찾습니다.
+#                 오타 후보는 별칭 전체뿐 아니라 질의와 길이가 비슷한 별칭 앞부분과 단어에도 견주므로, 'Titn' 처럼 짧은 질의도 찾습니다.
+#                 DataFrame 을 다시 훑지 않으므로 질의 하나는 1ms 안쪽입니다.
+#                 부분 문자열 / 오타 허용은 사람이 치는 검색(search)에만 씁니다. 분류 목록처럼 코드에 적힌 이름은 resolve 로
+#                 접은 이름이 완전히 같은 항목만 받아들이므로, 'Dragon Claw' 같은 오타가 조용히 다른 아이템으로 풀리지 않습니다.
+#    - pandas / numpy 를 import 하지 않습니다 (load_name_index 는 csv 모듈로 읽음). 그래서 'TFT_CLI.py search' 는 바로 뜹니다.
+# ----------------------------------------------------------------------------------------------------
+
+# 아이템 ID → 한글 이름 (TFT_Item_CurrentVersion.csv 의 아이템)
+KOREAN_ITEM_ALIASES = {
+    1: 'B.F. 대검', 2: '곡궁', 3: '쓸데없이 큰 지팡이', 4: '여신의 눈물', 5: '쇠사슬 조끼', 6: '음전자 망토',
+    7: '거인의 허리띠', 8: '뒤집개', 9: '연습용 장갑',
+    11: '죽음의 검', 12: '거인 학살자', 13: '마법공학 총검', 14: '쇼진의 창', 15: '수호 천사', 16: '피바라기',
+    17: '지크의 전령', 18: '몰락한 왕의 검', 19: '무한의 대검', 22: '고속 연사포', 23: '구인수의 격노검',
+    24: '스태틱의 단검', 25: '거인의 결의', 26: '루난의 허리케인', 27: '즈롯 차원문', 28: '침투자의 발톱',
+    29: '최후의 속삭임', 33: '라바돈의 죽음모자', 34: '루덴의 메아리', 35: '강철의 솔라리 펜던트', 36: '이온 충격기',
+    37: '모렐로노미콘', 38: '폭파단의 돌격', 39: '보석 건틀릿', 44: '대천사의 포옹', 45: '얼어붙은 심장',
+    46: '호의의 성배', 47: '구원', 48: '별 수호자의 부적', 49: '정의의 손길', 55: '덤불 조끼', 56: '칼날 파괴자',
+    57: '붉은 덩굴정령', 58: '반란군 메달', 59: '침묵의 장막', 66: '용의 발톱', 67: '서풍', 68: '천상의 구슬',
+    69: '수은', 77: '워모그의 갑옷', 78: '수호자의 흉갑', 79: '덫 발톱', 88: '자연의 힘', 89: '암흑의 별 심장',
+    99: '도적의 장갑',
+}
+
+ITEM = 'item'
+CHAMPION = 'champion'
+FUZZY_MIN_SCORE = 0.6       # 오타 허용 검색에서 받아들이는 최소 유사도
+FUZZY_CANDIDATES = 20       # 유사도를 직접 계산할 후보 수 (2-gram 을 많이 공유하는 순)
+PARTIAL_MIN_SCORE = 0.75    # 별칭 앞부분 / 단어와 비교할 때 받아들이는 최소 유사도 (짧은 조각이라 더 엄격하게)
+
+_NON_FOLD_CHARACTERS = re.compile(r'[^0-9a-zㄱ-ㆎ]')
+_TOKEN_SEPARATORS = re.compile(r"[\s\-_/.,]+")
+# 한글 음절 → 자모 (초성 19, 중성 21, 종성 28 (0 = 없음))
+_CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+_JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+              'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+
+def fold_name(name) -> str:
+    """
+    검색용으로 이름을 접습니다: 유니코드 정규화(NFKC), 소문자, 한글 음절 → 자모, 공백/특수문자 제거.
+    예: "Titan's Resolve" → 'titansresolve', '거인의 결의' → 'ㄱㅓㅇㅣㄴㅇㅢㄱㅕㄹㅇㅢ'
+    """
+    if not isinstance(name, str):
+        return ''
+    characters = []
+    for character in unicodedata.normalize('NFKC', name).lower():
+        code = ord(character) - 0xAC00
+        if 0 <= code < 11172: # 한글 음절
+            characters.append(_CHOSEONG[code // 588] + _JUNGSEONG[code % 588 // 28] + _JONGSEONG[code % 28])
+        else:
+            characters.append(character)
+    return _NON_FOLD_CHARACTERS.sub('', ''.join(characters))
+
+
+def _grams(folded: str) -> set:
+    # 2-gram 집합 (한 글자짜리는 그 글자 하나)
+    if len(folded) < 2:
+        return {folded} if folded else set()
+    return {folded[position:position + 2] for position in range(len(folded) - 1)}
+
+
+@dataclass
+class NameMatch:
+    """검색 결과 하나. key 는 아이템이면 아이템 ID(int), 챔피언이면 정규화된 키(str)."""
+    kind: str
+    key: object
+    name: str       # 대표 이름 (아이템 CSV 의 영어 이름 / 챔피언 키)
+    alias: str      # 질의와 맞은 별칭 (원래 표기)
+    score: float    # 1.0 완전 일치, 0.9~0.99 부분 문자열, 그 아래는 오타 허용 유사도
+
+
+@dataclass
+class NameIndex:
+    """이름 별칭과 2-gram 역색인. build_name_index 로 만듭니다."""
+    entries: list = field(default_factory=list)        # 항목 번호 → (kind, key, 대표 이름)
+    aliases: list = field(default_factory=list)        # 별칭 번호 → (항목 번호, 원래 표기, 접은 별칭)
+    exact: dict = field(default_factory=dict)          # 접은 별칭 → 별칭 번호 목록
+    gram_postings: dict = field(default_factory=dict)  # 2-gram → 별칭 번호 집합
+    alias_tokens: list = field(default_factory=list)   # 별칭 번호 → 접은 단어 튜플 (단어가 둘 이상인 별칭만, 아니면 빈 튜플)
+
+    def add(self, kind: str, key, name: str, aliases=()) -> None:
+        """항목 하나와 별칭들을 색인에 추가합니다 (대표 이름도 별칭으로 등록)."""
+        entry = len(self.entries)
+        self.entries.append((kind, key, name))
+        for alias in dict.fromkeys([name, *aliases]): # 순서 유지하며 중복 제거
+            folded = fold_name(alias)
+            if not folded or any(self.aliases[position][0] == entry and self.aliases[position][2] == folded
+                                 for position in self.exact.get(folded, ())):
+                continue
+            position = len(self.aliases)
+            self.aliases.append((entry, alias, folded))
+            tokens = tuple(token for token in map(fold_name, _TOKEN_SEPARATORS.split(alias)) if token)
+            self.alias_tokens.append(tokens if len(tokens) > 1 else ())
+            self.exact.setdefault(folded, []).append(position)
+            for gram in _grams(folded):
+                self.gram_postings.setdefault(gram, set()).add(position)
+
+    def _fuzzy_ratio(self, matcher: difflib.SequenceMatcher, position: int, folded: str) -> float:
+        """
+        질의(matcher 의 seq2)와 별칭의 오타 허용 유사도: 별칭 전체, 질의와 길이가 ±1 인 별칭 앞부분, 길이 차이가 2 이하인 단어 중 가장 높은 값.
+        앞부분 / 단어 비교는 PARTIAL_MIN_SCORE 이상일 때만 셉니다. (한 글자만 틀린 짧은 질의 'titn' → 'titan' 앞부분)
+        """
+        alias_folded = self.aliases[position][2]
+        best = 0.0
+        matcher.set_seq1(alias_folded)
+        if matcher.real_quick_ratio() >= FUZZY_MIN_SCORE and matcher.quick_ratio() >= FUZZY_MIN_SCORE:
+            best = matcher.ratio()
+        if len(folded) < 3:
+            return best
+        parts = [alias_folded[:length] for length in range(len(folded) - 1, len(folded) + 2) if length < len(alias_folded)]
+        parts += [token for token in self.alias_tokens[position] if abs(len(token) - len(folded)) <= 2]
+        for part in dict.fromkeys(parts):
+            matcher.set_seq1(part)
+            if matcher.quick_ratio() >= PARTIAL_MIN_SCORE:
+                ratio = matcher.ratio()
+                if ratio >= PARTIAL_MIN_SCORE:
+                    best = max(best, ratio)
+        return best
+
+    def _match(self, position: int, score: float) -> NameMatch:
+        entry, alias, _ = self.aliases[position]
+        kind, key, name = self.entries[entry]
+        return NameMatch(kind=kind, key=key, name=name, alias=alias, score=score)
+
+    def search(self, query: str, kind: str = None, limit: int = 10, fuzzy: bool = True) -> list:
+        """
+        이름 검색. 완전 일치 → 부분 문자열 → (fuzzy=True 면) 오타 허용 순으로 점수를 매겨 돌려줍니다.
+        Args:
+            kind (str): 'item' 또는 'champion' 만 찾기. None 이면 둘 다.
+        Returns:
+            list: NameMatch 목록 (점수 내림차순, 항목마다 가장 좋은 별칭 하나).
+        """
+        folded = fold_name(query)
+        if not folded:
+            return []
+        scores = {}
+        for position in self.exact.get(folded, ()):
+            scores[position] = 1.0
+
+        query_grams = _grams(folded)
+        postings = [self.gram_postings.get(gram, set()) for gram in query_grams]
+        if all(postings):
+            # 부분 문자열 후보: 질의의 2-gram 을 모두 가진 별칭만 실제로 확인 (짧을수록, 앞에서 맞을수록 높은 점수)
+            for position in set.intersection(*sorted(postings, key=len)):
+                alias_folded = self.aliases[position][2]
+                if position not in scores and folded in alias_folded:
+                    prefix_bonus = 0.05 if alias_folded.startswith(folded) else 0.0
+                    scores[position] = 0.9 + prefix_bonus + 0.04 * len(folded) / len(alias_folded)
+        if fuzzy:
+            # 오타 후보: 2-gram 을 많이 공유하는 별칭 FUZZY_CANDIDATES 개만 유사도 계산
+            # (SequenceMatcher 는 두 번째 문자열 쪽 준비를 캐시하므로 질의를 seq2 로 두고, 상한값으로 먼저 거름)
+            shared = Counter(position for posting in postings for position in posting if position not in scores)
+            matcher = difflib.SequenceMatcher(None, '', folded)
+            for position, _ in shared.most_common(FUZZY_CANDIDATES):
+                ratio = self._fuzzy_ratio(matcher, position, folded)
+                if ratio >= FUZZY_MIN_SCORE:
+                    scores[position] = min(ratio, 0.89) # 부분 문자열보다 위로 올라가지 않게
+
+        best_by_entry = {}
+        for position, score in scores.items():
+            entry = self.aliases[position][0]
+            if kind is not None and self.entries[entry][0] != kind:
+                continue
+            if entry not in best_by_entry or score > best_by_entry[entry][1]:
+                best_by_entry[entry] = (position, score)
+        ranked = sorted(best_by_entry.values(), key=lambda position_score: (-position_score[1], position_score[0]))
+        return [self._match(position, score) for position, score in ranked[:limit]]
+
+    def resolve(self, query: str, kind: str = None):
+        """
+        접은 이름(fold_name)이 질의와 완전히 같은 항목 하나. 대소문자, 띄어쓰기, 따옴표 차이와 한글 별칭은 받아들이지만
+        부분 문자열이나 오타는 받아들이지 않습니다 (그런 검색은 search). 맞는 항목이 없거나 둘 이상이면 None.
+        """
+        positions = [position for position in self.exact.get(fold_name(query), ())
+                     if kind is None or self.entries[self.aliases[position][0]][0] == kind]
+        if len({self.aliases[position][0] for position in positions}) != 1:
+            return None
+        return self._match(positions[0], 1.0)
+
+    def resolve_item_ids(self, names) -> dict:
+        """
+        아이템 이름 목록 → {이름: 아이템 ID} (resolve 와 같은 규칙).
+        찾지 못하거나 여러 아이템에 맞는 이름이 하나라도 있으면 ValueError (search 로 찾은 후보를 함께 알려줌).
+        """
+        resolved, unresolved = {}, []
+        for name in names:
+            match = self.resolve(name, kind=ITEM)
+            if match is None:
+                candidates = ', '.join(candidate.name for candidate in self.search(name, kind=ITEM, limit=3))
+                unresolved.append(f"'{name}'" + (f" (후보: {candidates})" if candidates else ''))
+            else:
+                resolved[name] = match.key
+        if unresolved:
+            raise ValueError(f"아이템 이름을 찾을 수 없습니다: {'; '.join(unresolved)}")
+        return resolved
+
+def build_name_index(df_item=None, df_champion_info=None, item_aliases: dict = None, champion_aliases: dict = None) -> NameIndex:
+    """
+    아이템 DataFrame(id, name)과 챔피언 DataFrame(name)으로 이름 색인을 만듭니다.
+    DataFrame 대신 {컬럼 이름: 값 목록} dict 를 넘겨도 됩니다 (load_name_index 가 pandas 없이 읽을 때).
+    Args:
+        item_aliases (dict): 아이템 ID → 별칭 (문자열 또는 목록). 기본값 KOREAN_ITEM_ALIASES.
+        champion_aliases (dict): 별칭 → 정규화된 챔피언 키. 기본값 KOREAN_CHAMPION_ALIASES.
+    """
+    item_aliases = KOREAN_ITEM_ALIASES if item_aliases is None else item_aliases
+    champion_aliases = KOREAN_CHAMPION_ALIASES if champion_aliases is None else champion_aliases
+    name_index = NameIndex()
+
+    if df_item is not None:
+        for item_id, item_name in zip(list(df_item['id']), list(df_item['name'])):
+            extra = item_aliases.get(int(item_id), ())
+            name_index.add(ITEM, int(item_id), str(item_name), [extra] if isinstance(extra, str) else list(extra))
+
+    aliases_of_key = {}
+    for alias, key in champion_aliases.items():
+        aliases_of_key.setdefault(key, []).append(alias)
+    champion_keys = {}
+    if df_champion_info is not None:
+        for champion_name in list(df_champion_info['name']):
+            if isinstance(champion_name, str) and champion_name:
+                champion_keys.setdefault(champion_key(champion_name), []).append(champion_name)
+    for key in aliases_of_key: # CSV 에 없지만 별칭표에만 있는 챔피언 (예: ZAC)
+        champion_keys.setdefault(key, [])
+    for key, spellings in champion_keys.items():
+        name_index.add(CHAMPION, key, key, spellings + aliases_of_key.get(key, []))
+    return name_index
+
+
+def read_csv_columns(file_path: str, columns: list) -> dict:
+    """CSV 에서 몇 개 컬럼만 {컬럼 이름: 문자열 목록} 으로 읽습니다 (빈 칸은 빈 문자열)."""
+    with open(file_path, encoding='utf-8-sig', newline='') as in_file:
+        rows = list(csv.DictReader(in_file))
+    return {column: [row.get(column) or '' for row in rows] for column in columns}
+
+
+def load_name_index(file_path_item_raw: str = 'TFT_Item_CurrentVersion.csv',
+                    file_path_champion_info: str = 'TFT_Champion_CurrentVersion.csv') -> NameIndex:
+    """아이템 / 챔피언 CSV 를 csv 모듈로 읽어서 이름 색인을 만듭니다."""
+    return build_name_index(read_csv_columns(file_path_item_raw, ['id', 'name']),
+                            read_csv_columns(file_path_champion_info, ['name']))
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Name_Search.py "거인의 결의" "titans resolv" 블츠 "dragon claw"
+    name_index = load_name_index()
+    for query in sys.argv[1:] or ['거인의 결의', "Titan's Resolve", 'titan resolv', 'Titn', '거인의결이', '블리츠크랭크', 'blitz', '발톱']:
+        started = time.perf_counter()
+        matches = name_index.search(query, limit=3)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        found = ', '.join(f"{match.kind}:{match.name}({match.key}, {match.score:.2f})" for match in matches) or '없음'
+        print(f"'{query}' → {found}  [{elapsed_ms:.3f}ms]")
@@ -0,0 +1,138 @@
+import json
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from TFT_Champion_Registry import ChampionRegistry, normalize_champion_name
+
+# ----------------------------------------------------------------------------------------------------
+# 챔피언별 픽 수 / 순위 인덱스
+#    - 문제 정의: 'vi projcet.py' 의 "가장 많이 등장한 챔피언" 확인은 질문할 때마다 펼쳐진 테이블 전체에 value_counts() 를 돌리고,
+#                 index.get_loc('VI') 로 순위를 찾습니다. 대시보드는 이것을 여러 챔피언, 여러 패치에 대해 묻습니다.
+#    - 해결 목표: 챔피언 코드(TFT_Champion_Registry)별 픽 수 배열과 순위 배열을 (패치별로도) 미리 계산해 두고,
+#                 새 매치가 추가되면 추가분의 bincount 만 더한 뒤 순위 배열만 다시 계산합니다(챔피언 수만큼, 매치 수와 무관).
+#                 개수/순위 질문은 배열 인덱싱 한 번(O(1))으로 답합니다.
+#    - 순위는 동점이면 같은 순위를 주는 방식입니다 (예: 1, 2, 2, 4).
+# ----------------------------------------------------------------------------------------------------
+
+ALL_PATCHES = '*' # 패치 구분 없는 전체 집계 키
+
+
+@dataclass
+class PickRankIndex:
+    """
+    패치 → 챔피언 코드별 픽 수 / 순위 배열.
+    ALL_PATCHES('*') 키는 항상 전체 합계를 가집니다.
+    """
+    registry: ChampionRegistry
+    counts: dict = field(default_factory=dict)   # 패치 → np.ndarray(int64, 코드별 픽 수)
+    ranks: dict = field(default_factory=dict)    # 패치 → np.ndarray(int64, 코드별 순위, 1부터)
+
+    def _bucket(self, patch) -> np.ndarray:
+        counts = self.counts.get(patch)
+        n_codes = len(self.registry.keys)
+        if counts is None:
+            counts = np.zeros(n_codes, dtype=np.int64)
+        elif len(counts) < n_codes: # 레지스트리에 새 챔피언이 추가된 경우 배열만 늘림
+            counts = np.concatenate([counts, np.zeros(n_codes - len(counts), dtype=np.int64)])
+        self.counts[patch] = counts
+        return counts
+
+    def _refresh_ranks(self, patch) -> None:
+        counts = self.counts[patch]
+        order = np.argsort(-counts, kind='stable')
+        sorted_desc = -counts[order]
+        ranks = np.empty(len(counts), dtype=np.int64)
+        ranks[order] = np.searchsorted(sorted_desc, sorted_desc, side='left') + 1
+        self.ranks[patch] = ranks
+
+    def add_codes(self, codes, patches=None) -> None:
+        """
+        챔피언 코드 배열(등장 1회 = 1개)을 픽 수에 더합니다.
+        patches 를 주면(코드와 같은 길이의 패치 라벨) 패치별 배열에도 더합니다.
+        """
+        codes = np.asarray(codes, dtype=np.int64)
+        valid = codes >= 0
+        touched = {ALL_PATCHES: codes[valid]}
+        if patches is not None:
+            patches = np.asarray(patches, dtype=object)[valid]
+            patch_codes, patch_labels = pd.factorize(patches)
+            for patch_number, patch in enumerate(patch_labels):
+                touched[patch] = codes[valid][patch_codes == patch_number]
+        for patch, patch_codes in touched.items():
+            counts = self._bucket(patch)
+            counts += np.bincount(patch_codes, minlength=len(counts))[:len(counts)]
+            self._refresh_ranks(patch)
+
+    def add(self, champion_names, patches=None) -> None:
+        """챔피언 이름 배열(펼쳐진 테이블의 'champion' 컬럼 등)을 픽 수에 더합니다."""
+        self.add_codes(self.registry.encode(champion_names), patches)
+
+    def add_counts(self, champion_counts: dict, patch=None) -> None:
+        """{챔피언 이름: 픽 수} 형태의 카운터(예: MatchStreamStats.champion_picks)를 더합니다."""
+        names = list(champion_counts.keys())
+        codes = np.repeat(self.registry.encode(names), [champion_counts[name] for name in names])
+        self.add_codes(codes, None if patch is None else [patch] * len(codes))
+
+    def _code(self, champion_name):
+        return self.registry.code_of_key.get(normalize_champion_name(champion_name))
+
+    def count(self, champion_name: str, patch=ALL_PATCHES) -> int:
+        """챔피언의 픽 수 (O(1)). 기록이 없으면 0."""
+        code = self._code(champion_name)
+        counts = self.counts.get(patch)
+        if code is None or counts is None or code >= len(counts):
+            return 0
+        return int(counts[code])
+
+    def rank(self, champion_name: str, patch=ALL_PATCHES):
+        """챔피언의 픽 순위 (O(1), 1위부터). 한 번도 등장하지 않았거나 기록이 없으면 None."""
+        code = self._code(champion_name)
+        counts = self.counts.get(patch)
+        if code is None or counts is None or code >= len(counts) or counts[code] == 0:
+            return None
+        return int(self.ranks[patch][code])
+
+    def top(self, n: int = None, patch=ALL_PATCHES) -> pd.Series:
+        """픽 수 내림차순 Series (index: 챔피언 키, 이름 'count'). 픽 수 0 인 챔피언은 제외합니다."""
+        counts = self.counts.get(patch, np.zeros(0, dtype=np.int64))
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0]
+        if n is not None:
+            order = order[:n]
+        keys = np.asarray(self.registry.keys, dtype=object)
+        return pd.Series(counts[order], index=pd.Index(keys[order], name='champion'), name='count')
+
+    def save(self, file_path: str) -> None:
+        """픽 수를 JSON 으로 저장합니다 (챔피언 키 기준이라 레지스트리 코드가 바뀌어도 다시 불러올 수 있음)."""
+        keys = self.registry.keys
+        payload = {str(patch): {keys[code]: int(count) for code, count in enumerate(counts) if count}
+                   for patch, counts in self.counts.items()}
+        with open(file_path, 'w', encoding='utf-8') as out_file:
+            json.dump(payload, out_file, ensure_ascii=False, indent=2)
+
+
+def build_pick_rank_index(registry: ChampionRegistry, champion_names=None, patches=None) -> PickRankIndex:
+    """레지스트리로 빈 인덱스를 만들고, champion_names 가 있으면 바로 더합니다."""
+    pick_rank_index = PickRankIndex(registry=registry)
+    pick_rank_index._bucket(ALL_PATCHES)
+    pick_rank_index._refresh_ranks(ALL_PATCHES)
+    if champion_names is not None:
+        pick_rank_index.add(champion_names, patches)
+    return pick_rank_index
+
+
+def load_pick_rank_index(file_path: str, registry: ChampionRegistry) -> PickRankIndex:
+    """`PickRankIndex.save` 로 저장한 JSON 을 불러옵니다."""
+    with open(file_path, encoding='utf-8') as in_file:
+        payload = json.load(in_file)
+    pick_rank_index = build_pick_rank_index(registry)
+    for patch, champion_counts in payload.items():
+        if patch == ALL_PATCHES:
+            continue
+        pick_rank_index.add_counts(champion_counts, patch=patch)
+    # 전체 합계는 패치별 기록과 별개로 저장된 값을 그대로 씀 (패치 없이 추가된 픽 포함)
+    pick_rank_index.counts[ALL_PATCHES] = np.zeros(len(registry.keys), dtype=np.int64)
+    pick_rank_index.add_counts(payload.get(ALL_PATCHES, {}))
+    return pick_rank_index
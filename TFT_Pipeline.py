@@ -0,0 +1,192 @@
+import functools
+import glob
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from TFT_Profiling import count_rows
+
+# ----------------------------------------------------------------------------------------------------
+# 이름 붙은 단계(stage)로 이루어진 지연 실행 + 메모이제이션 파이프라인
+#    - 문제 정의: 'vi projcet.py', 'Blitzcrank projcet.py', 'TFT_Item_CurrentVersion.py' 가 모두
+#                 불러오기 → 분류 → 파싱 → 병합 → 요약 → to_csv 를 각자 복사해서 쓰고, 단계마다 .copy() 를 만듭니다.
+#                 방템 목록 하나만 고쳐도, 대상 챔피언만 바꿔도 처음부터 다시 실행해야 합니다.
+#    - 해결 목표: 각 단계를 (이름, 함수, 입력 이름들)로 선언하고, 결과를 요청받았을 때만(lazy) 계산합니다.
+#                 단계의 지문(fingerprint)은 함수 이름 + 함수 코드 지문 + 입력 지문들의 해시이므로, 입력이나 코드가 바뀐 단계와
+#                 그 아래 단계만 다시 계산되고 나머지는 메모된 결과를 그대로 씁니다.
+#                 (예: defensive_items 를 고치면 아이템 분류 이후만 다시 계산되고 매치 파싱은 그대로)
+#    - 입력 종류: 값 파라미터(리스트, 문자열 등 → 값의 해시), 파일 파라미터(경로 + 크기 + 수정 시각).
+#                 persist=True 단계는 cache_dir 에 pickle 로도 저장되어 다음 실행에서도 다시 쓰입니다.
+#    - 코드 지문: 단계 함수가 정의된 모듈의 소스 전체 해시 + PIPELINE_CACHE_VERSION.
+#                 함수나 같은 모듈의 데이터클래스(필드 추가 등)를 고치면 예전 pickle 을 다시 쓰지 않습니다.
+#                 다른 모듈에만 있는 형식(예: MatchArrays 필드)을 바꿨다면 PIPELINE_CACHE_VERSION 을 올립니다.
+# ----------------------------------------------------------------------------------------------------
+
+PIPELINE_CACHE_VERSION = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _module_source_digest(module_name: str) -> str:
+    module = sys.modules.get(module_name)
+    try:
+        return hashlib.sha256(inspect.getsource(module).encode('utf-8')).hexdigest()
+    except (OSError, TypeError): # 소스가 없는 모듈 (내장 모듈, 대화형 실행 등)
+        return ''
+
+
+def fingerprint_code(func) -> str:
+    """
+    단계 함수의 코드 지문: PIPELINE_CACHE_VERSION + 함수가 정의된 모듈 소스 전체의 해시
+    (모듈 소스를 읽을 수 없으면 함수 자신의 소스, 그것도 없으면 이름만). 모듈 해시는 프로세스마다 한 번만 계산합니다.
+    """
+    code_digest = _module_source_digest(getattr(func, '__module__', None) or '')
+    if not code_digest:
+        try:
+            code_digest = hashlib.sha256(inspect.getsource(func).encode('utf-8')).hexdigest()
+        except (OSError, TypeError):
+            code_digest = ''
+    return f'v{PIPELINE_CACHE_VERSION}|{code_digest}'
+
+
+def fingerprint_value(value) -> str:
+    """파라미터 값의 지문 (DataFrame/Series 는 내용 해시, 나머지는 pickle 해시)."""
+    digest = hashlib.sha256()
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(repr(list(value.columns) if isinstance(value, pd.DataFrame) else value.name).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    else:
+        if isinstance(value, (set, frozenset)): # 집합은 실행마다 순서가 달라질 수 있으므로 정렬해서 해시
+            value = sorted(value, key=repr)
+        digest.update(pickle.dumps(value, protocol=4))
+    return digest.hexdigest()
+
+
+def fingerprint_file(file_path: str) -> str:
+    """파일 파라미터의 지문 (경로 + 크기 + 수정 시각, 파일이 없으면 경로만)."""
+    try:
+        stat = os.stat(file_path)
+        stamp = f'{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}'
+    except FileNotFoundError:
+        stamp = f'{os.path.abspath(file_path)}|missing'
+    return hashlib.sha256(stamp.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class Stage:
+    """파이프라인 단계: inputs 이름 순서대로 값을 받아 func 를 호출합니다."""
+    name: str
+    func: object
+    inputs: tuple = ()
+    persist: bool = False # True 면 cache_dir 에 pickle 로 저장
+
+
+@dataclass
+class Pipeline:
+    """
+    파라미터와 단계를 이름으로 등록하고, get(name) 으로 결과를 지연 계산합니다.
+    마지막 get 에서 실제로 계산된 단계 이름은 last_computed 에 남습니다.
+    profiler(TFT_Profiling.Profiler)를 주면 실제로 계산된 단계마다 시간/행 수/메모리를 기록합니다.
+    """
+    cache_dir: str = None
+    profiler: object = None
+    params: dict = field(default_factory=dict)          # 이름 → 값
+    file_params: set = field(default_factory=set)       # 파일 파라미터 이름 (값은 경로)
+    stages: dict = field(default_factory=dict)          # 이름 → Stage
+    memo: dict = field(default_factory=dict)            # 단계 이름 → (지문, 결과)
+    last_computed: list = field(default_factory=list)
+
+    def set_param(self, name: str, value) -> 'Pipeline':
+        """값 파라미터를 등록/변경합니다. 값이 바뀐 경우 이 값을 쓰는 단계만 다음 get 때 다시 계산됩니다."""
+        self.params[name] = value
+        self.file_params.discard(name)
+        return self
+
+    def set_file(self, name: str, file_path: str) -> 'Pipeline':
+        """파일 파라미터를 등록/변경합니다. 파일 내용이 바뀌면(크기/수정 시각) 이 파일을 쓰는 단계만 다시 계산됩니다."""
+        self.params[name] = file_path
+        self.file_params.add(name)
+        return self
+
+    def add_stage(self, name: str, func, inputs=(), persist: bool = False) -> 'Pipeline':
+        """단계를 등록합니다. inputs 는 파라미터 이름 또는 다른 단계 이름입니다."""
+        self.stages[name] = Stage(name=name, func=func, inputs=tuple(inputs), persist=persist)
+        self.memo.pop(name, None)
+        return self
+
+    def stage(self, name: str = None, inputs=(), persist: bool = False):
+        """`add_stage` 데코레이터 버전. 단계 이름을 생략하면 함수 이름을 씁니다."""
+        def register(func):
+            self.add_stage(name or func.__name__, func, inputs, persist)
+            return func
+        return register
+
+    def fingerprint(self, name: str, _visiting: tuple = ()) -> str:
+        """파라미터/단계의 지문. 단계는 함수 이름, 코드 지문(fingerprint_code), 입력 지문들을 합친 해시입니다."""
+        if name in self.params:
+            if name in self.file_params:
+                return fingerprint_file(self.params[name])
+            return fingerprint_value(self.params[name])
+        if name not in self.stages:
+            raise KeyError(f"등록되지 않은 파라미터/단계: '{name}'")
+        if name in _visiting:
+            raise ValueError(f"단계 순환 참조: {' → '.join(_visiting + (name,))}")
+        stage = self.stages[name]
+        digest = hashlib.sha256(f'{name}|{stage.func.__module__}.{stage.func.__qualname__}|{fingerprint_code(stage.func)}'.encode('utf-8'))
+        for input_name in stage.inputs:
+            digest.update(f'|{input_name}={self.fingerprint(input_name, _visiting + (name,))}'.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _persist_path(self, name: str, stage_fingerprint: str) -> str:
+        return os.path.join(self.cache_dir, f'{name}-{stage_fingerprint[:16]}.pkl')
+
+    def _compute(self, name: str):
+        if name in self.params:
+            return self.params[name]
+        stage = self.stages[name]
+        stage_fingerprint = self.fingerprint(name)
+        cached = self.memo.get(name)
+        if cached is not None and cached[0] == stage_fingerprint:
+            return cached[1]
+
+        persist_path = self._persist_path(name, stage_fingerprint) if stage.persist and self.cache_dir else None
+        if persist_path and os.path.exists(persist_path):
+            with open(persist_path, 'rb') as persisted:
+                result = pickle.load(persisted)
+        else:
+            inputs = [self._compute(input_name) for input_name in stage.inputs]
+            if self.profiler is None:
+                result = stage.func(*inputs)
+            else:
+                # 입력 행 수 = 앞 단계 결과들의 행 수 합계 (파라미터는 제외)
+                input_rows = [count_rows(value) for input_name, value in zip(stage.inputs, inputs) if input_name not in self.params]
+                input_rows = [rows for rows in input_rows if rows is not None]
+                with self.profiler.stage(name, rows_in=sum(input_rows) if input_rows else None) as record:
+                    result = stage.func(*inputs)
+                    record.rows_out = count_rows(result)
+            self.last_computed.append(name)
+            if persist_path:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(persist_path + '.tmp', 'wb') as persisted:
+                    pickle.dump(result, persisted, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(persist_path + '.tmp', persist_path)
+                for stale_path in glob.glob(os.path.join(glob.escape(self.cache_dir), f'{glob.escape(name)}-*.pkl')):
+                    if stale_path != persist_path: # 같은 단계의 예전 입력으로 만든 결과는 지움
+                        os.remove(stale_path)
+        self.memo[name] = (stage_fingerprint, result)
+        return result
+
+    def get(self, *names):
+        """단계(또는 파라미터) 결과를 계산해서 반환합니다. 이름을 여러 개 주면 튜플로 반환합니다."""
+        self.last_computed = []
+        results = tuple(self._compute(name) for name in names)
+        return results[0] if len(names) == 1 else results
+
+    def is_stale(self, name: str) -> bool:
+        """다음 get(name) 에서 이 단계를 다시 계산해야 하면 True (메모 기준, 디스크 캐시는 보지 않음)."""
+        cached = self.memo.get(name)
+        return cached is None or cached[0] != self.fingerprint(name)
@@ -0,0 +1,161 @@
+import cProfile
+import json
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from TFT_Match_Parser import DECODE_COUNTERS
+
+try:
+    import resource # Linux / macOS
+except ImportError: # Windows
+    resource = None
+
+# ----------------------------------------------------------------------------------------------------
+# 단계별 실행 시간 / 메모리 측정
+#    - 문제 정의: 'vi projcet.py' 의 실행 시간이 pd.read_csv, json.loads / ast.literal_eval 폴백, apply, pd.merge 중
+#                 어디에 쓰이는지 알 수 없습니다.
+#    - 해결 목표: 단계마다 wall 시간, CPU 시간, 입력/출력 행 수, 단계가 끝난 시점의 프로세스 최대 RSS,
+#                 그리고 TFT_Match_Parser 디코딩 경로별 행 수(특히 느린 ast 폴백 행 수)를 기록해서 JSON 보고서로 씁니다.
+#                 --cprofile 을 주면 전체 실행의 cProfile 결과를 pstats 파일로도 남깁니다.
+#    - 사용법: python TFT_Analysis_Pipeline.py --profile-json profile.json --cprofile profile.pstats
+#              (pstats 파일은 `python -m pstats profile.pstats` 로 열어볼 수 있습니다)
+#    - 프로세스 병렬 처리(TFT_Match_Parallel)의 워커 안에서 일어난 디코딩은 이 프로세스의 카운터에 잡히지 않습니다.
+# ----------------------------------------------------------------------------------------------------
+
+PROFILE_JSON_FLAG = '--profile-json'
+CPROFILE_FLAG = '--cprofile'
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB). 측정할 수 없으면 None."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024 # macOS 는 바이트, Linux 는 KB
+    try:
+        import psutil
+    except ImportError:
+        return None
+    memory_info = psutil.Process().memory_info()
+    return getattr(memory_info, 'peak_wset', memory_info.rss) / (1024 * 1024)
+
+
+def count_rows(value):
+    """단계 입력/출력의 행 수 (DataFrame, Series, 배열, 리스트, MatchArrays 의 보드 수). 셀 수 없으면 None."""
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray, list, tuple)):
+        return len(value)
+    if hasattr(value, 'board_game'): # TFT_Match_Cache.MatchArrays
+        return len(value.board_game)
+    return None
+
+
+@dataclass
+class StageRecord:
+    """단계 하나의 측정 결과."""
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows_in: int = None
+    rows_out: int = None
+    peak_rss_mb: float = None
+    decode_counts: dict = field(default_factory=dict) # 이 단계 동안 늘어난 DECODE_COUNTERS (ast_fallback 등)
+    _started: tuple = field(default=None, repr=False)
+
+
+@dataclass
+class Profiler:
+    """
+    단계 측정 기록 묶음. begin/end 또는 `with profiler.stage(...)` 로 단계를 감쌉니다.
+    json_path / cprofile_path 가 있으면 finish() 에서 파일로 씁니다.
+    """
+    json_path: str = None
+    cprofile_path: str = None
+    records: list = field(default_factory=list)
+    _cprofile: object = field(default=None, repr=False)
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def __post_init__(self):
+        if self.cprofile_path:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def begin(self, name: str, rows_in=None) -> StageRecord:
+        """단계 측정을 시작합니다."""
+        record = StageRecord(name=name, rows_in=rows_in)
+        record._started = (time.perf_counter(), time.process_time(), dict(DECODE_COUNTERS))
+        return record
+
+    def end(self, record: StageRecord, rows_out=None) -> StageRecord:
+        """단계 측정을 끝내고 기록에 추가합니다."""
+        wall_started, cpu_started, decode_started = record._started
+        record.wall_seconds = time.perf_counter() - wall_started
+        record.cpu_seconds = time.process_time() - cpu_started
+        if rows_out is not None:
+            record.rows_out = rows_out
+        record.peak_rss_mb = peak_rss_mb()
+        record.decode_counts = {key: count - decode_started.get(key, 0)
+                                for key, count in DECODE_COUNTERS.items() if count != decode_started.get(key, 0)}
+        record._started = None
+        self.records.append(record)
+        return record
+
+    @contextmanager
+    def stage(self, name: str, rows_in=None):
+        """with 블록 하나를 단계로 측정합니다. 블록 안에서 record.rows_out 을 채울 수 있습니다."""
+        record = self.begin(name, rows_in)
+        try:
+            yield record
+        finally:
+            self.end(record)
+
+    def report(self) -> dict:
+        """JSON 으로 쓸 수 있는 보고서 dict."""
+        stages = [{key: value for key, value in asdict(record).items() if key != '_started'} for record in self.records]
+        return {
+            'total_wall_seconds': time.perf_counter() - self._started,
+            'peak_rss_mb': peak_rss_mb(),
+            'ast_fallback_rows': sum(stage['decode_counts'].get('ast_fallback', 0) for stage in stages),
+            'stages': stages,
+        }
+
+    def finish(self) -> dict:
+        """cProfile 을 멈추고, 경로가 주어진 보고서(JSON / pstats)를 씁니다."""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            pstats.Stats(self._cprofile).dump_stats(self.cprofile_path)
+            self._cprofile = None
+        report = self.report()
+        if self.json_path:
+            with open(self.json_path, 'w', encoding='utf-8') as report_file:
+                json.dump(report, report_file, ensure_ascii=False, indent=2)
+        return report
+
+
+def profiler_from_argv(argv=None) -> Profiler:
+    """
+    명령줄에서 '--profile-json 경로', '--cprofile 경로' 를 찾아 Profiler 를 만듭니다.
+    (스위치가 없으면 파일은 쓰지 않고 측정만 합니다.)
+    """
+    argv = sys.argv[1:] if argv is None else argv
+
+    def value_of(flag):
+        if flag in argv and argv.index(flag) + 1 < len(argv):
+            return argv[argv.index(flag) + 1]
+        return None
+    return Profiler(json_path=value_of(PROFILE_JSON_FLAG), cprofile_path=value_of(CPROFILE_FLAG))
+
+
+def print_report(report: dict) -> None:
+    """보고서를 표로 출력합니다."""
+    print(f"\n--- 단계별 측정 (전체 {report['total_wall_seconds']:.2f}s, ast 폴백 {report['ast_fallback_rows']}행) ---")
+    print(f"{'단계':<24} | {'wall(s)':>8} | {'cpu(s)':>8} | {'입력 행':>10} | {'출력 행':>10} | {'최대 RSS(MB)':>12}")
+    for stage in report['stages']:
+        rss = '' if stage['peak_rss_mb'] is None else f"{stage['peak_rss_mb']:.1f}"
+        rows_in = '' if stage['rows_in'] is None else stage['rows_in']
+        rows_out = '' if stage['rows_out'] is None else stage['rows_out']
+        print(f"{stage['name']:<24} | {stage['wall_seconds']:>8.3f} | {stage['cpu_seconds']:>8.3f} | {rows_in:>10} | {rows_out:>10} | {rss:>12}")
@@ -0,0 +1,177 @@
+import csv
+import math
+import os
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+# ----------------------------------------------------------------------------------------------------
+# 요약 표를 CSV / xlsx 로 흘려 쓰는 리포트 작성기
+#    - 문제 정의: top_items_report 는 요약 줄을 NaN 으로 채운 DataFrame 으로 만들어 pd.concat 으로 표 밑에 붙인 뒤 to_csv 했습니다.
+#                 붙이는 순간 '순위' 가 float(1.0, 2.0 ...), '장착 횟수' 는 숫자와 '(4개)' 가 섞인 object 컬럼이 되고 표 전체가 복사됩니다.
+#                 TFT_Vi_Survival_Analysis.xlsx 는 따로 손으로 만들었습니다.
+#    - 해결 목표: 표(frame)와 요약(summary 행 목록)을 ReportTable 하나에 따로 담고, 작성기가 행을 바로 파일로 흘려 씁니다.
+#                 · 표는 ROW_CHUNK 행씩 컬럼별로 .tolist() 해서 내보내므로 DataFrame 을 복사하거나 dtype 을 바꾸지 않습니다.
+#                 · CSV: 표 → 빈 줄 → 요약 제목 → 요약 머리글/행 (꼬리 블록)
+#                 · xlsx: openpyxl write-only 모드 (행을 임시 파일로 바로 내보냄). 표마다 시트 하나, 요약은 모두 'Summary' 시트에
+#                 여러 챔피언의 표를 제너레이터로 넘기면 한 번에 표 하나만 메모리에 있으므로 통합 문서 크기와 상관없이 메모리가 일정합니다.
+# ----------------------------------------------------------------------------------------------------
+
+ROW_CHUNK = 10000
+SUMMARY_SHEET_NAME = 'Summary'
+MAX_SHEET_NAME_LENGTH = 31 # 엑셀 시트 이름 길이 제한
+_INVALID_SHEET_CHARACTERS = str.maketrans({character: '_' for character in '[]:*?/\\'})
+
+
+@dataclass
+class ReportTable:
+    """
+    리포트 하나: 타입이 그대로인 표(frame) + 요약(summary_title, summary_columns, summary 행 튜플 목록).
+    name 은 xlsx 시트 이름으로 쓰입니다.
+    """
+    name: str
+    frame: pd.DataFrame
+    summary_title: str = ''
+    summary_columns: tuple = ()
+    summary: list = field(default_factory=list)
+
+    def to_text(self) -> str:
+        """화면 출력용 문자열 (표 + 요약)."""
+        lines = [self.frame.to_string(index=False)]
+        if self.summary_title:
+            lines.append(self.summary_title)
+        for row in self.summary:
+            lines.append('  - ' + ', '.join(f"{column}: {_format_value(value)}" for column, value in zip(self.summary_columns, row)))
+        return '\n'.join(lines)
+
+
+def _format_value(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def _python_value(value):
+    # NaN/NaT → None (xlsx 에 NaN 을 쓰면 파일이 깨지고, CSV 에는 빈 칸으로 씀)
+    if value is None or value is pd.NaT or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return value
+
+
+def iter_frame_rows(frame: pd.DataFrame, chunk_rows: int = ROW_CHUNK):
+    """
+    DataFrame 의 행을 파이썬 값 튜플로 내보냅니다. chunk_rows 행씩 컬럼별로 .tolist() 하므로
+    전체 복사본이나 object dtype 변환 없이, 숫자는 int / float 그대로 나옵니다.
+    """
+    columns = [frame[column] for column in frame.columns]
+    has_missing = [bool(series.isna().any()) for series in columns]
+    for start in range(0, len(frame), chunk_rows):
+        values = [series.iloc[start:start + chunk_rows].tolist() for series in columns]
+        values = [[_python_value(value) for value in column] if missing else column
+                  for column, missing in zip(values, has_missing)]
+        yield from zip(*values)
+
+
+class CsvReportWriter:
+    """ReportTable 을 CSV 하나로 씁니다 (표 + 꼬리 요약 블록). 임시 파일에 쓴 뒤 교체합니다."""
+
+    def __init__(self, file_path: str, encoding: str = 'utf-8-sig'):
+        self.file_path = file_path
+        self.encoding = encoding
+
+    def write(self, table: ReportTable) -> str:
+        with open(self.file_path + '.tmp', 'w', encoding=self.encoding, newline='') as out_file:
+            writer = csv.writer(out_file)
+            writer.writerow(table.frame.columns)
+            writer.writerows(iter_frame_rows(table.frame))
+            if table.summary_title or table.summary:
+                writer.writerow([])
+                if table.summary_title:
+                    writer.writerow([table.summary_title])
+                if table.summary_columns:
+                    writer.writerow(table.summary_columns)
+                writer.writerows(table.summary)
+        os.replace(self.file_path + '.tmp', self.file_path)
+        return self.file_path
+
+
+class XlsxReportWriter:
+    """
+    openpyxl write-only 통합 문서에 ReportTable 을 시트 하나씩 흘려 씁니다. 요약은 close() 때 'Summary' 시트로 모읍니다.
+    사용 예:
+        with XlsxReportWriter('reports.xlsx') as writer:
+            for table in tables:       # 제너레이터여도 됨
+                writer.add(table)
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.workbook = Workbook(write_only=True)
+        self.sheet_names = set()
+        self.summaries = [] # (시트 이름, 제목, 머리글, 행 목록) — 요약은 표당 몇 줄뿐이라 모아 둠
+
+    def _sheet_name(self, name: str) -> str:
+        base = (str(name).translate(_INVALID_SHEET_CHARACTERS) or 'Sheet')[:MAX_SHEET_NAME_LENGTH]
+        sheet_name, suffix = base, 1
+        while sheet_name.lower() in self.sheet_names or sheet_name == SUMMARY_SHEET_NAME:
+            suffix += 1
+            sheet_name = f"{base[:MAX_SHEET_NAME_LENGTH - len(str(suffix)) - 1]}_{suffix}"
+        self.sheet_names.add(sheet_name.lower())
+        return sheet_name
+
+    def add(self, table: ReportTable) -> str:
+        """표를 새 시트에 씁니다. Returns: 실제 시트 이름 (중복/금지 문자 처리 후)."""
+        sheet_name = self._sheet_name(table.name)
+        worksheet = self.workbook.create_sheet(sheet_name)
+        worksheet.append(list(table.frame.columns))
+        for row in iter_frame_rows(table.frame):
+            worksheet.append(row)
+        if table.summary_title or table.summary:
+            self.summaries.append((sheet_name, table.summary_title, table.summary_columns, table.summary))
+        return sheet_name
+
+    def close(self) -> str:
+        if self.summaries:
+            worksheet = self.workbook.create_sheet(SUMMARY_SHEET_NAME)
+            for sheet_name, title, columns, rows in self.summaries:
+                worksheet.append([sheet_name, title])
+                if columns:
+                    worksheet.append(['', *columns])
+                for row in rows:
+                    worksheet.append(['', *(_python_value(value) for value in row)])
+                worksheet.append([])
+        if not self.workbook.worksheets: # 빈 통합 문서는 저장할 수 없음
+            self.workbook.create_sheet(SUMMARY_SHEET_NAME)
+        self.workbook.save(self.file_path + '.tmp')
+        os.replace(self.file_path + '.tmp', self.file_path)
+        return self.file_path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+
+def write_report_csv(table: ReportTable, file_path: str) -> str:
+    """ReportTable 하나를 CSV 로 씁니다."""
+    return CsvReportWriter(file_path).write(table)
+
+
+def write_report_xlsx(tables, file_path: str) -> str:
+    """ReportTable 들(리스트 또는 제너레이터)을 시트별로 담은 xlsx 를 씁니다."""
+    with XlsxReportWriter(file_path) as writer:
+        for table in tables:
+            writer.add(table)
+    return file_path
+
+
+def frame_table(name: str, frame: pd.DataFrame, summary_title: str = '', summary: dict = None) -> ReportTable:
+    """DataFrame + {항목: 값} 요약으로 ReportTable 을 만듭니다 (요약 머리글은 ('항목', '값'))."""
+    summary = summary or {}
+    return ReportTable(name=name, frame=frame, summary_title=summary_title,
+                       summary_columns=('항목', '값') if summary else (),
+                       summary=[(label, value.item() if isinstance(value, np.generic) else value) for label, value in summary.items()])
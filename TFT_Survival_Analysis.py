@@ -0,0 +1,198 @@
+import sys
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from TFT_Champion_Registry import normalize_champion_name, normalize_champion_names
+from TFT_Item_Catalog import ITEM_COMPLETED, ITEM_DEFENSIVE, ItemCatalog, load_item_catalog
+from TFT_Match_Cache import MatchArrays, load_match_arrays
+from TFT_Report_Writer import frame_table, write_report_xlsx
+
+# ----------------------------------------------------------------------------------------------------
+# 챔피언 × 방템 개수별 생존 시간(ingameDuration) 분석 엔진
+#    - 문제 정의: 'vi projcet.py' 의 목표는 방어 아이템 착용에 따른 Vi 의 생존 시간 분석이지만,
+#                 스크립트는 final_vi_df_no_items 를 만든 뒤 멈추고, TFT_Vi_Survival_Analysis.xlsx 는 손으로 만들었습니다.
+#    - 해결 목표: 캐시된 컬럼형 배열(TFT_Match_Cache)에서 보드마다 (챔피언, 방템 개수) 그룹을 정하고,
+#                 모든 그룹의 Kaplan–Meier 생존 곡선, 중앙값/분위수를 정렬(lexsort) + 누적합(cumsum) 한 번으로 계산합니다.
+#                 그룹 수(챔피언 수백 × 방템 개수)와 상관없이 파이썬 반복문은 돌지 않습니다.
+#    - 사건/중도절단: 최종 순위(Ranked)가 1등인 보드는 끝까지 살아남았으므로 중도절단(censored),
+#                     나머지(순위가 없는 보드 포함)는 ingameDuration 시점에 탈락한 사건(event)으로 봅니다.
+# ----------------------------------------------------------------------------------------------------
+
+DEFENSIVE_ITEM_BITS = ITEM_COMPLETED | ITEM_DEFENSIVE # 방템 = 방어 속성을 가진 완성 아이템
+MAX_ITEM_COUNT = 3                                     # 셀 아이템 개수 상한 (한 챔피언은 아이템을 최대 3개 장착)
+DEFAULT_QUANTILES = (0.25, 0.5, 0.75)
+
+
+@dataclass
+class SurvivalCurves:
+    """
+    여러 그룹의 Kaplan–Meier 곡선 묶음 (CSR 형태).
+    g번째 그룹의 곡선은 times / at_risk / events / survival 의 [offsets[g]:offsets[g + 1]] 구간입니다.
+    """
+    groups: pd.DataFrame      # 그룹 → (champion, item_count, n, n_events)
+    offsets: np.ndarray       # 그룹별 곡선 시작 위치 (int64, 길이 그룹 수 + 1)
+    times: np.ndarray         # 서로 다른 ingameDuration (그룹 안에서 오름차순)
+    at_risk: np.ndarray       # 그 시점 직전까지 살아있던 보드 수
+    events: np.ndarray        # 그 시점에 탈락한 보드 수
+    survival: np.ndarray      # 그 시점 이후의 생존 확률 S(t)
+
+    def _group_position(self, champion_name: str, item_count: int):
+        matched = np.flatnonzero(
+            (self.groups['champion'].to_numpy() == normalize_champion_name(champion_name))
+            & (self.groups['item_count'].to_numpy() == item_count)
+        )
+        return int(matched[0]) if len(matched) else None
+
+    def curve(self, champion_name: str, item_count: int) -> pd.DataFrame:
+        """한 그룹의 생존 곡선 (time, at_risk, events, survival). 그룹이 없으면 빈 DataFrame."""
+        position = self._group_position(champion_name, item_count)
+        start, end = (0, 0) if position is None else (self.offsets[position], self.offsets[position + 1])
+        return pd.DataFrame({
+            'time': self.times[start:end],
+            'at_risk': self.at_risk[start:end],
+            'events': self.events[start:end],
+            'survival': self.survival[start:end],
+        })
+
+    def quantiles(self, quantiles=DEFAULT_QUANTILES) -> pd.DataFrame:
+        """
+        그룹별 생존 시간 분위수. q 분위수는 S(t) <= 1 - q 가 처음 되는 시간이고,
+        곡선이 거기까지 내려가지 않으면(중도절단이 많으면) NaN 입니다.
+        """
+        n_groups = len(self.groups)
+        curve_group = np.repeat(np.arange(n_groups), np.diff(self.offsets))
+        columns = {}
+        for quantile in quantiles:
+            reached = np.flatnonzero(self.survival <= 1 - quantile + 1e-12)
+            first = np.full(n_groups, -1, dtype=np.int64)
+            first[curve_group[reached][::-1]] = reached[::-1] # 역순으로 대입해서 그룹별 첫 위치만 남김
+            columns[f'q{round(quantile * 100)}'] = np.where(first >= 0, self.times[np.maximum(first, 0)], np.nan)
+        return pd.DataFrame(columns, index=self.groups.index)
+
+    def summary(self, quantiles=DEFAULT_QUANTILES) -> pd.DataFrame:
+        """그룹 정보 + 분위수(q50 = 중앙 생존 시간) 표."""
+        return pd.concat([self.groups, self.quantiles(quantiles)], axis=1)
+
+
+def kaplan_meier(durations, group_codes, events=None) -> tuple:
+    """
+    여러 그룹의 Kaplan–Meier 곡선을 한 번에 계산합니다.
+    Args:
+        durations: 보드별 생존 시간 (NaN 인 보드는 제외).
+        group_codes: 보드별 그룹 번호 (0..G-1, 음수인 보드는 제외).
+        events: 보드별 사건 여부 (True = 탈락, False = 중도절단). None 이면 모두 탈락.
+    Returns:
+        tuple: (그룹 번호 배열, offsets, times, at_risk, events, survival) — 곡선이 있는 그룹만, 그룹 번호 순.
+    """
+    durations = np.asarray(durations, dtype=np.float64)
+    group_codes = np.asarray(group_codes, dtype=np.int64)
+    events = np.ones(len(durations), dtype=bool) if events is None else np.asarray(events, dtype=bool)
+    valid = ~np.isnan(durations) & (group_codes >= 0)
+    durations, group_codes, events = durations[valid], group_codes[valid], events[valid]
+
+    # 그룹 → 시간 순으로 정렬
+    order = np.lexsort((durations, group_codes))
+    durations, group_codes, events = durations[order], group_codes[order], events[order]
+    n_rows = len(durations)
+
+    # 그룹 경계, (그룹, 시간) 경계
+    new_group = np.ones(n_rows, dtype=bool)
+    new_group[1:] = group_codes[1:] != group_codes[:-1]
+    new_time = new_group.copy()
+    new_time[1:] |= durations[1:] != durations[:-1]
+    group_starts = np.flatnonzero(new_group)
+    time_starts = np.flatnonzero(new_time)
+
+    group_sizes = np.diff(np.append(group_starts, n_rows))
+    time_group = np.cumsum(new_group)[time_starts] - 1 # 각 시점이 속한 그룹 (group_starts 기준 순번)
+    at_risk = group_sizes[time_group] - (time_starts - group_starts[time_group])
+    event_counts = np.add.reduceat(events.astype(np.int64), time_starts) if n_rows else np.zeros(0, dtype=np.int64)
+
+    # S(t) = Π(1 - d/n) 을 그룹별 로그 누적합으로 계산 (인자가 0 인 시점은 따로 세서 이후 S = 0)
+    factors = 1.0 - event_counts / at_risk
+    is_zero = factors <= 0
+    log_factors = np.log(np.where(is_zero, 1.0, factors))
+    cumulative_log = np.cumsum(log_factors)
+    cumulative_zero = np.cumsum(is_zero)
+    curve_offsets = np.append(np.flatnonzero(new_group[time_starts]), len(time_starts)).astype(np.int64)
+    group_first = curve_offsets[:-1]
+    base_log = (cumulative_log[group_first] - log_factors[group_first])[time_group]
+    base_zero = (cumulative_zero[group_first] - is_zero[group_first])[time_group]
+    survival = np.where(cumulative_zero - base_zero > 0, 0.0, np.exp(cumulative_log - base_log))
+
+    return group_codes[group_starts], curve_offsets, durations[time_starts], at_risk, event_counts, survival
+
+
+def board_item_counts(match_arrays: MatchArrays, item_catalog: ItemCatalog, required_bits: int = DEFENSIVE_ITEM_BITS) -> np.ndarray:
+    """보드별로 required_bits 속성을 모두 가진 아이템 개수 (CSR 누적합 차이, int64)."""
+    is_matching = item_catalog.mask(np.asarray(match_arrays.item_ids), required_bits)
+    cumulative = np.concatenate([[0], np.cumsum(is_matching, dtype=np.int64)])
+    return np.diff(cumulative[np.asarray(match_arrays.item_offsets)])
+
+
+def champion_item_survival(match_arrays: MatchArrays, item_catalog: ItemCatalog, champions=None,
+                           required_bits: int = DEFENSIVE_ITEM_BITS, max_item_count: int = MAX_ITEM_COUNT) -> SurvivalCurves:
+    """
+    (챔피언, 아이템 개수) 그룹마다 ingameDuration 생존 곡선을 한 번의 배치 호출로 계산합니다.
+    Args:
+        match_arrays (MatchArrays): 캐시에서 불러온 매치 배열.
+        item_catalog (ItemCatalog): 아이템 속성 카탈로그.
+        champions: 분석할 챔피언 목록. None 이면 모든 챔피언.
+        required_bits (int): 개수를 셀 아이템 속성 (기본: 방어 속성의 완성 아이템).
+        max_item_count (int): 이 개수 이상은 한 그룹으로 묶습니다.
+    Returns:
+        SurvivalCurves: 그룹별 곡선과 그룹 정보(champion, item_count, n, n_events).
+    """
+    champion_keys = normalize_champion_names(np.asarray(match_arrays.champion_names, dtype=object))
+    key_codes, key_uniques = pd.factorize(pd.Series(champion_keys, dtype=object))
+    board_key = key_codes[np.asarray(match_arrays.board_champion)]
+    if champions is not None:
+        wanted = np.isin(np.asarray(key_uniques, dtype=object), [normalize_champion_name(name) for name in champions])
+        board_key = np.where(wanted[board_key], board_key, -1)
+
+    item_counts = np.minimum(board_item_counts(match_arrays, item_catalog, required_bits), max_item_count)
+    n_item_levels = max_item_count + 1
+    board_group = np.where(board_key >= 0, board_key * n_item_levels + item_counts, -1)
+
+    board_game = np.asarray(match_arrays.board_game)
+    board_events = np.asarray(match_arrays.placements)[board_game] != 1
+    group_codes, offsets, times, at_risk, events, survival = kaplan_meier(
+        np.asarray(match_arrays.durations)[board_game], board_group, board_events,
+    )
+
+    curve_sizes = np.diff(offsets)
+    n_boards = at_risk[offsets[:-1]] if len(group_codes) else np.zeros(0, dtype=np.int64)
+    groups = pd.DataFrame({
+        'champion': np.asarray(key_uniques, dtype=object)[group_codes // n_item_levels],
+        'item_count': group_codes % n_item_levels,
+        'n': n_boards,
+        'n_events': np.add.reduceat(events, offsets[:-1]) if len(curve_sizes) else np.zeros(0, dtype=np.int64),
+    })
+    return SurvivalCurves(groups=groups, offsets=offsets, times=times, at_risk=at_risk, events=events, survival=survival)
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Survival_Analysis.py TFT_Challenger_MatchData.csv VI --xlsx TFT_Vi_Survival_Analysis.xlsx
+    args = sys.argv[1:]
+    xlsx_path = args[args.index('--xlsx') + 1] if '--xlsx' in args else None
+    positional = [arg for arg in args if not arg.startswith('--') and arg != xlsx_path]
+    file_path_match = positional[0] if positional else 'TFT_Challenger_MatchData.csv'
+    target_champion_name = normalize_champion_name(positional[1] if len(positional) > 1 else 'VI')
+
+    curves = champion_item_survival(load_match_arrays(file_path_match), load_item_catalog())
+    summary = curves.summary()
+    print(f"✅ 생존 곡선 {len(summary)}개 계산 완료 (챔피언 × 방템 개수 0~{MAX_ITEM_COUNT}+)")
+    print(f"\n--- {target_champion_name} 방템 개수별 생존 시간(ingameDuration) ---")
+    print(summary[summary['champion'] == target_champion_name].to_string(index=False))
+
+    if xlsx_path:
+        # 대상 챔피언 시트 + 전체 그룹 시트 (행을 바로 흘려 쓰므로 그룹 수가 많아도 DataFrame 을 복사하지 않음)
+        target_summary = summary[summary['champion'] == target_champion_name]
+        write_report_xlsx([
+            frame_table(f"{target_champion_name}_Survival", target_summary, f"{target_champion_name} 방템 개수별 생존 시간",
+                        {'보드 수': int(target_summary['n'].sum()), '탈락(사건) 수': int(target_summary['n_events'].sum())}),
+            frame_table('All_Groups', summary),
+        ], xlsx_path)
+        print(f"\n✅ 생존 분석 표를 '{xlsx_path}' 에 썼습니다.")
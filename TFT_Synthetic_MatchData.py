@@ -0,0 +1,95 @@
+import csv
+import json
+import random
+import sys
+
+import pandas as pd
+
+# ----------------------------------------------------------------------------------------------------
+# TFT_Challenger_MatchData.csv 와 같은 형태의 가상 매치 데이터 생성기
+#    - 문제 정의: 저장소에는 작은 샘플 CSV 뿐이라 10만, 100만, 1000만 행에서 어떻게 느려지는지 잴 수 없습니다.
+#    - 해결 목표: 챔피언/아이템 CSV 의 실제 이름과 ID 로 매치 행을 만들어 CSV 로 씁니다.
+#                 'champion' 문자열은 실제 덤프처럼 JSON 과 파이썬 리터럴(repr)이 섞이고, NaN / '{}' / 깨진 문자열도 들어갑니다.
+#                 행을 블록 단위로 만들어 바로 쓰므로 1000만 행도 메모리 사용량이 일정합니다.
+#    - 같은 seed 면 항상 같은 파일이 나옵니다. (gameId 는 행마다 고유, Ranked 는 1~8 반복)
+# ----------------------------------------------------------------------------------------------------
+
+MATCH_COLUMNS = ['gameId', 'gameDuration', 'level', 'lastRound', 'Ranked', 'ingameDuration', 'combination', 'champion']
+WRITE_BLOCK_ROWS = 20000
+
+# 특수한 'champion' 값의 비율 (행 번호 기준으로 섞음)
+NAN_EVERY = 101      # 약 1% NaN
+EMPTY_EVERY = 103    # 약 1% '{}'
+BROKEN_EVERY = 997   # 약 0.1% 깨진 문자열 (ast 폴백 → 실패 경로)
+JSON_EVERY = 3       # 1/3 은 JSON, 나머지는 파이썬 리터럴
+
+
+def load_synthetic_sources(file_path_champion_info: str = 'TFT_Champion_CurrentVersion.csv',
+                           file_path_item: str = 'TFT_Item_CurrentVersion.csv') -> tuple:
+    """가상 데이터에 쓸 (챔피언 이름 목록, 아이템 ID 목록)을 실제 CSV 에서 가져옵니다."""
+    champion_names = [name.capitalize() for name in pd.read_csv(file_path_champion_info)['name'].astype(str)]
+    item_ids = pd.read_csv(file_path_item)['id'].astype(int).tolist()
+    return champion_names, item_ids
+
+
+def synthetic_champion_string(rng: random.Random, row_number: int, champion_names: list, item_ids: list):
+    """한 행의 'champion' 값 (JSON / 파이썬 리터럴 문자열, NaN, '{}', 깨진 문자열 중 하나)."""
+    if row_number % NAN_EVERY == 0:
+        return float('nan')
+    if row_number % EMPTY_EVERY == 0:
+        return '{}'
+    if row_number % BROKEN_EVERY == 0:
+        return "{'Vi': {'items': [1"
+    board = {
+        champion_name: {'items': rng.sample(item_ids, rng.randint(0, 3)), 'star': rng.randint(1, 3)}
+        for champion_name in rng.sample(champion_names, rng.randint(5, 9))
+    }
+    return json.dumps(board) if row_number % JSON_EVERY == 0 else repr(board)
+
+
+def iter_synthetic_rows(n_rows: int, champion_names: list, item_ids: list, seed: int = 42):
+    """MATCH_COLUMNS 순서의 행 리스트를 n_rows 개 만듭니다."""
+    rng = random.Random(seed)
+    for row_number in range(n_rows):
+        placement = row_number % 8 + 1
+        # 순위가 낮을수록 일찍 탈락하도록 ingameDuration 을 만듦 (생존 분석이 의미 있는 분포가 되도록)
+        ingame_duration = 900 + (8 - placement) * 150 + rng.random() * 600
+        yield [
+            f'KR_{4000000000 + row_number}',
+            round(ingame_duration + rng.random() * 300, 3),
+            rng.randint(5, 9),
+            rng.randint(15, 40),
+            placement,
+            round(ingame_duration, 3),
+            '{}',
+            synthetic_champion_string(rng, row_number, champion_names, item_ids),
+        ]
+
+
+def write_synthetic_match_csv(file_path: str, n_rows: int, seed: int = 42, champion_names: list = None, item_ids: list = None) -> str:
+    """
+    가상 매치 데이터를 CSV 로 씁니다 (WRITE_BLOCK_ROWS 행씩 나눠서 쓰므로 메모리 사용량 일정).
+    Returns:
+        str: 쓴 파일 경로.
+    """
+    if champion_names is None or item_ids is None:
+        champion_names, item_ids = load_synthetic_sources()
+    with open(file_path, 'w', encoding='utf-8', newline='') as out_file:
+        writer = csv.writer(out_file)
+        writer.writerow(MATCH_COLUMNS)
+        block = []
+        for row in iter_synthetic_rows(n_rows, champion_names, item_ids, seed=seed):
+            block.append(['' if value != value else value for value in row]) # NaN → 빈 칸 (pandas 가 NaN 으로 읽음)
+            if len(block) >= WRITE_BLOCK_ROWS:
+                writer.writerows(block)
+                block = []
+        writer.writerows(block)
+    return file_path
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Synthetic_MatchData.py 1000000 synthetic_1000000.csv
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    output_path = sys.argv[2] if len(sys.argv) > 2 else f'synthetic_{n_rows}.csv'
+    write_synthetic_match_csv(output_path, n_rows)
+    print(f"✅ 가상 매치 데이터 {n_rows}행 → '{output_path}'")
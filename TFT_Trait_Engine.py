@@ -0,0 +1,272 @@
+import ast
+import sys
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from TFT_Champion_Registry import normalize_champion_name, normalize_champion_names
+from TFT_Match_Cache import MatchArrays, load_match_arrays
+from TFT_Survival_Analysis import SurvivalCurves, kaplan_meier
+
+# ----------------------------------------------------------------------------------------------------
+# 특성(시너지) 비트마스크 엔진
+#    - 문제 정의: TFT_Champion_CurrentVersion.csv 의 'class' 는 "['Mercenary', 'Demolitionist']" 같은 파이썬 리스트 문자열,
+#                 'origin' 은 문자열 하나입니다. 'vi projcet.py' 는 이 컬럼을 Vi 의 모든 행에 병합만 하고 쓰지 않습니다.
+#    - 해결 목표: 두 컬럼을 한 번만 파싱해서 특성마다 비트 번호를 주고, 챔피언마다 특성 비트마스크(uint64)를 만듭니다.
+#                 매치 보드(게임 하나의 챔피언들)마다 특성별 서로 다른 챔피언 수를 비트 연산 + np.bincount 로 세고
+#                 (특성 수만큼만 반복, 보드 수와 무관), 단계(breakpoint)를 넘은 특성을 게임별 활성 비트마스크로 만듭니다.
+#                 활성 특성별 순위/생존 시간 통계, 보드 필터(특정 시너지가 켜진 게임의 챔피언 보드)를 문자열 반복 없이 구합니다.
+# ----------------------------------------------------------------------------------------------------
+
+# 특성별 활성 단계 (챔피언 수). 표에 없는 특성은 DEFAULT_BREAKPOINTS.
+TRAIT_BREAKPOINTS = {
+    'Celestial': (2, 4, 6), 'Chrono': (2, 4, 6, 8), 'Cybernetic': (3, 6), 'Dark Star': (2, 4, 6, 8),
+    'Mech-Pilot': (3,), 'Rebel': (3, 6, 9), 'Space Pirate': (2, 4), 'Star Guardian': (3, 6, 9),
+    'Valkyrie': (2,), 'Void': (3,),
+    'Blademaster': (3, 6, 9), 'Blaster': (2, 4), 'Brawler': (2, 4), 'Demolitionist': (2,), 'Infiltrator': (2, 4, 6),
+    'Mana-Reaver': (2, 4), 'Mercenary': (1,), 'Mystic': (2, 4), 'Protector': (2, 4, 6), 'Sniper': (2, 4),
+    'Sorcerer': (2, 4, 6), 'Starship': (1,), 'Vanguard': (2, 4, 6),
+}
+DEFAULT_BREAKPOINTS = (2,)
+# 챔피언 CSV 의 오타 → 정식 특성 이름
+TRAIT_ALIASES = {'Infiltrato': 'Infiltrator'}
+MAX_TRAITS = 64 # uint64 비트마스크
+
+
+def parse_trait_list(value) -> list:
+    """
+    'origin' / 'class' 값 하나 → 특성 이름 목록.
+    "['Mercenary', 'Demolitionist']" 같은 리스트 문자열, 'Space Pirate' 같은 문자열, 리스트, NaN 을 모두 받습니다.
+    """
+    if isinstance(value, (list, tuple)):
+        names = value
+    elif not isinstance(value, str):
+        names = []
+    elif value.strip().startswith('['):
+        try:
+            names = ast.literal_eval(value.strip())
+        except (ValueError, SyntaxError):
+            names = value.strip('[] ').split(',')
+    else:
+        names = [value]
+    names = [str(name).strip().strip('\'"') for name in names]
+    return [TRAIT_ALIASES.get(name, name) for name in names if name]
+
+
+@dataclass
+class TraitTable:
+    """특성 이름 ↔ 비트 번호, 정규화된 챔피언 키 → 특성 비트마스크."""
+    trait_names: list                # 비트 번호 → 특성 이름
+    breakpoints: list                # 비트 번호 → 활성 단계 튜플
+    champion_masks: dict             # 정규화된 챔피언 키 → 특성 비트마스크 (int)
+    bit_of_trait: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.bit_of_trait:
+            self.bit_of_trait = {name: bit for bit, name in enumerate(self.trait_names)}
+
+    def mask_of(self, trait_names) -> int:
+        """특성 이름들 → 비트마스크 (모르는 특성은 KeyError)."""
+        if isinstance(trait_names, str):
+            trait_names = [trait_names]
+        mask = 0
+        for name in trait_names:
+            mask |= 1 << self.bit_of_trait[TRAIT_ALIASES.get(name, name)]
+        return mask
+
+    def names_of(self, mask: int) -> list:
+        """비트마스크 → 특성 이름 목록 (비트 번호 순)."""
+        mask = int(mask)
+        return [name for bit, name in enumerate(self.trait_names) if mask >> bit & 1]
+
+    def champion_mask(self, champion_name: str) -> int:
+        """챔피언 하나의 특성 비트마스크 (모르는 챔피언은 0)."""
+        return self.champion_masks.get(normalize_champion_name(champion_name), 0)
+
+    def masks_for(self, champion_names) -> np.ndarray:
+        """챔피언 이름 배열 → 특성 비트마스크 배열 (uint64). 이름은 정규화해서 찾습니다."""
+        keys = normalize_champion_names(champion_names)
+        return np.array([self.champion_masks.get(key, 0) for key in keys], dtype=np.uint64)
+
+
+def build_trait_table(df_champion_info: pd.DataFrame, breakpoints: dict = None) -> TraitTable:
+    """
+    챔피언 DataFrame 의 'origin', 'class' 를 파싱해서 TraitTable 을 만듭니다.
+    특성 비트 번호는 계열(origin) 먼저, 그다음 직업(class), 각각 이름순입니다.
+    """
+    breakpoints = TRAIT_BREAKPOINTS if breakpoints is None else breakpoints
+    origins = [parse_trait_list(value) for value in df_champion_info.get('origin', pd.Series(dtype=object))]
+    classes = [parse_trait_list(value) for value in df_champion_info.get('class', pd.Series(dtype=object))]
+    origin_names = sorted({name for names in origins for name in names})
+    class_names = sorted({name for names in classes for name in names} - set(origin_names))
+    trait_names = origin_names + class_names
+    if len(trait_names) > MAX_TRAITS:
+        raise ValueError(f"특성이 {len(trait_names)}개라 {MAX_TRAITS}비트 마스크에 담을 수 없습니다.")
+
+    bit_of_trait = {name: bit for bit, name in enumerate(trait_names)}
+    champion_masks = {}
+    for champion_name, origin_list, class_list in zip(df_champion_info['name'], origins, classes):
+        mask = 0
+        for name in origin_list + class_list:
+            mask |= 1 << bit_of_trait[name]
+        key = normalize_champion_name(champion_name)
+        champion_masks[key] = champion_masks.get(key, 0) | mask
+    return TraitTable(
+        trait_names=trait_names,
+        breakpoints=[tuple(breakpoints.get(name, DEFAULT_BREAKPOINTS)) for name in trait_names],
+        champion_masks=champion_masks, bit_of_trait=bit_of_trait,
+    )
+
+
+def load_trait_table(file_path_champion_info: str = 'TFT_Champion_CurrentVersion.csv') -> TraitTable:
+    """챔피언 정보 CSV 를 읽어서 TraitTable 을 만듭니다."""
+    return build_trait_table(pd.read_csv(file_path_champion_info))
+
+
+@dataclass
+class BoardTraits:
+    """
+    게임(보드)별 특성 집계. counts / levels 는 (게임 수, 특성 수) 배열입니다.
+    levels[g, t] = 특성 t 가 넘은 단계 수 (0 = 비활성, 1 = 첫 단계 ...).
+    """
+    trait_table: TraitTable
+    counts: np.ndarray       # 특성별 서로 다른 챔피언 수 (uint8)
+    levels: np.ndarray       # 활성 단계 (int8)
+    active_mask: np.ndarray  # 활성 특성 비트마스크 (uint64, 게임 수)
+    board_game: np.ndarray   # 보드 → 게임 위치 (MatchArrays.board_game 그대로)
+
+    def _bit(self, trait_name: str) -> int:
+        return self.trait_table.bit_of_trait[TRAIT_ALIASES.get(trait_name, trait_name)]
+
+    def games_with(self, trait_name: str, min_level: int = 1) -> np.ndarray:
+        """특성이 min_level 단계 이상 활성인 게임 (bool, 게임 수)."""
+        return self.levels[:, self._bit(trait_name)] >= min_level
+
+    def games_with_all(self, trait_names) -> np.ndarray:
+        """특성들이 모두 (첫 단계 이상) 활성인 게임 (bool). 비트마스크 AND 한 번으로 판별합니다."""
+        wanted = np.uint64(self.trait_table.mask_of(trait_names))
+        return (self.active_mask & wanted) == wanted
+
+    def boards_with(self, trait_name: str, min_level: int = 1) -> np.ndarray:
+        """특성이 활성인 게임에 속한 챔피언 보드 (bool, 보드 수). 아이템 집계를 시너지별로 나눌 때 씁니다."""
+        return self.games_with(trait_name, min_level)[self.board_game]
+
+    def active_trait_names(self, game_position: int) -> list:
+        """게임 하나의 활성 특성 이름 목록."""
+        return self.trait_table.names_of(self.active_mask[game_position])
+
+
+def compute_board_traits(match_arrays: MatchArrays, trait_table: TraitTable) -> BoardTraits:
+    """
+    모든 게임의 특성별 챔피언 수와 활성 단계를 계산합니다.
+    같은 게임에 같은 챔피언이 두 번 있으면 한 번만 셉니다 (TFT 규칙). 특성 정보가 없는 챔피언은 세지 않습니다.
+    """
+    n_games = len(match_arrays.game_ids)
+    n_traits = len(trait_table.trait_names)
+    board_game = np.asarray(match_arrays.board_game)
+
+    # 챔피언 코드 → 정규화된 키 번호 / 특성 마스크 (코드 수만큼만 정규화)
+    champion_keys = normalize_champion_names(np.asarray(match_arrays.champion_names, dtype=object))
+    key_codes, key_uniques = pd.factorize(pd.Series(champion_keys, dtype=object))
+    key_masks = np.array([trait_table.champion_masks.get(key, 0) for key in key_uniques], dtype=np.uint64)
+    board_key = key_codes[np.asarray(match_arrays.board_champion)].astype(np.int64)
+
+    # (게임, 챔피언 키) 중복 제거: 정렬 후 이웃 비교. 특성이 없는 챔피언(마스크 0)도 여기서 뺌
+    order = np.lexsort((board_key, board_game))
+    sorted_games, sorted_keys = board_game[order], board_key[order]
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = (sorted_games[1:] != sorted_games[:-1]) | (sorted_keys[1:] != sorted_keys[:-1])
+    unique_games = sorted_games[keep]
+    unique_masks = key_masks[sorted_keys[keep]] if len(key_masks) else np.zeros(0, dtype=np.uint64)
+    unique_games, unique_masks = unique_games[unique_masks != 0], unique_masks[unique_masks != 0]
+
+    counts = np.zeros((n_games, n_traits), dtype=np.uint8)
+    levels = np.zeros((n_games, n_traits), dtype=np.int8)
+    active_mask = np.zeros(n_games, dtype=np.uint64)
+    for bit in range(n_traits):
+        has_trait = (unique_masks >> np.uint64(bit)) & np.uint64(1)
+        trait_counts = np.bincount(unique_games, weights=has_trait, minlength=n_games)
+        counts[:, bit] = np.minimum(trait_counts, 255)
+        levels[:, bit] = np.searchsorted(np.asarray(trait_table.breakpoints[bit]), trait_counts, side='right')
+        active_mask |= (levels[:, bit] > 0).astype(np.uint64) << np.uint64(bit)
+    return BoardTraits(trait_table=trait_table, counts=counts, levels=levels, active_mask=active_mask, board_game=board_game)
+
+
+def trait_summary(match_arrays: MatchArrays, board_traits: BoardTraits) -> pd.DataFrame:
+    """
+    (특성, 활성 단계) 별 게임 수, 평균 순위, TOP4 비율, 평균 게임 시간. 비활성(단계 0)은 빠집니다.
+    bincount 로 모든 특성·단계를 한 번에 집계합니다.
+    """
+    levels = board_traits.levels
+    n_levels = int(levels.max()) + 1 if levels.size else 1
+    game_rows, trait_bits = np.nonzero(levels > 0)
+    group = trait_bits * n_levels + levels[game_rows, trait_bits]
+    placements = np.asarray(match_arrays.placements)[game_rows].astype(np.float64)
+    durations = np.asarray(match_arrays.durations)[game_rows]
+    ranked = placements > 0
+    has_duration = ~np.isnan(durations)
+
+    n_groups = len(board_traits.trait_table.trait_names) * n_levels
+    games = np.bincount(group, minlength=n_groups)
+    ranked_games = np.bincount(group, weights=ranked, minlength=n_groups)
+    placement_sum = np.bincount(group, weights=np.where(ranked, placements, 0), minlength=n_groups)
+    top4 = np.bincount(group, weights=ranked & (placements <= 4), minlength=n_groups)
+    duration_games = np.bincount(group, weights=has_duration, minlength=n_groups)
+    duration_sum = np.bincount(group, weights=np.where(has_duration, durations, 0), minlength=n_groups)
+
+    present = np.flatnonzero(games)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return pd.DataFrame({
+            'trait': np.asarray(board_traits.trait_table.trait_names, dtype=object)[present // n_levels],
+            'level': present % n_levels,
+            'min_champions': [board_traits.trait_table.breakpoints[position // n_levels][position % n_levels - 1] for position in present],
+            'games': games[present],
+            'avg_placement': placement_sum[present] / ranked_games[present],
+            'top4_rate': top4[present] / ranked_games[present],
+            'avg_duration': duration_sum[present] / duration_games[present],
+        })
+
+
+def trait_survival(match_arrays: MatchArrays, board_traits: BoardTraits, traits=None) -> SurvivalCurves:
+    """
+    (특성, 활성 단계) 그룹별 ingameDuration 생존 곡선 (단계 0 = 그 특성이 꺼진 게임도 포함).
+    게임 하나는 특성마다 한 번씩 들어가므로 (게임, 특성) 쌍을 한 번의 kaplan_meier 호출로 계산합니다.
+    """
+    trait_names = board_traits.trait_table.trait_names if traits is None else list(traits)
+    bits = np.array([board_traits._bit(name) for name in trait_names], dtype=np.int64)
+    n_games = len(board_traits.levels)
+    n_levels = int(board_traits.levels.max()) + 1 if board_traits.levels.size else 1
+
+    game_rows = np.tile(np.arange(n_games), len(bits))
+    trait_positions = np.repeat(np.arange(len(bits)), n_games)
+    group = trait_positions * n_levels + board_traits.levels[game_rows, bits[trait_positions]]
+    events = np.asarray(match_arrays.placements)[game_rows] != 1
+    group_codes, offsets, times, at_risk, events_out, survival = kaplan_meier(
+        np.asarray(match_arrays.durations)[game_rows], group, events,
+    )
+    groups = pd.DataFrame({
+        'trait': np.asarray(trait_names, dtype=object)[group_codes // n_levels],
+        'level': group_codes % n_levels,
+        'n': at_risk[offsets[:-1]] if len(group_codes) else np.zeros(0, dtype=np.int64),
+        'n_events': np.add.reduceat(events_out, offsets[:-1]) if len(group_codes) else np.zeros(0, dtype=np.int64),
+    })
+    return SurvivalCurves(groups=groups, offsets=offsets, times=times, at_risk=at_risk, events=events_out, survival=survival)
+
+
+if __name__ == '__main__':
+    # 실행 예: python TFT_Trait_Engine.py TFT_Challenger_MatchData.csv "Dark Star"
+    file_path_match = sys.argv[1] if len(sys.argv) > 1 else 'TFT_Challenger_MatchData.csv'
+    target_trait = sys.argv[2] if len(sys.argv) > 2 else 'Dark Star'
+
+    trait_table = load_trait_table()
+    match_arrays = load_match_arrays(file_path_match)
+    board_traits = compute_board_traits(match_arrays, trait_table)
+    print(f"✅ 특성 {len(trait_table.trait_names)}개, 게임 {len(board_traits.active_mask)}개의 활성 특성 계산 완료")
+    print(f"    - 첫 게임의 활성 특성: {', '.join(board_traits.active_trait_names(0)) or '없음'}")
+
+    print("\n--- 특성·단계별 순위 통계 (게임 수 내림차순) ---")
+    print(trait_summary(match_arrays, board_traits).sort_values('games', ascending=False).to_string(index=False))
+
+    print(f"\n--- '{target_trait}' 활성 단계별 생존 시간 (q50 = 중앙값) ---")
+    print(trait_survival(match_arrays, board_traits, [target_trait]).summary().to_string(index=False))